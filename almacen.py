@@ -0,0 +1,400 @@
+"""
+Almacén persistente de resultados de selección (SQLite, sólo se añade).
+
+Cada fila de `resultados` guarda las entradas (ω_n, m, A0), el resorte y el
+aceite elegidos (fila y nombre), k, c, ζ, ω_d y, opcionalmente, la respuesta
+x(t) submuestreada a MAX_MUESTRAS puntos en float32. Los parámetros de la
+selección (versión de los catálogos, alpha, ζ objetivo, restricciones) se
+repiten en muchas filas: van una sola vez en `parametros` y cada resultado
+apunta a su fila.
+
+  - Las escrituras se acumulan en memoria y se vuelcan por lotes (un
+    executemany en una transacción cada tam_lote filas, o al llamar a
+    vaciar() / cerrar()).
+  - Índices sobre (wn, m, A0), para buscar resultados previos y filtrar por
+    rango de ω_n, y sobre m, resorte, aceite y creado, uno por cada filtro
+    de consultar(), para no recorrer la tabla. Cada índice encarece las
+    inserciones, así que no hay otros.
+  - Unos disparadores impiden UPDATE y DELETE: el historial es auditable.
+
+seleccionar() reutiliza los puntos ya guardados con la misma versión de
+catálogos y los mismos parámetros, y sólo calcula (y guarda) los que faltan.
+"""
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+import catalogo
+import memo
+import seleccion
+from restricciones import Limites
+from seleccion import ALPHA, ZETA_OBJ, ArrayLike, ResultadoSeleccion
+
+ARCHIVO_RESULTADOS = "resultados_resoil.db"
+MAX_MUESTRAS = 256
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS parametros (
+    id INTEGER PRIMARY KEY,
+    version TEXT NOT NULL,
+    alpha REAL NOT NULL,
+    zeta_obj REAL NOT NULL,
+    limites TEXT NOT NULL,
+    UNIQUE (version, alpha, zeta_obj, limites)
+);
+CREATE TABLE IF NOT EXISTS resultados (
+    id INTEGER PRIMARY KEY,
+    creado REAL NOT NULL,
+    parametros INTEGER NOT NULL REFERENCES parametros (id),
+    wn REAL NOT NULL,
+    m REAL NOT NULL,
+    A0 REAL,
+    i_resorte INTEGER NOT NULL,
+    i_aceite INTEGER NOT NULL,
+    resorte TEXT,
+    aceite TEXT,
+    k REAL,
+    c REAL,
+    zeta REAL,
+    w_d REAL,
+    dt REAL,
+    respuesta BLOB
+);
+CREATE INDEX IF NOT EXISTS ix_entradas ON resultados (wn, m, A0);
+CREATE INDEX IF NOT EXISTS ix_m ON resultados (m);
+CREATE INDEX IF NOT EXISTS ix_resorte ON resultados (resorte);
+CREATE INDEX IF NOT EXISTS ix_aceite ON resultados (aceite);
+CREATE INDEX IF NOT EXISTS ix_creado ON resultados (creado);
+CREATE TRIGGER IF NOT EXISTS solo_agregar_update BEFORE UPDATE ON resultados
+BEGIN SELECT RAISE(ABORT, 'El almacén de resultados sólo admite inserciones.'); END;
+CREATE TRIGGER IF NOT EXISTS solo_agregar_delete BEFORE DELETE ON resultados
+BEGIN SELECT RAISE(ABORT, 'El almacén de resultados sólo admite inserciones.'); END;
+"""
+
+_COLUMNAS = (
+    "creado", "parametros", "wn", "m", "A0",
+    "i_resorte", "i_aceite", "resorte", "aceite", "k", "c", "zeta", "w_d", "dt", "respuesta",
+)
+_INSERTAR = f"INSERT INTO resultados ({', '.join(_COLUMNAS)}) VALUES ({', '.join('?' * len(_COLUMNAS))})"
+
+# Columnas devueltas por consultar() (respuesta aparte: puede pesar mucho)
+_DE_PARAMETROS = ("alpha", "zeta_obj", "version", "limites")
+_NUMERICAS = ("id", "creado", "alpha", "zeta_obj", "wn", "m", "A0", "k", "c", "zeta", "w_d")
+_ENTERAS = ("i_resorte", "i_aceite")
+_TEXTO = ("version", "limites", "resorte", "aceite")
+
+
+def _clave_limites(limites: Optional[Limites]) -> str:
+    return "" if limites is None else repr(limites.clave())
+
+
+def _nombres(cat: catalogo.Catalogo, filas: np.ndarray) -> List[Optional[str]]:
+    nombres = cat["nombre"]
+    return [None if i < 0 else str(nombres[i]) for i in filas.tolist()]
+
+
+# ==========================================================
+#  CLASE: ALMACÉN
+# ==========================================================
+class Almacen:
+    """
+    Conexión a un almacén de resultados (se crea si no existe).
+
+    Uso:
+        with Almacen("resultados.db") as alm:
+            res = alm.seleccionar(wn, m, A0, resortes, aceites)
+            previos = alm.consultar(wn=(50, 150), m=(1, 3))
+
+    Es seguro usarlo desde varios hilos (un candado serializa el acceso).
+    """
+
+    def __init__(self, ruta: str = ARCHIVO_RESULTADOS, tam_lote: int = 10000) -> None:
+        if tam_lote <= 0:
+            raise ValueError("tam_lote debe ser > 0.")
+        self.ruta = ruta
+        self.tam_lote = tam_lote
+        self._pendientes: List[tuple] = []
+        self._id_parametros: Dict[tuple, int] = {}
+        self._candado = threading.RLock()
+        self._con = sqlite3.connect(ruta, check_same_thread=False)
+        self._con.execute("PRAGMA journal_mode=WAL")
+        self._con.execute("PRAGMA synchronous=NORMAL")
+        self._con.execute("PRAGMA cache_size=-65536")  # 64 MiB: el índice crece con inserciones desordenadas
+        self._con.executescript(_ESQUEMA)
+
+    def __enter__(self) -> "Almacen":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.cerrar()
+
+    def __len__(self) -> int:
+        with self._candado:
+            self.vaciar()
+            return self._con.execute("SELECT COUNT(*) FROM resultados").fetchone()[0]
+
+    def cerrar(self) -> None:
+        with self._candado:
+            if self._con is not None:
+                self.vaciar()
+                self._con.close()
+                self._con = None
+
+    def _parametros(self, version: str, alpha: float, zeta_obj: float, limites: Optional[Limites]) -> int:
+        """id de la fila de parametros (se crea la primera vez)."""
+        clave = (version, float(alpha), float(zeta_obj), _clave_limites(limites))
+        id_ = self._id_parametros.get(clave)
+        if id_ is None:
+            with self._con:
+                self._con.execute(
+                    "INSERT OR IGNORE INTO parametros (version, alpha, zeta_obj, limites) VALUES (?, ?, ?, ?)", clave
+                )
+            id_ = self._con.execute(
+                "SELECT id FROM parametros WHERE version = ? AND alpha = ? AND zeta_obj = ? AND limites = ?", clave
+            ).fetchone()[0]
+            self._id_parametros[clave] = id_
+        return id_
+
+    # ----------------------------------------------------------
+    #  ESCRITURA
+    # ----------------------------------------------------------
+    def agregar(
+        self,
+        res: ResultadoSeleccion,
+        resortes: catalogo.Catalogo,
+        aceites: catalogo.Catalogo,
+        alpha: float = ALPHA,
+        zeta_obj: float = ZETA_OBJ,
+        limites: Optional[Limites] = None,
+        t: Optional[np.ndarray] = None,
+        x: Optional[np.ndarray] = None,
+    ) -> None:
+        """
+        Añade los puntos de res (se escriben al completar un lote).
+        t (T,) y x (P, T) opcionales: respuesta de cada punto, con t uniforme
+        desde 0 (obligatoria si se da x); se guarda submuestreada a lo sumo a
+        MAX_MUESTRAS puntos.
+        """
+        i_r = np.ravel(res.i_resorte)
+        i_a = np.ravel(res.i_aceite)
+        n = len(i_r)
+        forma = np.shape(res.i_resorte)
+        wn, m, A0, k, c, zeta, w_d = (
+            np.broadcast_to(getattr(res, nombre), forma).ravel().tolist()
+            for nombre in ("w_n", "m", "A0", "k", "c", "zeta", "w_d")
+        )
+        dt: List[Optional[float]] = [None] * n
+        blobs: List[Optional[bytes]] = [None] * n
+        if x is not None:
+            if t is None or len(t) < 2:
+                raise ValueError("Para guardar x hace falta t con al menos dos tiempos.")
+            x = np.asarray(x).reshape(n, -1)
+            if x.shape[1] != len(t):
+                raise ValueError("x debe tener un valor por punto y por tiempo de t, forma (P, T).")
+            paso = max(1, -(-x.shape[1] // MAX_MUESTRAS))
+            sub = np.ascontiguousarray(x[:, ::paso], dtype=np.float32)
+            dt = [float(t[1] - t[0]) * paso] * n
+            blobs = [fila.tobytes() for fila in sub]
+
+        filas = list(zip(
+            wn, m, A0, i_r.tolist(), i_a.tolist(), _nombres(resortes, i_r), _nombres(aceites, i_a),
+            k, c, zeta, w_d, dt, blobs,
+        ))
+        with self._candado:
+            comun = (time.time(), self._parametros(memo.version_catalogos(resortes, aceites), alpha, zeta_obj, limites))
+            self._pendientes.extend(comun + f for f in filas)
+            if len(self._pendientes) >= self.tam_lote:
+                self.vaciar()
+
+    def vaciar(self) -> int:
+        """Escribe las filas pendientes en una sola transacción; devuelve cuántas."""
+        with self._candado:
+            if not self._pendientes:
+                return 0
+            n = len(self._pendientes)
+            with self._con:
+                self._con.executemany(_INSERTAR, self._pendientes)
+            self._pendientes = []
+            return n
+
+    # ----------------------------------------------------------
+    #  LECTURA
+    # ----------------------------------------------------------
+    def buscar(
+        self,
+        w_n: ArrayLike,
+        m: ArrayLike,
+        A0: Optional[ArrayLike],
+        version: str,
+        alpha: float = ALPHA,
+        zeta_obj: float = ZETA_OBJ,
+        limites: Optional[Limites] = None,
+    ) -> Tuple[np.ndarray, ResultadoSeleccion]:
+        """
+        Resultados guardados para cada punto con los mismos parámetros
+        (el más reciente si hay varios). Devuelve (encontrado, res): res tiene
+        i_resorte = -1 y NaN donde no se encontró nada.
+        """
+        A0 = np.nan if A0 is None else A0
+        w_n, m, A0 = np.broadcast_arrays(*(np.asarray(a, dtype=np.float64) for a in (w_n, m, A0)))
+        n = w_n.size
+        i_r = np.full(n, -1, dtype=np.intp)
+        i_a = np.full(n, -1, dtype=np.intp)
+        valores = {c: np.full(n, np.nan) for c in ("k", "c", "zeta", "w_d")}
+
+        with self._candado:
+            self.vaciar()
+            id_ = self._parametros(version, alpha, zeta_obj, limites)
+            cur = self._con.cursor()
+            cur.execute("CREATE TEMP TABLE IF NOT EXISTS _puntos (j INTEGER, wn REAL, m REAL, A0 REAL)")
+            cur.execute("DELETE FROM _puntos")
+            cur.executemany(
+                "INSERT INTO _puntos VALUES (?, ?, ?, ?)",
+                zip(range(n), w_n.ravel().tolist(), m.ravel().tolist(), A0.ravel().tolist()),
+            )
+            filas = cur.execute(
+                "SELECT p.j, r.i_resorte, r.i_aceite, r.k, r.c, r.zeta, r.w_d"
+                # CROSS JOIN fija el orden: recorrer los puntos y buscar cada uno en ix_entradas
+                " FROM _puntos p CROSS JOIN resultados r ON r.wn = p.wn AND r.m = p.m AND r.A0 IS p.A0"
+                " WHERE r.parametros = ? ORDER BY r.id",
+                (id_,),
+            ).fetchall()
+            cur.execute("DELETE FROM _puntos")
+
+        encontrado = np.zeros(n, dtype=bool)
+        if filas:
+            # Ordenadas por id: si un punto aparece varias veces, gana la más reciente
+            j, r, a, k, c, zeta, w_d = (np.array(col, dtype=np.float64) for col in zip(*filas))
+            j = j.astype(np.intp)
+            encontrado[j] = True
+            i_r[j] = r
+            i_a[j] = a
+            for nombre, col in zip(("k", "c", "zeta", "w_d"), (k, c, zeta, w_d)):
+                valores[nombre][j] = col
+
+        forma = w_n.shape
+        res = ResultadoSeleccion(
+            w_n=w_n, m=m, A0=A0, i_resorte=i_r.reshape(forma), i_aceite=i_a.reshape(forma),
+            **{nombre: v.reshape(forma) for nombre, v in valores.items()},
+        )
+        return encontrado.reshape(forma), res
+
+    def consultar(
+        self,
+        wn: Optional[Tuple[float, float]] = None,
+        m: Optional[Tuple[float, float]] = None,
+        A0: Optional[Tuple[float, float]] = None,
+        resorte: Optional[str] = None,
+        aceite: Optional[str] = None,
+        desde: Optional[float] = None,
+        hasta: Optional[float] = None,
+        limite: Optional[int] = None,
+    ) -> ResultadoSeleccion:
+        """
+        Filas guardadas (en orden de inserción) que cumplen todos los filtros:
+        rangos cerrados (lo, hi) sobre wn, m, A0; nombre exacto de resorte o
+        aceite; creado entre desde y hasta (epoch s). limite acota el número
+        de filas devueltas.
+
+        Devuelve un ResultadoSeleccion con una entrada por fila (w_n, m, A0,
+        i_resorte, i_aceite, k, c, zeta, w_d) más id, creado, alpha,
+        zeta_obj, version, limites, resorte y aceite (nombres).
+        """
+        condiciones, parametros = [], []
+        for columna, rango in (("wn", wn), ("m", m), ("A0", A0)):
+            if rango is not None:
+                condiciones.append(f"r.{columna} BETWEEN ? AND ?")
+                parametros.extend(float(v) for v in rango)
+        for columna, valor in (("resorte", resorte), ("aceite", aceite)):
+            if valor is not None:
+                condiciones.append(f"r.{columna} = ?")
+                parametros.append(valor)
+        if desde is not None or hasta is not None:
+            # Siempre con los dos extremos: con uno solo el planificador prefiere
+            # recorrer la tabla en orden de id antes que usar ix_creado
+            condiciones.append("r.creado BETWEEN ? AND ?")
+            parametros.append(-np.inf if desde is None else float(desde))
+            parametros.append(np.inf if hasta is None else float(hasta))
+
+        columnas = _NUMERICAS + _ENTERAS + _TEXTO
+        sql = "SELECT {} FROM resultados r JOIN parametros p ON p.id = r.parametros".format(
+            ", ".join(("p." if c in _DE_PARAMETROS else "r.") + c for c in columnas)
+        )
+        if condiciones:
+            sql += " WHERE " + " AND ".join(condiciones)
+        sql += " ORDER BY r.id"
+        if limite is not None:
+            sql += f" LIMIT {int(limite)}"
+
+        with self._candado:
+            self.vaciar()
+            filas = self._con.execute(sql, parametros).fetchall()
+
+        datos = list(zip(*filas)) if filas else [()] * len(columnas)
+        campos: Dict[str, np.ndarray] = {}
+        for nombre, col in zip(columnas, datos):
+            if nombre in _NUMERICAS:
+                campos[nombre] = np.array(col, dtype=np.float64)
+            elif nombre in _ENTERAS:
+                campos[nombre] = np.array(col, dtype=np.intp)
+            else:
+                campos[nombre] = np.array(col, dtype=object)
+        campos["id"] = campos["id"].astype(np.int64)
+        campos["w_n"] = campos.pop("wn")
+        return ResultadoSeleccion(**campos)
+
+    def respuesta(self, id_: int) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """(t, x) submuestreados guardados en la fila id_, o None si no hay."""
+        with self._candado:
+            self.vaciar()
+            fila = self._con.execute("SELECT dt, respuesta FROM resultados WHERE id = ?", (int(id_),)).fetchone()
+        if fila is None or fila[1] is None:
+            return None
+        x = np.frombuffer(fila[1], dtype=np.float32)
+        return np.arange(len(x)) * fila[0], x
+
+    def historial(self, n: int = 20) -> List[Dict[str, object]]:
+        """Las n filas más recientes, de la más nueva a la más vieja."""
+        with self._candado:
+            self.vaciar()
+            cur = self._con.execute(
+                "SELECT id, creado, wn, m, A0, resorte, aceite, zeta, w_d FROM resultados ORDER BY id DESC LIMIT ?",
+                (int(n),),
+            )
+            nombres = [d[0] for d in cur.description]
+            return [dict(zip(nombres, fila)) for fila in cur.fetchall()]
+
+    # ----------------------------------------------------------
+    def seleccionar(
+        self,
+        w_n: ArrayLike,
+        m: ArrayLike,
+        A0: Optional[ArrayLike],
+        resortes: catalogo.Catalogo,
+        aceites: catalogo.Catalogo,
+        alpha: float = ALPHA,
+        zeta_obj: float = ZETA_OBJ,
+        limites: Optional[Limites] = None,
+    ) -> ResultadoSeleccion:
+        """
+        seleccion.seleccionar_lote() reutilizando lo guardado: sólo se
+        calculan (y se guardan) los puntos sin resultado previo con la misma
+        versión de catálogos, alpha, zeta_obj y límites. El resultado lleva
+        además el campo reutilizado (bool por punto).
+        """
+        version = memo.version_catalogos(resortes, aceites)
+        encontrado, res = self.buscar(w_n, m, A0, version, alpha, zeta_obj, limites)
+        faltan = np.flatnonzero(~encontrado.ravel())
+        if faltan.size:
+            nuevo = seleccion.seleccionar_lote(
+                res.w_n.ravel()[faltan], res.m.ravel()[faltan], res.A0.ravel()[faltan],
+                resortes, aceites, alpha, zeta_obj, limites,
+            )
+            for nombre in ("i_resorte", "i_aceite", "k", "c", "zeta", "w_d"):
+                getattr(res, nombre).reshape(-1)[faltan] = getattr(nuevo, nombre)
+            self.agregar(nuevo, resortes, aceites, alpha, zeta_obj, limites)
+        res.reutilizado = encontrado
+        return res
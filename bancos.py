@@ -0,0 +1,211 @@
+from typing import Iterator, Optional, Union
+
+import numpy as np
+
+import catalogo
+import main
+
+Indice = Union[int, slice, np.ndarray]
+
+
+def _columna(x) -> np.ndarray:
+    col = np.ascontiguousarray(x, dtype=np.float64)
+    if col.ndim != 1:
+        raise ValueError("Las columnas de un banco deben ser arrays 1-D.")
+    return col
+
+
+def _campo(nombre: str) -> property:
+    """Propiedad de una vista: lee el elemento de la columna `nombre` del banco."""
+
+    def leer(self):
+        return float(getattr(self._banco, nombre)[self._i])
+
+    return property(leer, doc=f"{nombre} del elemento (lectura de la columna del banco)")
+
+
+def _nombre(self) -> str:
+    nombres = self._banco.nombre
+    return str(self._i) if nombres is None else str(nombres[self._i])
+
+
+# ==========================================================
+#  CLASE: BANCO DE RESORTES (estructura de arrays)
+# ==========================================================
+class BancoResortes:
+    """
+    Colección de resortes guardada como columnas float64 contiguas
+    (k, long_libre, def_max, dm_in, dm_ex) en vez de un objeto por resorte.
+
+    - Las columnas se validan completas al construir, con las mismas reglas
+      que Resorte.__init__ (main.validar_resorte).
+    - banco[i] devuelve una VistaResorte ligera (sin __dict__) con los mismos
+      métodos que main.Resorte; banco[a:b] o banco[mascara] devuelven otro banco.
+    - Los métodos de Resorte también se pueden llamar sobre el banco entero:
+      banco.omega_natural(m) devuelve un array con un valor por resorte.
+
+    Unidades: las mismas que main.Resorte (SI).
+    """
+
+    def __init__(
+        self,
+        k: np.ndarray,
+        long_libre: np.ndarray,
+        def_max: np.ndarray,
+        dm_in: np.ndarray,
+        dm_ex: np.ndarray,
+        nombre: Optional[np.ndarray] = None,
+    ) -> None:
+        cols = [_columna(c) for c in (k, long_libre, def_max, dm_in, dm_ex)]
+        if len({len(c) for c in cols}) > 1:
+            raise ValueError("Todas las columnas del banco deben tener la misma longitud.")
+        main.validar_resorte(*cols)
+
+        self.k, self.long_libre, self.def_max, self.dm_in, self.dm_ex = cols
+        self.nombre = None if nombre is None else np.asarray(nombre)
+
+    @classmethod
+    def desde_catalogo(cls, cat: catalogo.Catalogo) -> "BancoResortes":
+        return cls(cat["k_Nm"], cat["long_libre"], cat["def_max"], cat["dm_in"], cat["dm_ex"], cat["nombre"])
+
+    def __len__(self) -> int:
+        return len(self.k)
+
+    def __getitem__(self, i: Indice) -> Union["VistaResorte", "BancoResortes"]:
+        if isinstance(i, (int, np.integer)):
+            n = len(self)
+            if not -n <= i < n:
+                raise IndexError("índice de resorte fuera de rango.")
+            return VistaResorte(self, int(i) % n)
+        sub = BancoResortes.__new__(BancoResortes)  # ya validado: no repetir
+        for campo in ("k", "long_libre", "def_max", "dm_in", "dm_ex"):
+            setattr(sub, campo, np.ascontiguousarray(getattr(self, campo)[i]))
+        sub.nombre = None if self.nombre is None else self.nombre[i]
+        return sub
+
+    def __iter__(self) -> Iterator["VistaResorte"]:
+        return (VistaResorte(self, i) for i in range(len(self)))
+
+    # Métodos de main.Resorte evaluados sobre todas las columnas a la vez
+    fuerza = main.Resorte.fuerza
+    dentro_limites = main.Resorte.dentro_limites
+    frec_natural = main.Resorte.frec_natural
+    omega_natural = main.Resorte.omega_natural
+
+
+class VistaResorte:
+    """
+    Vista de un resorte dentro de un BancoResortes. Sólo guarda el banco y la
+    posición (__slots__), y expone los mismos campos y métodos que main.Resorte.
+    """
+
+    __slots__ = ("_banco", "_i")
+
+    def __init__(self, banco: BancoResortes, i: int) -> None:
+        self._banco = banco
+        self._i = i
+
+    nombre = property(_nombre)
+    k = _campo("k")
+    long_libre = _campo("long_libre")
+    def_max = _campo("def_max")
+    dm_in = _campo("dm_in")
+    dm_ex = _campo("dm_ex")
+
+    fuerza = main.Resorte.fuerza
+    dentro_limites = main.Resorte.dentro_limites
+    frec_natural = main.Resorte.frec_natural
+    omega_natural = main.Resorte.omega_natural
+
+    def como_objeto(self) -> main.Resorte:
+        """Copia independiente como main.Resorte."""
+        return main.Resorte(self.nombre, self.k, self.long_libre, self.def_max, self.dm_in, self.dm_ex)
+
+    def __repr__(self) -> str:
+        return f"VistaResorte({self.nombre!r}, k={self.k:g} N/m)"
+
+
+# ==========================================================
+#  CLASE: BANCO DE AMORTIGUADORES (estructura de arrays)
+# ==========================================================
+class BancoAmortiguadores:
+    """
+    Colección de aceites guardada como columnas float64 contiguas
+    (densidad, visc_40, visc_100), análoga a BancoResortes.
+
+    - Validación completa al construir (main.validar_amortiguador).
+    - banco[i] devuelve una VistaAmortiguador con los métodos de main.Amortiguador.
+    - banco.viscosidad_dinamica(T) da un valor por aceite; para un perfil de
+      temperaturas por aceite usar T con forma (n_temps, 1).
+
+    Unidades: las mismas que main.Amortiguador.
+    """
+
+    def __init__(
+        self,
+        densidad: np.ndarray,
+        visc_40: np.ndarray,
+        visc_100: np.ndarray,
+        nombre: Optional[np.ndarray] = None,
+    ) -> None:
+        cols = [_columna(c) for c in (densidad, visc_40, visc_100)]
+        if len({len(c) for c in cols}) > 1:
+            raise ValueError("Todas las columnas del banco deben tener la misma longitud.")
+        main.validar_amortiguador(*cols)
+
+        self.densidad, self.visc_40, self.visc_100 = cols
+        self.nombre = None if nombre is None else np.asarray(nombre)
+
+    @classmethod
+    def desde_catalogo(cls, cat: catalogo.Catalogo) -> "BancoAmortiguadores":
+        return cls(cat["densidad"], cat["Visc_40"], cat["Visc_100"], cat["nombre"])
+
+    def __len__(self) -> int:
+        return len(self.visc_40)
+
+    def __getitem__(self, i: Indice) -> Union["VistaAmortiguador", "BancoAmortiguadores"]:
+        if isinstance(i, (int, np.integer)):
+            n = len(self)
+            if not -n <= i < n:
+                raise IndexError("índice de amortiguador fuera de rango.")
+            return VistaAmortiguador(self, int(i) % n)
+        sub = BancoAmortiguadores.__new__(BancoAmortiguadores)  # ya validado: no repetir
+        for campo in ("densidad", "visc_40", "visc_100"):
+            setattr(sub, campo, np.ascontiguousarray(getattr(self, campo)[i]))
+        sub.nombre = None if self.nombre is None else self.nombre[i]
+        return sub
+
+    def __iter__(self) -> Iterator["VistaAmortiguador"]:
+        return (VistaAmortiguador(self, i) for i in range(len(self)))
+
+    viscosidad_dinamica = main.Amortiguador.viscosidad_dinamica
+    coef_amortiguamiento = main.Amortiguador.coef_amortiguamiento
+    relacion_amortiguamiento = main.Amortiguador.relacion_amortiguamiento
+
+
+class VistaAmortiguador:
+    """
+    Vista de un aceite dentro de un BancoAmortiguadores (__slots__, sin copia).
+    """
+
+    __slots__ = ("_banco", "_i")
+
+    def __init__(self, banco: BancoAmortiguadores, i: int) -> None:
+        self._banco = banco
+        self._i = i
+
+    nombre = property(_nombre)
+    densidad = _campo("densidad")
+    visc_40 = _campo("visc_40")
+    visc_100 = _campo("visc_100")
+
+    viscosidad_dinamica = main.Amortiguador.viscosidad_dinamica
+    coef_amortiguamiento = main.Amortiguador.coef_amortiguamiento
+    relacion_amortiguamiento = main.Amortiguador.relacion_amortiguamiento
+
+    def como_objeto(self) -> main.Amortiguador:
+        """Copia independiente como main.Amortiguador."""
+        return main.Amortiguador(self.nombre, self.densidad, self.visc_40, self.visc_100)
+
+    def __repr__(self) -> str:
+        return f"VistaAmortiguador({self.nombre!r}, visc_40={self.visc_40:g} mm²/s)"
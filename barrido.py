@@ -0,0 +1,199 @@
+"""
+Barridos de parámetros (ω_n, m, alpha, ζ objetivo) repartidos en varios procesos.
+
+Las columnas de los catálogos y sus índices ordenados se copian una sola vez
+a multiprocessing.shared_memory; cada proceso de trabajo las mapea sin leer
+el Excel ni recibir DataFrames serializados. Cada proceso escribe su tramo de
+resultados directamente en un .npy mapeado en memoria, así que los
+resultados quedan en disco a medida que terminan y no vuelven por pickle.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+import catalogo
+import seleccion
+from indice import IndiceAceites, IndiceResortes
+
+ArrayLike = Union[float, np.ndarray]
+
+# Registro de salida (un elemento por punto del barrido)
+DTYPE_RESULTADO = np.dtype(
+    [
+        ("w_n", "f8"),
+        ("m", "f8"),
+        ("alpha", "f8"),
+        ("zeta_obj", "f8"),
+        ("i_resorte", "i8"),
+        ("i_aceite", "i8"),
+        ("k", "f8"),
+        ("c", "f8"),
+        ("zeta", "f8"),
+        ("w_d", "f8"),
+    ]
+)
+
+# Estado de cada proceso de trabajo (se rellena en _iniciar_trabajador)
+_trabajador: Dict[str, object] = {}
+
+
+# ==========================================================
+#  MEMORIA COMPARTIDA
+# ==========================================================
+def _a_compartida(arrays: Dict[str, np.ndarray]) -> Tuple[List[shared_memory.SharedMemory], Dict[str, tuple]]:
+    """
+    Copia cada array a un bloque de memoria compartida.
+    Devuelve los bloques (para liberarlos al final) y un descriptor
+    nombre → (bloque, forma, dtype) que se envía a los trabajadores.
+    """
+    bloques, descriptor = [], {}
+    for nombre, a in arrays.items():
+        a = np.ascontiguousarray(a)
+        shm = shared_memory.SharedMemory(create=True, size=max(a.nbytes, 1))
+        np.ndarray(a.shape, dtype=a.dtype, buffer=shm.buf)[...] = a
+        bloques.append(shm)
+        descriptor[nombre] = (shm.name, a.shape, a.dtype.str)
+    return bloques, descriptor
+
+
+def _desde_compartida(descriptor: Dict[str, tuple]) -> Tuple[List[shared_memory.SharedMemory], Dict[str, np.ndarray]]:
+    bloques, arrays = [], {}
+    for nombre, (shm_nombre, forma, dtype) in descriptor.items():
+        shm = shared_memory.SharedMemory(name=shm_nombre)
+        bloques.append(shm)
+        arrays[nombre] = np.ndarray(forma, dtype=np.dtype(dtype), buffer=shm.buf)
+    return bloques, arrays
+
+
+# ==========================================================
+#  PROCESO DE TRABAJO
+# ==========================================================
+def _iniciar_trabajador(descriptor: Dict[str, tuple], versiones: Tuple[str, str], rejilla, salida: str) -> None:
+    """
+    Se ejecuta una vez por proceso: mapea los catálogos compartidos, arma los
+    catálogos e índices sobre esa memoria (sin copiar ni ordenar) y abre el
+    archivo de salida.
+    """
+    bloques, a = _desde_compartida(descriptor)
+
+    resortes = catalogo.Catalogo({"k_Nm": a["k_Nm"]}, versiones[0], "<compartido>")
+    aceites = catalogo.Catalogo({"Visc_40": a["Visc_40"]}, versiones[1], "<compartido>")
+    IndiceResortes.desde_ordenado(a["k_Nm"], a["k_orden"], a["k_ordenado"]).asociar(resortes)
+    IndiceAceites.desde_ordenado(a["Visc_40"], a["v_orden"], a["v_ordenado"]).asociar(aceites)
+
+    _trabajador.update(
+        bloques=bloques,  # mantener los mapeos vivos
+        resortes=resortes,
+        aceites=aceites,
+        rejilla=rejilla,
+        salida=np.load(salida, mmap_mode="r+"),
+    )
+
+
+def _procesar_tramo(ini: int, fin: int) -> int:
+    """Evalúa los puntos [ini, fin) de la rejilla y los escribe en la salida."""
+    w_n, m, alpha, zeta_obj = _trabajador["rejilla"]
+    iw, im, ia, iz = np.unravel_index(np.arange(ini, fin), (len(w_n), len(m), len(alpha), len(zeta_obj)))
+
+    res = seleccion.seleccionar_lote(
+        w_n[iw], m[im], None, _trabajador["resortes"], _trabajador["aceites"], alpha[ia], zeta_obj[iz]
+    )
+
+    out = _trabajador["salida"][ini:fin]
+    out["w_n"] = res.w_n
+    out["m"] = res.m
+    out["alpha"] = alpha[ia]
+    out["zeta_obj"] = zeta_obj[iz]
+    out["i_resorte"] = res.i_resorte
+    out["i_aceite"] = res.i_aceite
+    out["k"] = res.k
+    out["c"] = res.c
+    out["zeta"] = res.zeta
+    out["w_d"] = res.w_d
+    return fin - ini
+
+
+# ==========================================================
+#  API PÚBLICA
+# ==========================================================
+def barrido(
+    w_n: ArrayLike,
+    m: ArrayLike,
+    alpha: ArrayLike = seleccion.ALPHA,
+    zeta_obj: ArrayLike = seleccion.ZETA_OBJ,
+    salida: str = "barrido.npy",
+    procesos: Optional[int] = None,
+    tam_tramo: int = 1 << 18,
+    resortes: Optional[catalogo.Catalogo] = None,
+    aceites: Optional[catalogo.Catalogo] = None,
+    progreso: Optional[Callable[[int, int], None]] = None,
+) -> np.ndarray:
+    """
+    Evalúa seleccion.seleccionar_lote sobre la rejilla completa
+    w_n × m × alpha × zeta_obj (cada uno escalar o array 1-D).
+
+    Los N puntos se numeran en orden C de la rejilla y se reparten en tramos
+    de tam_tramo puntos entre `procesos` procesos (por defecto os.cpu_count()).
+    Cada trabajador escribe su tramo en `salida` (.npy con dtype
+    DTYPE_RESULTADO y N registros) en cuanto lo termina.
+
+    progreso(hechos, total) se llama en el proceso principal tras cada tramo.
+    Devuelve el resultado mapeado en memoria en modo sólo lectura.
+    """
+    rejilla = tuple(
+        np.atleast_1d(np.asarray(a, dtype=np.float64)) for a in (w_n, m, alpha, zeta_obj)
+    )
+    if any(g.ndim != 1 for g in rejilla):
+        raise ValueError("w_n, m, alpha y zeta_obj deben ser escalares o arrays 1-D.")
+    if tam_tramo <= 0:
+        raise ValueError("tam_tramo debe ser > 0.")
+    # Validar una vez aquí en vez de fallar dentro de cada trabajador
+    if np.any(rejilla[1] <= 0):
+        raise ValueError("masa (kg) debe ser > 0.")
+    if np.any(rejilla[2] <= 0):
+        raise ValueError("alpha debe ser > 0.")
+
+    if resortes is None:
+        resortes = catalogo.cargar_resortes()
+    if aceites is None:
+        aceites = catalogo.cargar_aceites()
+    ind_k = IndiceResortes.desde_catalogo(resortes)
+    ind_v = IndiceAceites.desde_catalogo(aceites)
+
+    total = int(np.prod([len(g) for g in rejilla]))
+    np.lib.format.open_memmap(salida, mode="w+", dtype=DTYPE_RESULTADO, shape=(total,)).flush()
+
+    bloques, descriptor = _a_compartida(
+        {
+            "k_Nm": ind_k.valores,
+            "k_orden": ind_k.orden,
+            "k_ordenado": ind_k.ordenado,
+            "Visc_40": ind_v.valores,
+            "v_orden": ind_v.orden,
+            "v_ordenado": ind_v.ordenado,
+        }
+    )
+    try:
+        with ProcessPoolExecutor(
+            max_workers=procesos or os.cpu_count(),
+            initializer=_iniciar_trabajador,
+            initargs=(descriptor, (resortes.version, aceites.version), rejilla, salida),
+        ) as pool:
+            futuros = [
+                pool.submit(_procesar_tramo, ini, min(ini + tam_tramo, total))
+                for ini in range(0, total, tam_tramo)
+            ]
+            hechos = 0
+            for fut in as_completed(futuros):
+                hechos += fut.result()
+                if progreso is not None:
+                    progreso(hechos, total)
+    finally:
+        for shm in bloques:
+            shm.close()
+            shm.unlink()
+
+    return np.load(salida, mmap_mode="r")
@@ -0,0 +1,312 @@
+"""
+Benchmarks de las rutas críticas de resoil sobre catálogos sintéticos.
+
+Uso (desde la raíz del repositorio):
+    python benchmarks/bench_resoil.py                          # 10² … 10⁶ filas
+    python benchmarks/bench_resoil.py --tamanos 100 10000 --salida base.json
+    python benchmarks/bench_resoil.py --comparar base.json     # marca regresiones
+
+Casos medidos (por tamaño de catálogo n, salvo "respuesta"):
+  - carga_excel:    Excel → catálogo (sin caché; sólo n <= --max-excel)
+  - carga_cache:    .cache.npz → catálogo (sin copia en memoria)
+  - indice:         construcción del índice ordenado de k
+  - k_unico:        resorte más cercano para una sola k
+  - k_lote:         resortes más cercanos para --lote valores de k
+  - zeta_aceite:    aceite por ζ para --lote puntos (catálogo de aceites de n filas)
+  - seleccion_lote: seleccionar_lote completo (ambos catálogos de n filas)
+  - respuesta:      x(t) en forma cerrada para S sistemas × --muestras tiempos
+
+Los resultados se guardan en JSON (tiempos por llamada en segundos), con el
+commit y las versiones de Python/NumPy, para compararlos entre versiones.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+import catalogo  # noqa: E402
+import respuesta  # noqa: E402
+import seleccion  # noqa: E402
+from indice import IndiceResortes  # noqa: E402
+
+TAMANOS = [10**2, 10**3, 10**4, 10**5, 10**6]
+SISTEMAS = [10, 100, 1000]
+
+
+# ==========================================================
+#  CATÁLOGOS SINTÉTICOS
+# ==========================================================
+def resortes_sinteticos(n: int, rng: np.random.Generator) -> Dict[str, np.ndarray]:
+    """Columnas de un catálogo de resortes de n filas (en SI, como Catalogo)."""
+    long_libre = rng.uniform(1.0, 12.0, n) * catalogo.IN_A_M
+    dm_in = rng.uniform(0.3, 3.0, n) * catalogo.IN_A_M
+    return {
+        "nombre": np.char.add("R-", np.arange(n).astype(np.str_)),
+        "k_Nm": 10 ** rng.uniform(0.5, 3.5, n) * catalogo.LBIN_A_NM,
+        "long_libre": long_libre,
+        "def_max": long_libre * rng.uniform(0.3, 0.7, n),
+        "dm_in": dm_in,
+        "dm_ex": dm_in + rng.uniform(0.05, 0.5, n) * catalogo.IN_A_M,
+    }
+
+
+def aceites_sinteticos(n: int, rng: np.random.Generator) -> Dict[str, np.ndarray]:
+    """Columnas de un catálogo de aceites de n filas."""
+    visc_40 = 10 ** rng.uniform(0.7, 2.7, n)
+    return {
+        "nombre": np.char.add("A-", np.arange(n).astype(np.str_)),
+        "densidad": rng.uniform(0.82, 0.92, n),
+        "Visc_40": visc_40,
+        "Visc_100": np.maximum(visc_40 / rng.uniform(3.0, 8.0, n), 2.0),
+    }
+
+
+def _escribir_excel(ruta: str, datos: Dict[str, np.ndarray], columnas: Dict[str, tuple], col_nombre: str) -> None:
+    """Escribe las columnas en un Excel con los encabezados y unidades del catálogo real."""
+    import pandas as pd
+
+    tabla = {col_nombre: datos["nombre"]}
+    for col_excel, (nombre, factor) in columnas.items():
+        tabla[col_excel] = datos[nombre] / factor
+    pd.DataFrame(tabla).to_excel(ruta, index=False)
+
+
+def _sembrar_cache(ruta: str, datos: Dict[str, np.ndarray]) -> None:
+    """
+    Para tamaños que no se escriben en Excel: crea un archivo de origen de
+    relleno y su .cache.npz válida, igual que la dejaría catalogo._cargar.
+    """
+    with open(ruta, "wb") as f:
+        f.write(os.urandom(64))
+    np.savez(
+        catalogo._ruta_cache(ruta),
+        _formato=np.int64(catalogo._FORMATO_CACHE),
+        _firma=catalogo._firma(ruta),
+        _hash=np.str_(catalogo._hash(ruta)),
+        **datos,
+    )
+
+
+# ==========================================================
+#  MEDICIÓN
+# ==========================================================
+def medir(
+    fn: Callable[[], object],
+    repeticiones: int = 5,
+    preparar: Optional[Callable[[], None]] = None,
+    t_min: float = 0.05,
+) -> Dict[str, float]:
+    """
+    Tiempo por llamada de fn (s): mínimo, mediana y media de `repeticiones`.
+
+    Sin `preparar`, cada repetición agrupa las llamadas necesarias para durar
+    al menos t_min (como timeit.autorange). Con `preparar`, éste se llama sin
+    medir antes de cada llamada (p. ej. para vaciar cachés).
+    """
+    numero = 1
+    if preparar is None:
+        while True:
+            ini = time.perf_counter()
+            for _ in range(numero):
+                fn()
+            if time.perf_counter() - ini >= t_min or numero >= 1 << 20:
+                break
+            numero *= 10
+
+    tiempos = []
+    for _ in range(repeticiones):
+        if preparar is not None:
+            preparar()
+        ini = time.perf_counter()
+        for _ in range(numero):
+            fn()
+        tiempos.append((time.perf_counter() - ini) / numero)
+    return {
+        "min_s": min(tiempos),
+        "mediana_s": statistics.median(tiempos),
+        "media_s": statistics.fmean(tiempos),
+        "repeticiones": repeticiones,
+        "numero": numero,
+    }
+
+
+# ==========================================================
+#  CASOS
+# ==========================================================
+def bench_catalogo(n: int, args, directorio: str, rng: np.random.Generator) -> List[Dict[str, object]]:
+    res_datos = resortes_sinteticos(n, rng)
+    ace_datos = aceites_sinteticos(n, rng)
+    resultados = []
+
+    def anotar(nombre: str, medicion: Dict[str, float]) -> None:
+        resultados.append({"caso": nombre, "n": n, **medicion})
+        print(f"  {nombre:<15} n={n:<8} mediana {medicion['mediana_s'] * 1e3:10.4f} ms", flush=True)
+
+    # Carga: Excel (tamaños pequeños) y caché .npz
+    ruta = os.path.join(directorio, f"resortes_{n}.xlsx")
+    if n <= args.max_excel:
+        _escribir_excel(ruta, res_datos, catalogo.COLUMNAS_RESORTES, "Modelo")
+
+        def sin_caches() -> None:
+            catalogo._en_memoria.clear()
+            if os.path.exists(catalogo._ruta_cache(ruta)):
+                os.remove(catalogo._ruta_cache(ruta))
+
+        anotar("carga_excel", medir(lambda: catalogo.cargar_resortes(ruta), args.repeticiones, sin_caches))
+    else:
+        _sembrar_cache(ruta, res_datos)
+    catalogo._en_memoria.clear()
+    catalogo.cargar_resortes(ruta)  # deja la caché escrita
+    anotar(
+        "carga_cache",
+        medir(lambda: catalogo.cargar_resortes(ruta), args.repeticiones, catalogo._en_memoria.clear),
+    )
+    catalogo._en_memoria.clear()
+
+    # Selección sobre catálogos en memoria
+    resortes = catalogo.Catalogo(res_datos, f"bench-r{n}", "<sintetico>")
+    aceites = catalogo.Catalogo(ace_datos, f"bench-a{n}", "<sintetico>")
+    aceites_fijos = catalogo.Catalogo(aceites_sinteticos(100, rng), "bench-a100", "<sintetico>")
+    k = resortes["k_Nm"]
+    anotar("indice", medir(lambda: IndiceResortes(k), args.repeticiones))
+
+    ind = IndiceResortes.desde_catalogo(resortes)
+    k_uno = float(np.median(k))
+    k_lote = rng.uniform(k.min(), k.max(), args.lote)
+    anotar("k_unico", medir(lambda: ind.mas_cercano(k_uno), args.repeticiones))
+    anotar("k_lote", medir(lambda: ind.mas_cercano(k_lote), args.repeticiones))
+
+    m = rng.uniform(0.5, 20.0, args.lote)
+    w_n = np.sqrt(k_lote / m)
+    resortes_fijos = catalogo.Catalogo(resortes_sinteticos(100, rng), "bench-r100", "<sintetico>")
+    seleccion.seleccionar_lote(w_n, m, None, resortes_fijos, aceites)  # índices ya construidos
+    seleccion.seleccionar_lote(w_n, m, None, resortes, aceites_fijos)
+    anotar(
+        "zeta_aceite",
+        medir(lambda: seleccion.seleccionar_lote(w_n, m, None, resortes_fijos, aceites), args.repeticiones),
+    )
+    seleccion.seleccionar_lote(w_n, m, None, resortes, aceites)
+    anotar(
+        "seleccion_lote",
+        medir(lambda: seleccion.seleccionar_lote(w_n, m, None, resortes, aceites), args.repeticiones),
+    )
+    return resultados
+
+
+def bench_respuesta(s: int, args, rng: np.random.Generator) -> Dict[str, object]:
+    m = rng.uniform(0.5, 20.0, s)
+    k = 10 ** rng.uniform(2.5, 5.5, s)
+    c = rng.uniform(0.05, 1.5, s) * 2 * np.sqrt(m * k)  # mezcla de regímenes
+    t = np.linspace(0, 5, args.muestras)
+    out = np.empty((s, args.muestras))
+    medicion = medir(lambda: respuesta.respuesta_libre(m, k, c, t, 0.01, out=out), args.repeticiones)
+    print(f"  {'respuesta':<15} S={s:<8} mediana {medicion['mediana_s'] * 1e3:10.4f} ms", flush=True)
+    return {"caso": "respuesta", "n": s, "muestras": args.muestras, **medicion}
+
+
+# ==========================================================
+#  RESULTADOS
+# ==========================================================
+def _commit() -> Optional[str]:
+    try:
+        salida = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=RAIZ, capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return salida.stdout.strip() or None
+
+
+def metadatos(args) -> Dict[str, object]:
+    return {
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "commit": _commit(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "plataforma": platform.platform(),
+        "procesador": platform.processor() or platform.machine(),
+        "lote": args.lote,
+        "semilla": args.semilla,
+    }
+
+
+def comparar(actual: List[Dict[str, object]], base: List[Dict[str, object]], umbral: float) -> int:
+    """
+    Compara medianas caso a caso (mismo caso y n). Imprime la razón
+    actual/base y devuelve cuántos casos empeoraron más que `umbral`.
+    """
+    previos = {(r["caso"], r["n"]): r for r in base}
+    regresiones = 0
+    print(f"\n{'caso':<15} {'n':>8} {'base ms':>12} {'actual ms':>12} {'razón':>7}")
+    for r in actual:
+        b = previos.get((r["caso"], r["n"]))
+        if b is None:
+            continue
+        razon = r["mediana_s"] / b["mediana_s"]
+        marca = ""
+        if razon > umbral:
+            regresiones += 1
+            marca = "  << regresión"
+        print(
+            f"{r['caso']:<15} {r['n']:>8} {b['mediana_s'] * 1e3:12.4f} "
+            f"{r['mediana_s'] * 1e3:12.4f} {razon:7.2f}{marca}"
+        )
+    return regresiones
+
+
+# ==========================================================
+#  PUNTO DE ENTRADA
+# ==========================================================
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="Benchmarks de carga, selección y respuesta de resoil.")
+    p.add_argument("--tamanos", type=int, nargs="+", default=TAMANOS, help="filas de los catálogos sintéticos")
+    p.add_argument("--sistemas", type=int, nargs="+", default=SISTEMAS, help="sistemas por lote de x(t)")
+    p.add_argument("--muestras", type=int, default=2000, help="tiempos por sistema en x(t)")
+    p.add_argument("--lote", type=int, default=10_000, help="puntos por consulta en lote")
+    p.add_argument("--max-excel", type=int, default=10_000, help="mayor tamaño que se escribe y lee como Excel")
+    p.add_argument("--repeticiones", type=int, default=5)
+    p.add_argument("--semilla", type=int, default=0)
+    p.add_argument("--salida", default=None, help="JSON de resultados (por defecto benchmarks/resultados/<commit>.json)")
+    p.add_argument("--comparar", default=None, help="JSON de una ejecución anterior")
+    p.add_argument("--umbral", type=float, default=1.25, help="razón actual/base que cuenta como regresión")
+    args = p.parse_args(argv)
+
+    rng = np.random.default_rng(args.semilla)
+    resultados: List[Dict[str, object]] = []
+    with tempfile.TemporaryDirectory(prefix="bench_resoil_") as directorio:
+        for n in args.tamanos:
+            print(f"catálogos de {n} filas", flush=True)
+            resultados.extend(bench_catalogo(n, args, directorio, rng))
+    print("respuesta x(t)", flush=True)
+    for s in args.sistemas:
+        resultados.append(bench_respuesta(s, args, rng))
+
+    meta = metadatos(args)
+    salida = args.salida or os.path.join(RAIZ, "benchmarks", "resultados", f"{meta['commit'] or 'sin_commit'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(salida)), exist_ok=True)
+    with open(salida, "w", encoding="utf-8") as f:
+        json.dump({"meta": meta, "resultados": resultados}, f, indent=2, ensure_ascii=False)
+    print(f"\nresultados en {salida}")
+
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as f:
+            base = json.load(f)["resultados"]
+        if comparar(resultados, base, args.umbral):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
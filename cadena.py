@@ -0,0 +1,381 @@
+"""
+Cadenas de masas unidas por resortes y amortiguadores (N grados de libertad).
+
+    tierra ─[k0, c0]─ m0 ─[k1, c1]─ m1 ─ ··· ─[k_{n-1}, c_{n-1}]─ m_{n-1} [─[k_n, c_n]─ tierra]
+
+    M·x'' + C·x' + K·x = f
+
+M es diagonal y K, C son tridiagonales simétricas: se guardan como bandas
+(diagonal (n,) y subdiagonal (n-1,)), así que memoria y productos son O(n).
+Con el elemento opcional n la cadena queda fija también arriba.
+
+Modos: K·φ = ω²·M·φ se lleva a la forma estándar A = M^(-1/2)·K·M^(-1/2),
+también tridiagonal. Si se piden pocos modos de una cadena larga, los
+autovalores salen por bisección de Sturm y los vectores por iteración
+inversa (O(n) por modo y paso), con un Rayleigh-Ritz final; si no, eigh
+denso. Los modos se guardan en una caché por configuración (m, k, n_modos)
+y su amortiguamiento modal Φᵀ·C·Φ, en la misma caché, por (m, k, c,
+n_modos): cambiar sólo los amortiguadores reproyecta C sin recalcular los
+modos, y cambiar sólo las condiciones iniciales o la malla de tiempos no
+recalcula nada. simular() usa por defecto todos los modos de las cadenas
+cortas y los _MODOS_SIMULACION menores de las largas (camino de Sturm).
+
+Simulación con los modos φ normalizados en masa (Φᵀ·M·Φ = I):
+  - metodo="modal": amortiguamiento modal ζ_r = φ_rᵀ·C·φ_r / (2·ω_r); cada
+    coordenada modal tiene la respuesta libre en forma cerrada de
+    respuesta.respuesta_libre. Exacto si C es proporcional (p. ej. todos los
+    pares k, c con la misma relación), aproximado si no.
+  - metodo="implicito": Newmark de aceleración media (incondicionalmente
+    estable) sobre el sistema modal con la matriz Φᵀ·C·Φ completa; recoge
+    el acoplamiento por amortiguamiento no proporcional.
+Una fuerza constante f se trata con la solución estática exacta K⁻¹·f
+(Thomas, O(n)) más la respuesta libre alrededor de ella.
+"""
+import hashlib
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+import main
+import memo
+import perfil
+import respuesta
+from seleccion import ALPHA
+
+ArrayLike = Union[float, np.ndarray]
+
+METODOS = ("modal", "implicito")
+
+# Por debajo de este tamaño (o si se piden muchos modos) se usa eigh denso
+_N_DENSO = 400
+
+# Autovalores por bisección hasta esta precisión relativa (Rayleigh-Ritz afina después)
+_TOL_BISECCION = 1e-6
+_PUNTOS_SECCION = 15
+_ITER_INVERSA = 3
+
+# Modos por defecto de simular() en cadenas de más de _N_DENSO masas
+_MODOS_SIMULACION = 32
+
+_modos = memo.CacheLRU(max_entradas=32, max_bytes=256 * 2**20)
+
+
+# ==========================================================
+#  ÁLGEBRA TRIDIAGONAL
+# ==========================================================
+def _banda(coef: np.ndarray, n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """(diagonal, subdiagonal) de K o C a partir de los coeficientes de los elementos."""
+    diag = coef[:n].copy()
+    diag[:-1] += coef[1:n]
+    if len(coef) > n:
+        diag[-1] += coef[n]
+    return diag, -coef[1:n]
+
+
+def _producto(diag: np.ndarray, sub: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """A·x con A tridiagonal simétrica; x de forma (n,) o (n, r)."""
+    y = diag.reshape((-1,) + (1,) * (x.ndim - 1)) * x
+    s = sub.reshape((-1,) + (1,) * (x.ndim - 1))
+    y[:-1] += s * x[1:]
+    y[1:] += s * x[:-1]
+    return y
+
+
+def _resolver(diag: np.ndarray, sub: np.ndarray, b: np.ndarray, desplazamiento: ArrayLike = 0.0) -> np.ndarray:
+    """
+    (A - desplazamiento·I)·y = b por el algoritmo de Thomas. Con b de forma
+    (n, r) y desplazamiento (r,) resuelve r sistemas a la vez.
+    """
+    n = len(diag)
+    d = np.subtract.outer(diag, desplazamiento) if np.ndim(desplazamiento) else diag - desplazamiento
+    tiny = np.finfo(np.float64).tiny
+    cp = np.empty_like(d)
+    y = np.empty(np.broadcast_shapes(d.shape, b.shape))
+    w = d[0]
+    w = np.where(w == 0, tiny, w)
+    y[0] = b[0] / w
+    for i in range(1, n):
+        cp[i - 1] = sub[i - 1] / w
+        w = d[i] - sub[i - 1] * cp[i - 1]
+        w = np.where(w == 0, tiny, w)
+        y[i] = (b[i] - sub[i - 1] * y[i - 1]) / w
+    for i in range(n - 2, -1, -1):
+        y[i] -= cp[i] * y[i + 1]
+    return y
+
+
+def _autovalores_menores(diag: np.ndarray, sub: np.ndarray, r: int) -> np.ndarray:
+    """
+    Los r autovalores menores de A tridiagonal simétrica definida positiva,
+    por bisección de Sturm (vectorizada sobre los r autovalores).
+
+    Cada pasada sobre la cadena cuenta los autovalores bajo _PUNTOS_SECCION
+    puntos por intervalo a la vez (multisección): el bucle en Python es la
+    parte cara y así cada pasada estrecha el intervalo 16 veces, no 2.
+    """
+    n = len(diag)
+    sub2 = sub**2
+    radio = np.abs(np.concatenate((sub, [0.0]))) + np.abs(np.concatenate(([0.0], sub)))
+    lo = np.zeros(r)
+    hi = np.full(r, np.max(diag + radio))  # Gershgorin
+    j = np.arange(r)[:, None]
+    fracciones = np.arange(1, _PUNTOS_SECCION + 1) / (_PUNTOS_SECCION + 1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        while np.any(hi - lo > _TOL_BISECCION * hi):
+            x = lo[:, None] + (hi - lo)[:, None] * fracciones  # (r, p)
+            # Número de autovalores < x = número de pivotes negativos de A - x·I
+            q = diag[0] - x
+            cuenta = (q < 0).astype(np.intp)
+            for i in range(1, n):
+                q = diag[i] - x - sub2[i - 1] / q
+                cuenta += q < 0
+            mayor = cuenta > j
+            # Primer punto con más de j autovalores debajo: nuevo hi; el anterior, nuevo lo
+            primero = np.argmax(mayor, axis=1)
+            alguno = mayor[np.arange(r), primero]
+            lo_nuevo = np.where(primero > 0, x[np.arange(r), primero - 1], lo)
+            hi = np.where(alguno, x[np.arange(r), primero], hi)
+            lo = np.where(alguno, lo_nuevo, x[:, -1])
+    return 0.5 * (lo + hi)
+
+
+def _modos_tridiagonal(diag: np.ndarray, sub: np.ndarray, r: int) -> Tuple[np.ndarray, np.ndarray]:
+    """(λ (r,), V (n, r) ortonormal) de los r modos menores de A."""
+    n = len(diag)
+    if n <= _N_DENSO or 4 * r > n:
+        A = np.diag(diag) + np.diag(sub, 1) + np.diag(sub, -1)
+        lam, V = np.linalg.eigh(A)
+        return lam[:r], V[:, :r]
+
+    lam = _autovalores_menores(diag, sub, r)
+    # Iteración inversa con desplazamiento apenas por debajo de cada λ
+    V = np.random.default_rng(0).standard_normal((n, r))
+    desplazamiento = lam * (1 - 1e-9)
+    for _ in range(_ITER_INVERSA):
+        V = _resolver(diag, sub, V, desplazamiento)
+        V /= np.linalg.norm(V, axis=0)
+    # Rayleigh-Ritz: corrige mezclas entre autovalores cercanos
+    V, _ = np.linalg.qr(V)
+    lam, giro = np.linalg.eigh(V.T @ _producto(diag, sub, V))
+    return lam, V @ giro
+
+
+# ==========================================================
+#  CLASE: MODOS
+# ==========================================================
+class Modos:
+    """
+    Modos de una cadena (r = número de modos calculados):
+      - w: frecuencias naturales ω_r (rad/s), crecientes (r,)
+      - phi: formas modales normalizadas en masa, Φᵀ·M·Φ = I (n, r)
+      - zeta: amortiguamiento modal ζ_r = (Φᵀ·C·Φ)_rr / (2·ω_r) (r,)
+      - c_modal: Φᵀ·C·Φ completa (r, r)
+    """
+
+    def __init__(self, **campos: np.ndarray) -> None:
+        self.__dict__.update(campos)
+
+    def __len__(self) -> int:
+        return int(self.w.shape[0])
+
+    @property
+    def f_Hz(self) -> np.ndarray:
+        return self.w / (2 * np.pi)
+
+
+# ==========================================================
+#  CLASE: CADENA
+# ==========================================================
+class Cadena:
+    """
+    Cadena lineal de n masas y n (o n + 1, fija arriba) elementos resorte +
+    amortiguador en paralelo; el elemento i une la masa i-1 con la i (el 0,
+    la masa 0 con tierra).
+
+      - m: masas (kg), forma (n,)
+      - k: rigideces (N/m) de los elementos, forma (n,) o (n + 1,)
+      - c: amortiguamientos (N·s/m) de los elementos, misma forma que k
+
+    Propiedades: K y C como bandas (diagonal, subdiagonal).
+    Métodos: modos(n_modos), estatica(f), simular(t, x0, v0, f, ...).
+    """
+
+    def __init__(self, m: ArrayLike, k: ArrayLike, c: ArrayLike = 0.0) -> None:
+        m = np.atleast_1d(np.asarray(m, dtype=np.float64))
+        k = np.atleast_1d(np.asarray(k, dtype=np.float64))
+        c = np.broadcast_to(np.asarray(c, dtype=np.float64), k.shape).copy()
+        n = len(m)
+        if m.ndim != 1 or k.ndim != 1 or n == 0:
+            raise ValueError("m y k deben ser arrays 1-D no vacíos.")
+        if len(k) not in (n, n + 1):
+            raise ValueError("Se necesitan n o n + 1 elementos para n masas.")
+        if np.any(m <= 0) or np.any(k <= 0):
+            raise ValueError("masa (kg) y k (N/m) deben ser > 0.")
+        if np.any(c < 0):
+            raise ValueError("c (N·s/m) debe ser >= 0.")
+        self.m = m
+        self.k = k
+        self.c = c
+
+    @classmethod
+    def desde_elementos(
+        cls,
+        masas: Sequence[float],
+        resortes: Sequence[main.Resorte],
+        amortiguadores: Optional[Sequence[Optional[main.Amortiguador]]] = None,
+        alpha: ArrayLike = ALPHA,
+    ) -> "Cadena":
+        """
+        Cadena a partir de objetos main.Resorte y main.Amortiguador, uno por
+        elemento (None = elemento sin amortiguador). El amortiguamiento sigue
+        la regla del catálogo: c = alpha·Visc_40 (alpha escalar o por elemento).
+        """
+        k = np.array([r.k for r in resortes], dtype=np.float64)
+        if amortiguadores is None:
+            amortiguadores = [None] * len(resortes)
+        if len(amortiguadores) != len(resortes):
+            raise ValueError("Debe haber un amortiguador (o None) por resorte.")
+        visc = np.array([0.0 if a is None else a.visc_40 for a in amortiguadores])
+        alpha = np.broadcast_to(np.asarray(alpha, dtype=np.float64), visc.shape)
+        if np.any(alpha <= 0):
+            raise ValueError("alpha debe ser > 0.")
+        return cls(masas, k, alpha * visc)
+
+    def __len__(self) -> int:
+        return len(self.m)
+
+    @property
+    def K(self) -> Tuple[np.ndarray, np.ndarray]:
+        return _banda(self.k, len(self))
+
+    @property
+    def C(self) -> Tuple[np.ndarray, np.ndarray]:
+        return _banda(self.c, len(self))
+
+    def clave(self) -> str:
+        """Huella de (m, k): los modos sólo dependen de M y K."""
+        h = hashlib.sha1(self.m.tobytes())
+        h.update(self.k.tobytes())
+        return h.hexdigest()
+
+    def clave_amortiguamiento(self) -> str:
+        """Huella de c: con clave() identifica el amortiguamiento modal."""
+        return hashlib.sha1(self.c.tobytes()).hexdigest()
+
+    # ----------------------------------------------------------
+    def modos(self, n_modos: Optional[int] = None) -> Modos:
+        """
+        Los n_modos modos de menor frecuencia (None = todos). La
+        autodescomposición se guarda en caché por (m, k, n_modos) y el
+        amortiguamiento modal (O(n·r²) al proyectarlo) por (m, k, c, n_modos).
+        """
+        n = len(self)
+        r = n if n_modos is None else int(n_modos)
+        if not 1 <= r <= n:
+            raise ValueError(f"n_modos debe estar entre 1 y {n}.")
+
+        def calcular():
+            with perfil.etapa("modos_cadena"):
+                raiz_m = np.sqrt(self.m)
+                diag, sub = self.K
+                lam, V = _modos_tridiagonal(diag / self.m, sub / (raiz_m[:-1] * raiz_m[1:]), r)
+                return np.sqrt(lam), V / raiz_m[:, None]
+
+        w, phi = _modos.obtener_o_calcular((self.clave(), r), calcular)
+
+        def proyectar():
+            c_modal = phi.T @ _producto(*self.C, phi)
+            return c_modal, np.diag(c_modal) / (2 * w)
+
+        c_modal, zeta = _modos.obtener_o_calcular((self.clave(), self.clave_amortiguamiento(), r), proyectar)
+        return Modos(w=w, phi=phi, zeta=zeta, c_modal=c_modal)
+
+    def estatica(self, f: ArrayLike) -> np.ndarray:
+        """Deflexión estática x = K⁻¹·f (m) para fuerzas f (N) por masa."""
+        f = np.broadcast_to(np.asarray(f, dtype=np.float64), self.m.shape)
+        return _resolver(*self.K, f)
+
+    # ----------------------------------------------------------
+    def simular(
+        self,
+        t: np.ndarray,
+        x0: ArrayLike = 0.0,
+        v0: ArrayLike = 0.0,
+        f: Optional[ArrayLike] = None,
+        n_modos: Optional[int] = None,
+        metodo: str = "modal",
+        gdl: Optional[Union[int, Sequence[int], slice]] = None,
+    ) -> np.ndarray:
+        """
+        Respuesta x(t) (m) por superposición de los n_modos modos menores
+        (None = todos hasta _N_DENSO masas y los _MODOS_SIMULACION menores
+        en cadenas más largas).
+
+        t: array 1-D de tiempos (s) desde el estado inicial en t = 0; con
+        metodo="implicito" debe ser uniforme y empezar en 0.
+        x0, v0: estado inicial por masa (escalar o (n,)).
+        f: fuerza constante por masa (N), p. ej. el peso m·g (None = libre).
+        gdl: masas cuya respuesta se devuelve (None = todas); con cadenas
+        largas evita formar la matriz (n, T) completa.
+
+        Devuelve un array (g, T), con g el número de masas pedidas ((T,) si
+        gdl es un entero).
+        """
+        if metodo not in METODOS:
+            raise ValueError(f"metodo debe ser uno de {METODOS}, no {metodo!r}.")
+        t = np.asarray(t, dtype=np.float64)
+        if t.ndim != 1:
+            raise ValueError("t debe ser un array 1-D.")
+        x0 = np.broadcast_to(np.asarray(x0, dtype=np.float64), self.m.shape)
+        v0 = np.broadcast_to(np.asarray(v0, dtype=np.float64), self.m.shape)
+        x_est = np.zeros(len(self)) if f is None else self.estatica(f)
+        filas = slice(None) if gdl is None else gdl
+
+        with perfil.etapa("simulacion_cadena"):
+            if n_modos is None and len(self) > _N_DENSO:
+                n_modos = _MODOS_SIMULACION
+            md = self.modos(n_modos)
+            # Coordenadas modales iniciales: q = Φᵀ·M·(x - x_est)
+            q0 = md.phi.T @ (self.m * (x0 - x_est))
+            qd0 = md.phi.T @ (self.m * v0)
+            if metodo == "modal":
+                q = respuesta.respuesta_libre(1.0, md.w**2, 2 * md.zeta * md.w, t, q0, qd0)
+            else:
+                q = _newmark(md, t, q0, qd0)
+            x = md.phi[filas] @ q
+            return x + np.asarray(x_est[filas])[..., None]
+
+
+def _newmark(md: Modos, t: np.ndarray, q0: np.ndarray, qd0: np.ndarray) -> np.ndarray:
+    """
+    q'' + Cm·q' + Ω²·q = 0 con Newmark de aceleración media (β = 1/4, γ = 1/2).
+    El paso es lineal y constante: s_{i+1} = P·s_i con s = (q, q', q''),
+    así que P se arma una vez y cada paso es un producto (3r × 3r).
+    """
+    if len(t) < 2:
+        return q0[:, None].copy()
+    dt = t[1] - t[0]
+    if t[0] != 0 or dt <= 0 or not np.allclose(np.diff(t), dt, rtol=1e-9, atol=0):
+        raise ValueError("Con metodo='implicito', t debe ser uniforme y empezar en 0.")
+
+    r = len(md)
+    I, Z = np.eye(r), np.zeros((r, r))
+    Cm, K2 = md.c_modal, np.diag(md.w**2)
+    a0, a1 = 4 / dt**2, 2 / dt
+    inv = np.linalg.inv(K2 + a1 * Cm + a0 * I)
+    # q_{i+1} = inv·(a0·q + (4/dt)·q' + q'' + Cm·(a1·q + q'))
+    Pq = np.hstack((inv @ (a0 * I + a1 * Cm), inv @ ((4 / dt) * I + Cm), inv))
+    # q'_{i+1} = a1·(q_{i+1} - q) - q';  q''_{i+1} = a0·(q_{i+1} - q) - (4/dt)·q' - q''
+    dq = Pq - np.hstack((I, Z, Z))
+    Pv = a1 * dq - np.hstack((Z, I, Z))
+    Pa = a0 * dq - np.hstack((Z, (4 / dt) * I, I))
+    P = np.vstack((Pq, Pv, Pa))
+
+    s = np.concatenate((q0, qd0, -(Cm @ qd0 + md.w**2 * q0)))
+    q = np.empty((r, len(t)))
+    q[:, 0] = q0
+    for i in range(1, len(t)):
+        s = P @ s
+        q[:, i] = s[:r]
+    return q
@@ -0,0 +1,233 @@
+import hashlib
+import os
+import tempfile
+import threading
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+import perfil
+
+
+# ==========================================================
+#  CONSTANTES DE LOS CATÁLOGOS
+# ==========================================================
+ARCHIVO_RESORTES = "Resortes_resoil.xlsx"
+ARCHIVO_ACEITES = "Aceites_resoil.xlsx"
+
+LBIN_A_NM = 175.1268  # lb/in → N/m
+IN_A_M = 0.0254  # in → m
+
+# Columna del Excel → (columna del catálogo, factor de conversión a SI)
+COLUMNAS_RESORTES = {
+    "[Y] Constante elástica (lbs/in)": ("k_Nm", LBIN_A_NM),
+    "[Y] Longitud libre (in)": ("long_libre", IN_A_M),
+    "[Y] Deflexión máxima (in)": ("def_max", IN_A_M),
+    "[Y] Diámetro interior (in)": ("dm_in", IN_A_M),
+    "[Y] Diámetro exterior (in)": ("dm_ex", IN_A_M),
+}
+COLUMNAS_ACEITES = {
+    "Densidad (g/cm³)": ("densidad", 1.0),
+    "Visc_40 (mm²/s)": ("Visc_40", 1.0),
+    "Visc_100 (mm²/s)": ("Visc_100", 1.0),
+}
+
+# Versión del formato de la caché; cambiarla invalida todas las cachés.
+_FORMATO_CACHE = 1
+_SUFIJO_CACHE = ".cache.npz"
+
+# Catálogos ya cargados en este proceso: (ruta, clave) → Catalogo
+_en_memoria: Dict[Tuple[str, str], "Catalogo"] = {}
+# Serializa las cargas (p. ej. la precarga en segundo plano y la de un clic):
+# la segunda espera y reutiliza la copia en memoria en vez de leer otra vez
+_candado_carga = threading.Lock()
+
+
+# ==========================================================
+#  CLASE: CATALOGO
+# ==========================================================
+class Catalogo:
+    """
+    Catálogo en forma de columnas NumPy tipadas (una por campo).
+
+    Campos:
+      - columnas: dict nombre → np.ndarray (todas con la misma longitud)
+      - version: identificador del contenido del archivo de origen (hash sha256)
+      - ruta: archivo de origen
+
+    Las columnas numéricas están en SI (k en N/m, longitudes en m) salvo
+    las viscosidades (mm²/s) y la densidad (g/cm³), que se dejan como en el
+    catálogo. La columna "nombre" contiene la identificación de cada fila.
+    """
+
+    def __init__(self, columnas: Dict[str, np.ndarray], version: str, ruta: str) -> None:
+        longitudes = {len(v) for v in columnas.values()}
+        if len(longitudes) > 1:
+            raise ValueError("Todas las columnas del catálogo deben tener la misma longitud.")
+
+        self.columnas = columnas
+        self.version = version
+        self.ruta = ruta
+
+    def __getitem__(self, nombre: str) -> np.ndarray:
+        return self.columnas[nombre]
+
+    def __contains__(self, nombre: str) -> bool:
+        return nombre in self.columnas
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columnas.values()), ()))
+
+    def fila(self, i: int) -> Dict[str, object]:
+        """
+        Devuelve la fila i como diccionario (útil para mostrar la selección).
+        """
+        return {nombre: col[i].item() for nombre, col in self.columnas.items()}
+
+
+# ----------------------------------------------------------
+def _ruta_cache(ruta: str, clave: str = "") -> str:
+    base, _ = os.path.splitext(ruta)
+    if clave:  # otra forma de leer el mismo archivo: otra caché
+        base += "." + hashlib.sha256(clave.encode()).hexdigest()[:12]
+    return base + _SUFIJO_CACHE
+
+
+def _firma(ruta: str) -> np.ndarray:
+    """
+    Firma barata del archivo (mtime en ns y tamaño) para detectar cambios sin leerlo.
+    """
+    st = os.stat(ruta)
+    return np.array([st.st_mtime_ns, st.st_size], dtype=np.int64)
+
+
+def _hash(ruta: str) -> str:
+    h = hashlib.sha256()
+    with open(ruta, "rb") as f:
+        for bloque in iter(lambda: f.read(1 << 20), b""):
+            h.update(bloque)
+    return h.hexdigest()
+
+
+def _version(ruta: str, clave: str) -> str:
+    """Hash del contenido; con clave, combinado con ella (mismo archivo leído de otra forma)."""
+    h = _hash(ruta)
+    return h if not clave else hashlib.sha256((h + clave).encode()).hexdigest()
+
+
+def _leer_excel(ruta: str, columnas: Dict[str, tuple], col_nombre: str) -> Dict[str, np.ndarray]:
+    """
+    Lee el Excel (lo único costoso) y lo convierte en columnas float64 en SI.
+    Las filas sin valor en la primera columna numérica se descartan.
+    """
+    import pandas as pd  # import diferido: sólo hace falta si no hay caché
+
+    with perfil.etapa("lectura_excel"):
+        df = pd.read_excel(ruta, usecols=[col_nombre, *columnas])
+    with perfil.etapa("conversion_si"):
+        clave = next(iter(columnas))
+        df = df[df[clave].notna()]
+
+        salida = {"nombre": df[col_nombre].astype(str).to_numpy(dtype=np.str_)}
+        for col_excel, (nombre, factor) in columnas.items():
+            salida[nombre] = df[col_excel].to_numpy(dtype=np.float64) * factor
+    return salida
+
+
+def cargar_fuente(ruta: str, leer: Callable[[str], Dict[str, np.ndarray]], clave: str = "") -> Catalogo:
+    """
+    Devuelve el catálogo de `ruta`, usando (en orden) la copia en memoria,
+    la caché .npz junto al archivo o, si ambas están desactualizadas,
+    leer(ruta), que devuelve las columnas ya convertidas.
+
+    clave identifica la forma de leer el archivo (p. ej. el esquema de
+    columnas de ingesta.py): con otra clave se usa otra caché.
+
+    La caché se invalida por mtime/tamaño; si estos cambian pero el hash del
+    contenido coincide (p. ej. el archivo sólo fue copiado) se reutiliza igual.
+
+    Es segura entre hilos: las cargas se hacen de a una y la caché se escribe
+    en un temporal que luego la reemplaza, así que nunca se lee a medias.
+    """
+    ruta = os.path.abspath(ruta)
+    firma = _firma(ruta)
+
+    previo = _en_memoria.get((ruta, clave))
+    if previo is not None and np.array_equal(previo._firma, firma):
+        return previo
+    with _candado_carga:
+        previo = _en_memoria.get((ruta, clave))  # quizá la cargó otro hilo mientras se esperaba
+        if previo is not None and np.array_equal(previo._firma, firma):
+            return previo
+        return _cargar_fuente(ruta, firma, leer, clave)
+
+
+def _cargar_fuente(ruta: str, firma: np.ndarray, leer: Callable[[str], Dict[str, np.ndarray]], clave: str) -> Catalogo:
+    ruta_cache = _ruta_cache(ruta, clave)
+    datos: Optional[Dict[str, np.ndarray]] = None
+    version = None
+    guardar = True
+    if os.path.exists(ruta_cache):
+        try:
+            with np.load(ruta_cache, allow_pickle=False) as npz:
+                if int(npz["_formato"]) == _FORMATO_CACHE:
+                    version = str(npz["_hash"])
+                    misma_firma = np.array_equal(npz["_firma"], firma)
+                    if misma_firma or version == _version(ruta, clave):
+                        datos = {k: npz[k] for k in npz.files if not k.startswith("_")}
+                        guardar = not misma_firma
+        except (OSError, KeyError, ValueError):
+            datos = None  # caché corrupta o de otro formato: se regenera
+
+    if datos is None:
+        datos = leer(ruta)
+        version = _version(ruta, clave)
+    if guardar:
+        _guardar_cache(ruta_cache, firma, version, datos)
+
+    cat = Catalogo(datos, version, ruta)
+    cat._firma = firma
+    _en_memoria[(ruta, clave)] = cat
+    return cat
+
+
+def _guardar_cache(ruta_cache: str, firma: np.ndarray, version: str, datos: Dict[str, np.ndarray]) -> None:
+    """Escribe la caché en un temporal del mismo directorio y lo renombra encima (atómico)."""
+    try:
+        fd, temporal = tempfile.mkstemp(dir=os.path.dirname(ruta_cache), suffix=".tmp")
+    except OSError:
+        return  # directorio de sólo lectura: se trabaja sin caché en disco
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, _formato=np.int64(_FORMATO_CACHE), _firma=firma, _hash=np.str_(version), **datos)
+        os.replace(temporal, ruta_cache)
+    except OSError:
+        try:
+            os.remove(temporal)
+        except OSError:
+            pass
+
+
+def _cargar(ruta: str, columnas: Dict[str, tuple], col_nombre: str) -> Catalogo:
+    return cargar_fuente(ruta, lambda r: _leer_excel(r, columnas, col_nombre))
+
+
+# ==========================================================
+#  API PÚBLICA
+# ==========================================================
+def cargar_resortes(ruta: str = ARCHIVO_RESORTES) -> Catalogo:
+    """
+    Catálogo de resortes con columnas: nombre, k_Nm (N/m), long_libre, def_max,
+    dm_in, dm_ex (m).
+    """
+    with perfil.etapa("carga"):
+        return _cargar(ruta, COLUMNAS_RESORTES, "Modelo")
+
+
+def cargar_aceites(ruta: str = ARCHIVO_ACEITES) -> Catalogo:
+    """
+    Catálogo de aceites con columnas: nombre, densidad (g/cm³),
+    Visc_40 y Visc_100 (mm²/s).
+    """
+    with perfil.etapa("carga"):
+        return _cargar(ruta, COLUMNAS_ACEITES, "Producto")
@@ -0,0 +1,326 @@
+"""
+Punto de entrada sin interfaz gráfica (sin Tk ni matplotlib).
+
+Uso:
+    python -m resoil select --wn 100 --m 2 --A0 0.01
+    python -m resoil optimize --wn 100 --m 2
+    python -m resoil optimize --wn 100 --m 2 --completo   (frente de todo el catálogo)
+    python -m resoil inverse --wn 100 --m 2 --alpha-min 2 --alpha-max 8
+    python -m resoil batch < puntos.csv          (columnas wn,m[,A0])
+    python -m resoil batch --formato jsonl < puntos.jsonl
+    python -m resoil batch --almacen resultados.db < puntos.csv   (reutiliza y guarda resultados)
+    python -m resoil serve --port 8765              (servicio HTTP, ver servicio.py)
+
+La salida es JSON (select/optimize/inverse) o una línea JSON por punto (batch).
+"""
+import argparse
+import csv
+import json
+import logging
+import sqlite3
+import sys
+from typing import Dict, Iterable, List, Optional, TextIO
+
+import numpy as np
+
+import almacen
+import catalogo
+import ingesta
+import inverso
+import main
+import perfil
+import seleccion
+from restricciones import Limites
+
+
+# ----------------------------------------------------------
+def _resorte(resortes, i: int) -> main.Resorte:
+    f = resortes.fila(i)
+    return main.Resorte(f["nombre"], f["k_Nm"], f["long_libre"], f["def_max"], f["dm_in"], f["dm_ex"])
+
+
+def _amortiguador(aceites, i: int) -> main.Amortiguador:
+    f = aceites.fila(i)
+    return main.Amortiguador(f["nombre"], f["densidad"], f["Visc_40"], f["Visc_100"])
+
+
+def _registro(res, j, resorte: main.Resorte, amort: main.Amortiguador) -> Dict[str, object]:
+    """
+    Diccionario serializable con el resultado del punto j.
+    ζ se recalcula con Amortiguador.relacion_amortiguamiento como comprobación.
+    """
+    m = float(res.m[j])
+    c = float(res.c[j])
+    w_d = float(res.w_d[j])
+    return {
+        "resorte": resorte.nombre,
+        "aceite": amort.nombre,
+        "k_Nm": resorte.k,
+        "c": c,
+        "omega_n": resorte.omega_natural(m),
+        "f_n_Hz": resorte.frec_natural(m),
+        "zeta": amort.relacion_amortiguamiento(m, resorte.k, c),
+        "omega_d": None if w_d != w_d else w_d,  # NaN → null (ζ >= 1)
+    }
+
+
+def _cargar(args):
+    esq_r = ingesta.Esquema.desde_json(args.esquema_resortes) if args.esquema_resortes else None
+    esq_a = ingesta.Esquema.desde_json(args.esquema_aceites) if args.esquema_aceites else None
+    return ingesta.cargar_resortes(args.resortes, esq_r), ingesta.cargar_aceites(args.aceites, esq_a)
+
+
+def _limites(args) -> Optional[Limites]:
+    """Límites pedidos en la línea de comandos, o None si no se pidió ninguno."""
+    geometria = (args.d_alojamiento, args.d_vastago, args.long_max)
+    if not args.restringir and all(v is None for v in geometria):
+        return None
+    return Limites(args.restringir, *geometria)
+
+
+_SIN_RESORTE = "Ningún resorte del catálogo cumple las restricciones."
+
+
+# ==========================================================
+#  SUBCOMANDOS
+# ==========================================================
+def _seleccionar(args, wn, m, A0, resortes, aceites):
+    """seleccionar_lote, o Almacen.seleccionar (reutiliza y guarda) si se pidió --almacen."""
+    if args.almacen is None:
+        return seleccion.seleccionar_lote(wn, m, A0, resortes, aceites, args.alpha, args.zeta, _limites(args))
+    with almacen.Almacen(args.almacen) as alm:
+        return alm.seleccionar(wn, m, A0, resortes, aceites, args.alpha, args.zeta, _limites(args))
+
+
+def _cmd_select(args, salida: TextIO) -> int:
+    resortes, aceites = _cargar(args)
+    res = _seleccionar(args, [args.wn], [args.m], [args.A0], resortes, aceites)
+    if res.i_resorte[0] < 0:
+        raise ValueError(_SIN_RESORTE)
+    reg = {"wn": args.wn, "m": args.m, "A0": args.A0}
+    reg.update(
+        _registro(
+            res, 0, _resorte(resortes, int(res.i_resorte[0])), _amortiguador(aceites, int(res.i_aceite[0]))
+        )
+    )
+    json.dump(reg, salida, ensure_ascii=False)
+    salida.write("\n")
+    return 0
+
+
+def _cmd_optimize(args, salida: TextIO) -> int:
+    resortes, aceites = _cargar(args)
+    tol_w = np.inf if args.completo else args.tol_w
+    res = seleccion.optimizar_par(
+        args.wn, args.m, resortes, aceites, args.alpha, args.zeta, args.peso_w, args.peso_z, tol_w
+    )
+    frente: List[Dict[str, object]] = []
+    for j in range(min(len(res), args.n)):
+        reg = _registro(
+            res, j, _resorte(resortes, int(res.i_resorte[j])), _amortiguador(aceites, int(res.i_aceite[j]))
+        )
+        reg.update(err_w=float(res.err_w[j]), err_z=float(res.err_z[j]), costo=float(res.costo[j]))
+        frente.append(reg)
+    # El frente sólo cubre los resortes con err_w <= tol_w (ventana final de la búsqueda)
+    ventana = None if args.completo else float(res.tol_w[0])
+    json.dump({"wn": args.wn, "m": args.m, "tol_w": ventana, "frente": frente}, salida, ensure_ascii=False)
+    salida.write("\n")
+    return 0
+
+
+def _cmd_inverse(args, salida: TextIO) -> int:
+    resortes, aceites = _cargar(args)
+    diseno = inverso.DisenoInverso([args.wn], [args.m], resortes, aceites, args.viscosidad, _limites(args))
+    banda = None if args.zeta_min is None and args.zeta_max is None else (
+        args.zeta if args.zeta_min is None else args.zeta_min,
+        args.zeta if args.zeta_max is None else args.zeta_max,
+    )
+    # --alpha (la geometría actual) desempata entre aceites que alcanzan ζ exactamente
+    alpha_pref = args.alpha if args.viscosidad == "cinematica" else None
+    res = diseno.resolver(args.zeta, banda, args.alpha_min, args.alpha_max, alpha_pref)
+    if res.i_resorte[0] < 0:
+        raise ValueError(_SIN_RESORTE)
+    reg = {"wn": args.wn, "m": args.m}
+    reg.update(
+        _registro(
+            res, 0, _resorte(resortes, int(res.i_resorte[0])), _amortiguador(aceites, int(res.i_aceite[0]))
+        )
+    )
+    reg.update(alpha=float(res.alpha[0]), en_banda=bool(res.en_banda[0]))
+    json.dump(reg, salida, ensure_ascii=False)
+    salida.write("\n")
+    return 0
+
+
+def _leer_puntos(entrada: TextIO, formato: str) -> Iterable[Dict[str, str]]:
+    if formato == "csv":
+        return csv.DictReader(entrada)
+    return (json.loads(linea) for linea in entrada if linea.strip())
+
+
+def _cmd_batch(args, entrada: TextIO, salida: TextIO) -> int:
+    wn, m, A0 = [], [], []
+    for p in _leer_puntos(entrada, args.formato):
+        wn.append(float(p.get("wn", p.get("w_n"))))
+        m.append(float(p["m"]))
+        a0 = p.get("A0")
+        A0.append(float("nan") if a0 in (None, "") else float(a0))
+    if not wn:
+        return 0
+
+    resortes, aceites = _cargar(args)
+    res = _seleccionar(args, np.array(wn), np.array(m), np.array(A0), resortes, aceites)
+
+    # Un objeto Resorte/Amortiguador por fila distinta del catálogo, no por punto
+    objs_r = {int(i): _resorte(resortes, int(i)) for i in np.unique(res.i_resorte) if i >= 0}
+    objs_a = {int(i): _amortiguador(aceites, int(i)) for i in np.unique(res.i_aceite) if i >= 0}
+    for j in range(len(res)):
+        reg = {"wn": wn[j], "m": m[j], "A0": None if A0[j] != A0[j] else A0[j]}
+        if res.i_resorte[j] < 0:
+            reg.update(resorte=None, aceite=None, error=_SIN_RESORTE)
+        else:
+            reg.update(_registro(res, j, objs_r[int(res.i_resorte[j])], objs_a[int(res.i_aceite[j])]))
+        salida.write(json.dumps(reg, ensure_ascii=False))
+        salida.write("\n")
+    return 0
+
+
+# ==========================================================
+#  PARSER
+# ==========================================================
+def _cmd_serve(args) -> int:
+    import asyncio
+
+    import servicio  # sólo hace falta para este subcomando
+
+    async def correr() -> None:
+        resortes, aceites = _cargar(args)
+        srv = servicio.Servicio(resortes, aceites, args.alpha, args.zeta, args.max_lote, args.espera_ms / 1e3)
+        servidor = await servicio.servir(srv, args.host, args.port, args.unix)
+        donde = args.unix or f"http://{args.host}:{args.port}"
+        print(f"Sirviendo en {donde} ({len(resortes)} resortes, {len(aceites)} aceites)", file=sys.stderr)
+        async with servidor:
+            await servidor.serve_forever()
+
+    try:
+        asyncio.run(correr())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def _parser() -> argparse.ArgumentParser:
+    comun = argparse.ArgumentParser(add_help=False)
+    comun.add_argument(
+        "--resortes", default=catalogo.ARCHIVO_RESORTES, help="catálogo de resortes (.xlsx, .csv, .parquet, .db)"
+    )
+    comun.add_argument("--aceites", default=catalogo.ARCHIVO_ACEITES, help="catálogo de aceites")
+    comun.add_argument("--esquema-resortes", default=None, help="JSON con columnas y unidades (ver ingesta.py)")
+    comun.add_argument("--esquema-aceites", default=None, help="JSON con columnas y unidades (ver ingesta.py)")
+    comun.add_argument("--alpha", type=float, default=seleccion.ALPHA, help="factor geométrico del amortiguador")
+    comun.add_argument("--zeta", type=float, default=seleccion.ZETA_OBJ, help="ζ objetivo")
+    comun.add_argument(
+        "--perfil", metavar="RUTA", default=None,
+        help="medir tiempos y memoria por etapa: líneas JSON en RUTA ('-' = log en stderr)",
+    )
+
+    parser = argparse.ArgumentParser(prog="python -m resoil", description="Selección de resorte y aceite sin interfaz.")
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    # Restricciones del resorte (select, inverse y batch)
+    restr = argparse.ArgumentParser(add_help=False)
+    restr.add_argument(
+        "--restringir", action="store_true", help="exigir m·g/k + A0 <= deflexión máxima del resorte"
+    )
+    restr.add_argument("--d-alojamiento", type=float, default=None, help="diámetro del alojamiento (m)")
+    restr.add_argument("--d-vastago", type=float, default=None, help="diámetro del vástago o guía (m)")
+    restr.add_argument("--long-max", type=float, default=None, help="longitud libre máxima (m)")
+
+    # Almacén de resultados (select y batch)
+    hist = argparse.ArgumentParser(add_help=False)
+    hist.add_argument(
+        "--almacen", metavar="RUTA", default=None,
+        help="almacén SQLite de resultados: reutiliza los puntos ya guardados y guarda los nuevos",
+    )
+
+    p = sub.add_parser("select", parents=[comun, restr, hist], help="seleccionar para un punto de diseño")
+    p.add_argument("--wn", type=float, required=True, help="frecuencia natural objetivo (rad/s)")
+    p.add_argument("--m", type=float, required=True, help="masa (kg)")
+    p.add_argument("--A0", type=float, default=0.0, help="amplitud inicial (m)")
+
+    p = sub.add_parser(
+        "optimize",
+        parents=[comun],
+        help="frente de Pareto resorte × aceite (sólo resortes con err_w <= tol_w, salvo --completo)",
+    )
+    p.add_argument("--wn", type=float, required=True, help="frecuencia natural objetivo (rad/s)")
+    p.add_argument("--m", type=float, required=True, help="masa (kg)")
+    p.add_argument("--peso-w", type=float, default=1.0, help="peso del error en ω_n")
+    p.add_argument("--peso-z", type=float, default=1.0, help="peso del error en ζ")
+    p.add_argument(
+        "--tol-w", type=float, default=0.1,
+        help="ventana inicial de err_w; se amplía si un resorte de fuera podría ganar (el JSON da la final)",
+    )
+    p.add_argument("--completo", action="store_true", help="frente de todo el catálogo (tol_w = inf; JSON: tol_w null)")
+    p.add_argument("-n", type=int, default=10, help="número máximo de pares a mostrar")
+
+    p = sub.add_parser("inverse", parents=[comun, restr], help="aceite y alpha para el ζ objetivo")
+    p.add_argument("--wn", type=float, required=True, help="frecuencia natural objetivo (rad/s)")
+    p.add_argument("--m", type=float, required=True, help="masa (kg)")
+    p.add_argument("--zeta-min", type=float, default=None, help="límite inferior de la banda de ζ")
+    p.add_argument("--zeta-max", type=float, default=None, help="límite superior de la banda de ζ")
+    p.add_argument("--alpha-min", type=float, default=None, help=f"alpha mínimo fabricable ({inverso.ALPHA_MIN})")
+    p.add_argument("--alpha-max", type=float, default=None, help=f"alpha máximo fabricable ({inverso.ALPHA_MAX})")
+    p.add_argument(
+        "--viscosidad", choices=("cinematica", "dinamica"), default="cinematica",
+        help="c = alpha·Visc_40 (cinemática) o c = alpha·ν·ρ (dinámica, alpha en m)",
+    )
+
+    p = sub.add_parser("batch", parents=[comun, restr, hist], help="seleccionar para puntos leídos de stdin")
+    p.add_argument("--formato", choices=("csv", "jsonl"), default="csv", help="formato de la entrada")
+
+    p = sub.add_parser("serve", parents=[comun], help="servicio HTTP local con micro-lotes")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8765)
+    p.add_argument("--unix", default=None, help="ruta de un socket Unix (en vez de TCP)")
+    p.add_argument("--max-lote", type=int, default=4096, help="puntos máximos por evaluación")
+    p.add_argument("--espera-ms", type=float, default=0.0, help="espera para llenar un lote (ms)")
+
+    return parser
+
+
+def main_cli(
+    argv: Optional[List[str]] = None, entrada: Optional[TextIO] = None, salida: Optional[TextIO] = None
+) -> int:
+    """
+    Ejecuta la línea de comandos; devuelve el código de salida.
+    Por defecto lee de sys.stdin y escribe en sys.stdout.
+    """
+    args = _parser().parse_args(argv)
+    entrada = sys.stdin if entrada is None else entrada
+    salida = sys.stdout if salida is None else salida
+    if args.perfil == "-":
+        logging.basicConfig(level=logging.INFO, format="%(name)s %(message)s")
+        perfil.activar(perfil.SumideroLog(), memoria=True)
+    elif args.perfil:
+        perfil.activar(perfil.SumideroJSON(args.perfil), memoria=True)
+    try:
+        if args.comando == "select":
+            return _cmd_select(args, salida)
+        if args.comando == "optimize":
+            return _cmd_optimize(args, salida)
+        if args.comando == "inverse":
+            return _cmd_inverse(args, salida)
+        if args.comando == "serve":
+            return _cmd_serve(args)
+        return _cmd_batch(args, entrada, salida)
+    except (ValueError, KeyError, OSError, sqlite3.Error) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if args.perfil:
+            perfil.desactivar()
+
+
+if __name__ == "__main__":
+    sys.exit(main_cli())
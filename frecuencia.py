@@ -0,0 +1,269 @@
+"""
+Respuesta en frecuencia de sistemas masa-resorte-amortiguador.
+
+    m·x'' + c·x' + k·x = f(t)
+
+  - receptancia:      H(jω) = X/F = 1 / (k - m·ω² + j·c·ω)                 (m/N)
+  - transmisibilidad: T(jω) = (k + j·c·ω) / (k - m·ω² + j·c·ω)              (adimensional)
+
+La transmisibilidad es la que interesa para comparar aisladores: fuerza (o
+movimiento) transmitida a la base por unidad de excitación.
+
+Todo se evalúa para S sistemas a la vez (m, k, c escalares o arrays 1-D) sobre
+una malla de frecuencias compartida (N,) o propia de cada sistema (S, N). La
+malla adaptativa concentra puntos alrededor de ω_n, con un ancho proporcional
+a ζ, en vez de usar una malla uniforme densa en todo el rango.
+"""
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+import main
+from seleccion import ResultadoSeleccion
+
+ArrayLike = Union[float, np.ndarray]
+
+TIPOS = ("receptancia", "transmisibilidad")
+
+
+# ----------------------------------------------------------
+def _sistemas(m: ArrayLike, k: ArrayLike, c: ArrayLike) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    m, k, c = np.broadcast_arrays(*(np.atleast_1d(np.asarray(a, dtype=np.float64)) for a in (m, k, c)))
+    if m.ndim != 1:
+        raise ValueError("m, k y c deben ser escalares o arrays 1-D (uno por sistema).")
+    if np.any(m <= 0) or np.any(k <= 0):
+        raise ValueError("masa (kg) y k (N/m) deben ser > 0.")
+    if np.any(c < 0):
+        raise ValueError("c (N·s/m) debe ser >= 0.")
+    return m, k, c
+
+
+def _tipo(tipo: str) -> str:
+    if tipo not in TIPOS:
+        raise ValueError(f"tipo debe ser uno de {TIPOS}, no {tipo!r}.")
+    return tipo
+
+
+def sistema(
+    resorte: main.Resorte, amortiguador: main.Amortiguador, masa: ArrayLike, factor: ArrayLike = 1.0
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    (m, k, c) a partir de objetos main.Resorte / main.Amortiguador (o de
+    bancos.BancoResortes / BancoAmortiguadores), con
+    c = Amortiguador.coef_amortiguamiento(masa, k, factor).
+    """
+    k = resorte.k
+    c = amortiguador.coef_amortiguamiento(masa, k, factor)
+    return _sistemas(masa, k, c)
+
+
+def sistema_seleccion(res: ResultadoSeleccion) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(m, k, c) de una selección por catálogo (c = alpha·Visc_40)."""
+    return _sistemas(res.m.ravel(), res.k.ravel(), res.c.ravel())
+
+
+# ==========================================================
+#  MALLA DE FRECUENCIAS
+# ==========================================================
+def malla_adaptativa(
+    m: ArrayLike,
+    k: ArrayLike,
+    c: ArrayLike,
+    w_min: Optional[ArrayLike] = None,
+    w_max: Optional[ArrayLike] = None,
+    n_base: int = 100,
+    n_fino: int = 100,
+    ancho: float = 5.0,
+) -> np.ndarray:
+    """
+    Malla (S, n_base + n_fino) de frecuencias (rad/s), ordenada por fila:
+      - n_base puntos logarítmicos en [w_min, w_max]
+        (por defecto [ω_n/100, 100·ω_n] de cada sistema)
+      - n_fino puntos logarítmicos en [ω_n/(1 + ancho·ζ), ω_n·(1 + ancho·ζ)]
+
+    El ancho de banda de media potencia es ≈ 2·ζ·ω_n, así que la zona fina
+    cubre el pico con la misma resolución relativa para cualquier ζ.
+    """
+    m, k, c = _sistemas(m, k, c)
+    if n_base < 2 or n_fino < 2:
+        raise ValueError("n_base y n_fino deben ser >= 2.")
+    w_n = np.sqrt(k / m)
+    zeta = c / (2 * np.sqrt(m * k))
+
+    lo = w_n / 100 if w_min is None else np.broadcast_to(np.asarray(w_min, dtype=np.float64), w_n.shape)
+    hi = w_n * 100 if w_max is None else np.broadcast_to(np.asarray(w_max, dtype=np.float64), w_n.shape)
+    if np.any(lo <= 0) or np.any(hi <= lo):
+        raise ValueError("Se necesita 0 < w_min < w_max.")
+    rel = 1 + np.maximum(ancho * zeta, 1e-3)  # ζ = 0: banda mínima en vez de un solo punto
+
+    u_base = np.linspace(0.0, 1.0, n_base)[None, :]
+    u_fino = np.linspace(-1.0, 1.0, n_fino)[None, :]
+    w = np.concatenate(
+        (lo[:, None] * (hi / lo)[:, None] ** u_base, w_n[:, None] * rel[:, None] ** u_fino), axis=1
+    )
+    w.sort(axis=1)
+    return w
+
+
+# ==========================================================
+#  CLASE: DATOS DE BODE
+# ==========================================================
+class DatosBode:
+    """
+    H(jω) compleja de S sistemas sobre la malla w.
+
+    Campos: w (S, N) o (N,), H (S, N) complejo, tipo.
+    Propiedades: mag, mag_db (20·log10|H|), fase (rad), fase_grados.
+    """
+
+    def __init__(self, w: np.ndarray, H: np.ndarray, tipo: str) -> None:
+        self.w = w
+        self.H = H
+        self.tipo = tipo
+
+    def __len__(self) -> int:
+        return self.H.shape[0]
+
+    @property
+    def mag(self) -> np.ndarray:
+        return np.abs(self.H)
+
+    @property
+    def mag_db(self) -> np.ndarray:
+        with np.errstate(divide="ignore"):
+            return 20 * np.log10(self.mag)
+
+    @property
+    def fase(self) -> np.ndarray:
+        return np.angle(self.H)
+
+    @property
+    def fase_grados(self) -> np.ndarray:
+        return np.degrees(self.fase)
+
+    def pico(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(ω, |H|) del máximo de cada fila sobre la malla evaluada."""
+        mag = self.mag
+        i = mag.argmax(axis=1)
+        filas = np.arange(len(self))
+        w = np.broadcast_to(self.w, mag.shape)
+        return w[filas, i], mag[filas, i]
+
+
+def bode(
+    m: ArrayLike,
+    k: ArrayLike,
+    c: ArrayLike,
+    w: Optional[np.ndarray] = None,
+    tipo: str = "receptancia",
+    **malla,
+) -> DatosBode:
+    """
+    Evalúa H(jω) (ver tipo) de S sistemas.
+
+    w: malla (N,) común, (S, N) por sistema, o None para malla_adaptativa
+    (los argumentos extra se pasan a ésta: w_min, w_max, n_base, n_fino, ancho).
+    """
+    m, k, c = _sistemas(m, k, c)
+    _tipo(tipo)
+    if w is None:
+        w = malla_adaptativa(m, k, c, **malla)
+    else:
+        w = np.asarray(w, dtype=np.float64)
+        if w.ndim not in (1, 2) or (w.ndim == 2 and w.shape[0] != len(m)):
+            raise ValueError("w debe tener forma (N,) o (S, N).")
+
+    ww = w if w.ndim == 2 else w[None, :]
+    jcw = 1j * c[:, None] * ww
+    den = k[:, None] - m[:, None] * ww**2 + jcw
+    with np.errstate(divide="ignore", invalid="ignore"):  # ζ = 0 en ω = ω_n
+        H = 1 / den if tipo == "receptancia" else (k[:, None] + jcw) / den
+    return DatosBode(w, H, tipo)
+
+
+# ==========================================================
+#  RESONANCIA EN FORMA CERRADA
+# ==========================================================
+class Resonancia:
+    """
+    Pico y ancho de banda de media potencia (-3 dB respecto al pico) de S sistemas.
+
+    Campos (arrays (S,)): w_pico (rad/s), pico (|H| en el pico), pico_db,
+    w_inf y w_sup (bordes de la banda; w_inf = 0 si la curva no baja 3 dB
+    por debajo del pico) y ancho_banda = w_sup - w_inf.
+    """
+
+    def __init__(self, **campos: np.ndarray) -> None:
+        self.__dict__.update(campos)
+
+    def __len__(self) -> int:
+        return int(np.size(self.w_pico))
+
+
+def resonancia(m: ArrayLike, k: ArrayLike, c: ArrayLike, tipo: str = "receptancia") -> Resonancia:
+    """
+    Pico y ancho de banda exactos, sin malla.
+
+    Con u = (ω/ω_n)² y a = 4ζ², |H|² es un cociente de polinomios en u:
+      - receptancia:      (k·|H|)² = 1 / ((1-u)² + a·u)       → pico en u = 1 - 2ζ² (o en 0)
+      - transmisibilidad: |T|²     = (1 + a·u) / ((1-u)² + a·u) → pico en u = (sqrt(1+2a) - 1)/a
+    y los bordes de la banda (|H|² = pico²/2) son las raíces de un polinomio
+    de grado 2 en u.
+    """
+    m, k, c = _sistemas(m, k, c)
+    _tipo(tipo)
+    w_n = np.sqrt(k / m)
+    zeta = c / (2 * np.sqrt(m * k))
+    a = 4 * zeta**2
+    sin_amort = zeta == 0
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if tipo == "receptancia":
+            u_pico = np.maximum(1 - a / 2, 0.0)
+            P = 1 / ((1 - u_pico) ** 2 + a * u_pico)  # pico² normalizado
+            A, B, C = np.ones_like(a), a - 2, 1 - 2 / P
+            escala = 1 / k
+        else:
+            u_pico = np.where(sin_amort, 1.0, (np.sqrt(1 + 2 * a) - 1) / a)
+            P = (1 + a * u_pico) / ((1 - u_pico) ** 2 + a * u_pico)
+            A, B, C = P, P * a - 2 * P - 2 * a, P - 2
+            escala = np.ones_like(k)
+
+        disc = np.sqrt(np.maximum(B**2 - 4 * A * C, 0.0))
+        u_sup = (-B + disc) / (2 * A)
+        u_inf = np.maximum((-B - disc) / (2 * A), 0.0)
+        w_sup = w_n * np.sqrt(u_sup)
+        w_inf = w_n * np.sqrt(u_inf)
+
+    # ζ = 0: pico infinito en ω_n y banda nula
+    w_sup = np.where(sin_amort, w_n, w_sup)
+    w_inf = np.where(sin_amort, w_n, w_inf)
+    pico = np.where(sin_amort, np.inf, escala * np.sqrt(P))
+    with np.errstate(divide="ignore"):
+        pico_db = 20 * np.log10(pico)
+
+    return Resonancia(
+        w_pico=w_n * np.sqrt(u_pico),
+        pico=pico,
+        pico_db=pico_db,
+        w_inf=w_inf,
+        w_sup=w_sup,
+        ancho_banda=w_sup - w_inf,
+    )
+
+
+# ----------------------------------------------------------
+def clasificar(
+    m: ArrayLike, k: ArrayLike, c: ArrayLike, w_exc: Optional[float] = None
+) -> np.ndarray:
+    """
+    Orden de los S sistemas como aisladores, de mejor a peor:
+      - con w_exc (rad/s): menor transmisibilidad |T| a esa frecuencia de excitación
+      - sin w_exc: menor pico de transmisibilidad (resonancia más contenida)
+    Los empates conservan el orden de entrada.
+    """
+    if w_exc is None:
+        criterio = resonancia(m, k, c, "transmisibilidad").pico
+    else:
+        criterio = bode(m, k, c, np.array([float(w_exc)]), "transmisibilidad").mag[:, 0]
+    return np.argsort(criterio, kind="stable")
@@ -0,0 +1,147 @@
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+# ----------------------------------------------------------
+def decimar_minmax(t: np.ndarray, x: np.ndarray, columnas: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce (t, x) a como mucho 2·columnas puntos conservando la envolvente:
+    la señal se parte en `columnas` tramos consecutivos y de cada uno se
+    guardan su mínimo y su máximo, en el orden en que aparecen.
+
+    Con una columna por píxel, la línea dibujada es idéntica a la de la
+    señal completa aunque ésta tenga millones de muestras.
+    """
+    t = np.asarray(t)
+    x = np.asarray(x)
+    n = len(x)
+    if columnas <= 0:
+        raise ValueError("columnas debe ser > 0.")
+    if n <= 2 * columnas:
+        return t, x
+
+    tam = -(-n // columnas)  # ceil(n / columnas)
+    n_completos = n // tam
+    # Tramos completos como vista (n_completos, tam) sin copiar; el resto aparte
+    bloques = x[: n_completos * tam].reshape(n_completos, tam)
+    base = np.arange(n_completos) * tam
+    i_min = base + bloques.argmin(axis=1)
+    i_max = base + bloques.argmax(axis=1)
+    if n_completos * tam < n:
+        resto = x[n_completos * tam :]
+        i_min = np.append(i_min, n_completos * tam + resto.argmin())
+        i_max = np.append(i_max, n_completos * tam + resto.argmax())
+
+    idx = np.empty(2 * len(i_min), dtype=np.intp)
+    idx[0::2] = np.minimum(i_min, i_max)
+    idx[1::2] = np.maximum(i_min, i_max)
+    return t[idx], x[idx]
+
+
+# ==========================================================
+#  CLASE: GRÁFICA EMBEBIDA EN TK
+# ==========================================================
+class GraficaRespuesta:
+    """
+    Gráfica x(t) embebida en un widget Tk (FigureCanvasTkAgg) que se reutiliza
+    entre selecciones: una sola Figure y una sola Line2D cuyos datos se
+    cambian con set_data.
+
+    - Los datos se diezman a una columna por píxel del eje (decimar_minmax),
+      así que redibujar cuesta lo mismo con 2 000 o con 10⁶ muestras.
+    - La línea es "animada": si los límites de los ejes no cambian sólo se
+      repinta la línea sobre el fondo guardado (blitting); si cambian, se
+      redibuja todo una vez y se vuelve a guardar el fondo.
+    - Los datos completos quedan en self.t / self.x para exportarlos.
+
+    matplotlib se importa al crear la gráfica, no al importar el módulo.
+    """
+
+    def __init__(self, master) -> None:
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+
+        self.figura = Figure(figsize=(6, 4), dpi=100)
+        self.ejes = self.figura.add_subplot(111)
+        self.ejes.set_title("Respuesta x(t)")
+        self.ejes.set_xlabel("Tiempo (s)")
+        self.ejes.set_ylabel("Desplazamiento (m)")
+        self.ejes.grid(True)
+        (self.linea,) = self.ejes.plot([], [], animated=True)
+
+        self.lienzo = FigureCanvasTkAgg(self.figura, master=master)
+        self.lienzo.get_tk_widget().pack(fill="both", expand=True)
+        self._fondo = None
+        # Tras cualquier redibujado completo (p. ej. al cambiar el tamaño) se
+        # guarda el fondo nuevo y se vuelve a pintar la línea encima.
+        self.lienzo.mpl_connect("draw_event", self._al_dibujar)
+
+        self.t: Optional[np.ndarray] = None
+        self.x: Optional[np.ndarray] = None
+
+    # ----------------------------------------------------------
+    def _columnas(self) -> int:
+        ancho = self.ejes.get_window_extent().width
+        return max(int(ancho), 1)
+
+    def _al_dibujar(self, _evento) -> None:
+        self._fondo = self.lienzo.copy_from_bbox(self.ejes.bbox)
+        if self.t is not None:
+            self.linea.set_data(*decimar_minmax(self.t, self.x, self._columnas()))
+        self.ejes.draw_artist(self.linea)
+
+    def actualizar(self, t: np.ndarray, x: np.ndarray, titulo: Optional[str] = None) -> None:
+        """Muestra (t, x) reutilizando la figura y la línea existentes."""
+        self.t = np.asarray(t)
+        self.x = np.asarray(x)
+
+        limites_x = (float(self.t[0]), float(self.t[-1])) if len(self.t) else (0.0, 1.0)
+        if len(self.x):
+            lo, hi = float(np.min(self.x)), float(np.max(self.x))
+            margen = 0.05 * (hi - lo) or 1e-12
+            limites_y = (lo - margen, hi + margen)
+        else:
+            limites_y = (-1.0, 1.0)
+
+        cambia_titulo = titulo is not None and titulo != self.ejes.get_title()
+        redibujar = self._fondo is None or cambia_titulo
+        if self.ejes.get_xlim() != limites_x or self.ejes.get_ylim() != limites_y:
+            self.ejes.set_xlim(*limites_x)
+            self.ejes.set_ylim(*limites_y)
+            redibujar = True
+        if cambia_titulo:
+            self.ejes.set_title(titulo)
+
+        if redibujar:
+            self.lienzo.draw()  # dispara _al_dibujar: fondo nuevo + línea
+        else:
+            self.lienzo.restore_region(self._fondo)
+            self.linea.set_data(*decimar_minmax(self.t, self.x, self._columnas()))
+            self.ejes.draw_artist(self.linea)
+        self.lienzo.blit(self.ejes.bbox)
+
+    # ----------------------------------------------------------
+    def guardar(self, ruta: str) -> None:
+        """
+        Exporta el resultado según la extensión:
+          - .csv / .npy: datos completos (t, x) sin diezmar
+          - otra (.png, .pdf, .svg...): la figura con la señal completa
+        """
+        if self.t is None:
+            raise ValueError("No hay resultado para guardar.")
+        ruta_min = ruta.lower()
+        if ruta_min.endswith(".csv"):
+            np.savetxt(ruta, np.column_stack((self.t, self.x)), delimiter=",",
+                       header="t_s,x_m", comments="")
+        elif ruta_min.endswith(".npy"):
+            np.save(ruta, np.vstack((self.t, self.x)))
+        else:
+            # savefig omite los artistas animados: se dibuja la línea normal un momento
+            self.linea.set_animated(False)
+            self.linea.set_data(self.t, self.x)
+            try:
+                self.figura.savefig(ruta)
+            finally:
+                self.linea.set_animated(True)
+                self.lienzo.draw()
@@ -0,0 +1,178 @@
+from typing import Tuple, Union
+
+import numpy as np
+
+import catalogo
+
+Number = Union[int, float]
+
+
+# ==========================================================
+#  CLASE: INDICE ORDENADO (genérico)
+# ==========================================================
+class IndiceOrdenado:
+    """
+    Índice sobre una columna numérica del catálogo, ordenada de menor a mayor.
+
+    Todas las consultas usan búsqueda binaria (np.searchsorted) sobre la
+    columna ordenada, por lo que cuestan O(log n) en vez de recorrer la
+    tabla completa. Los índices devueltos son siempre posiciones en la
+    columna original (las filas del catálogo), no en la copia ordenada.
+
+    Consultas:
+      - mas_cercano(q): fila con valor más cercano (acepta arrays de q)
+      - vecinos(q): filas candidatas a cada lado de q (para criterios propios)
+      - mas_cercanos(q, n): las n filas más cercanas, de mejor a peor
+      - en_rango(lo, hi): todas las filas con lo <= valor <= hi, ordenadas
+
+    Los empates se resuelven como idxmin(): gana la fila que aparece primero
+    en el catálogo. Los valores NaN se ignoran.
+    """
+
+    # Columna del catálogo usada por desde_catalogo()
+    columna = ""
+
+    def __init__(self, valores: np.ndarray) -> None:
+        valores = np.asarray(valores, dtype=np.float64)
+        if valores.ndim != 1:
+            raise ValueError("La columna del índice debe ser un array 1-D.")
+
+        validos = np.flatnonzero(~np.isnan(valores))
+        if validos.size == 0:
+            raise ValueError("El índice necesita al menos una fila con valor válido.")
+
+        # Orden estable: entre valores repetidos se conserva el orden del catálogo.
+        orden = np.argsort(valores[validos], kind="stable")
+        self.valores = valores
+        self.orden = validos[orden]
+        self.ordenado = valores[self.orden]
+
+    # ----------------------------------------------------------
+    @classmethod
+    def desde_catalogo(cls, cat: catalogo.Catalogo) -> "IndiceOrdenado":
+        """
+        Devuelve el índice de `cls.columna` en el catálogo, construyéndolo una
+        sola vez por catálogo cargado (se guarda junto al propio catálogo).
+        """
+        indices = cat.__dict__.setdefault("_indices", {})
+        indice = indices.get(cls)
+        if indice is None:
+            indice = indices[cls] = cls(cat[cls.columna])
+        return indice
+
+    @classmethod
+    def desde_ordenado(cls, valores: np.ndarray, orden: np.ndarray, ordenado: np.ndarray) -> "IndiceOrdenado":
+        """
+        Reconstruye un índice a partir de arrays ya ordenados (p. ej. en
+        memoria compartida entre procesos) sin volver a ordenar ni copiar.
+        """
+        indice = cls.__new__(cls)
+        indice.valores = valores
+        indice.orden = orden
+        indice.ordenado = ordenado
+        return indice
+
+    def asociar(self, cat: catalogo.Catalogo) -> None:
+        """Registra este índice como el de `cat` para desde_catalogo()."""
+        cat.__dict__.setdefault("_indices", {})[type(self)] = self
+
+    def __len__(self) -> int:
+        return len(self.orden)
+
+    # ----------------------------------------------------------
+    def vecinos(self, q: Union[Number, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Filas (izq, der) con el valor inmediatamente <= y >= q. Son los únicos
+        candidatos a "más cercano" para cualquier error monótono en |valor - q|.
+        En los extremos de la tabla ambas filas pueden coincidir.
+        """
+        vs = self.ordenado
+        q = np.asarray(q, dtype=np.float64)
+
+        pos = np.searchsorted(vs, q, side="left")
+        der = np.minimum(pos, len(vs) - 1)
+        izq = np.maximum(pos - 1, 0)
+        # Entre valores repetidos a la izquierda, tomar el primero del grupo.
+        izq = np.searchsorted(vs, vs[izq], side="left")
+        return self.orden[izq], self.orden[der]
+
+    # ----------------------------------------------------------
+    def mas_cercano(self, q: Union[Number, np.ndarray]) -> Union[int, np.ndarray]:
+        """
+        Fila cuyo valor está más cerca de q.
+        Si q es un array devuelve un array de filas con la misma forma.
+        """
+        fila_izq, fila_der = self.vecinos(q)
+        filas = elegir(
+            np.abs(self.valores[fila_izq] - q),
+            np.abs(self.valores[fila_der] - q),
+            fila_izq,
+            fila_der,
+        )
+        return int(filas) if filas.ndim == 0 else filas
+
+    # ----------------------------------------------------------
+    def mas_cercanos(self, q: Number, n: int) -> np.ndarray:
+        """
+        Filas de los n valores más cercanos a q, ordenadas de menor a mayor
+        error |valor - q|.
+        """
+        if n <= 0:
+            return np.empty(0, dtype=np.intp)
+        vs = self.ordenado
+        q = float(q)
+
+        # Los n mejores están como mucho n posiciones a cada lado del punto de inserción.
+        pos = int(np.searchsorted(vs, q, side="left"))
+        ini = max(pos - n, 0)
+        fin = min(pos + n, len(vs))
+        # Ampliar a grupos completos de valores repetidos para desempatar como idxmin().
+        ini = int(np.searchsorted(vs, vs[ini], side="left"))
+        fin = int(np.searchsorted(vs, vs[fin - 1], side="right"))
+
+        filas = self.orden[ini:fin]
+        err = np.abs(vs[ini:fin] - q)
+        mejores = np.lexsort((filas, err))[:n]
+        return filas[mejores]
+
+    # ----------------------------------------------------------
+    def en_rango(self, lo: Number, hi: Number) -> np.ndarray:
+        """
+        Filas de todos los valores con lo <= valor <= hi, ordenadas por valor.
+        """
+        ini = np.searchsorted(self.ordenado, float(lo), side="left")
+        fin = np.searchsorted(self.ordenado, float(hi), side="right")
+        return self.orden[ini:fin]
+
+
+# ==========================================================
+#  ÍNDICES CONCRETOS
+# ==========================================================
+class IndiceResortes(IndiceOrdenado):
+    """
+    Índice de resortes ordenado por constante elástica k_Nm (N/m).
+    """
+
+    columna = "k_Nm"
+
+
+class IndiceAceites(IndiceOrdenado):
+    """
+    Índice de aceites ordenado por viscosidad cinemática a 40 °C (mm²/s).
+
+    Como ζ = alpha·Visc_40 / (2·sqrt(m·k)) es creciente en Visc_40, el aceite
+    con ζ más cercano a un objetivo es uno de los dos vecinos de la
+    viscosidad Visc_40* = ζ_obj · 2·sqrt(m·k) / alpha.
+    """
+
+    columna = "Visc_40"
+
+
+# ----------------------------------------------------------
+def elegir(err_a: np.ndarray, err_b: np.ndarray, fila_a: np.ndarray, fila_b: np.ndarray) -> np.ndarray:
+    """
+    Elemento a elemento, la fila con menor error; en empate, la de menor
+    posición en el catálogo (igual que idxmin()).
+    """
+    usar_a = (err_a < err_b) | ((err_a == err_b) & (fila_a < fila_b))
+    return np.where(usar_a, fila_a, fila_b)
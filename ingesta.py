@@ -0,0 +1,304 @@
+"""
+Ingesta de catálogos de proveedores: Excel, CSV, Parquet y SQLite.
+
+Un Esquema declara qué columna del archivo alimenta cada campo de
+main.Resorte / main.Amortiguador y en qué unidad viene:
+
+    esquema = Esquema.resortes(
+        nombre="Part No",
+        campos={"k_Nm": ("Rate", "N/mm"), "def_max": ("Max Defl", "mm"), "dm_ex": ("OD", "mm")},
+    )
+    resortes = cargar_resortes("proveedor.csv", esquema)
+
+Los lectores recorren el archivo por bloques de tam_bloque filas, leen sólo
+las columnas del esquema y convierten cada bloque a float64 en SI antes de
+leer el siguiente, así que la memoria es la del catálogo final más un bloque.
+El resultado es un catalogo.Catalogo con la misma caché .npz que los Excel.
+
+Nuevos formatos: registrar_lector(".ext", fn), con fn(ruta, esquema,
+columnas, tam_bloque) → iterador de bloques {columna: array}.
+"""
+import json
+import os
+import sqlite3
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+import catalogo
+
+# Unidad → factor a SI (las viscosidades y la densidad se dejan en mm²/s y
+# g/cm³, como en Catalogo)
+UNIDADES: Dict[str, float] = {
+    # rigidez → N/m
+    "N/m": 1.0,
+    "N/mm": 1000.0,
+    "kN/m": 1000.0,
+    "lb/in": catalogo.LBIN_A_NM,
+    "lbs/in": catalogo.LBIN_A_NM,
+    # longitud → m
+    "m": 1.0,
+    "cm": 0.01,
+    "mm": 0.001,
+    "in": catalogo.IN_A_M,
+    # viscosidad cinemática → mm²/s
+    "mm²/s": 1.0,
+    "mm2/s": 1.0,
+    "cSt": 1.0,
+    "m²/s": 1e6,
+    "m2/s": 1e6,
+    # densidad → g/cm³
+    "g/cm³": 1.0,
+    "g/cm3": 1.0,
+    "g/ml": 1.0,
+    "kg/m³": 0.001,
+    "kg/m3": 0.001,
+}
+
+CAMPOS_RESORTES = ("k_Nm", "long_libre", "def_max", "dm_in", "dm_ex")
+CAMPOS_ACEITES = ("densidad", "Visc_40", "Visc_100")
+
+Bloque = Dict[str, np.ndarray]
+Lector = Callable[[str, "Esquema", List[str], int], Iterator[Bloque]]
+
+
+# ==========================================================
+#  CLASE: ESQUEMA
+# ==========================================================
+class Esquema:
+    """
+    Correspondencia declarativa archivo → catálogo.
+
+      - nombre: columna con la identificación de cada fila
+      - campos: campo del catálogo → (columna del archivo, unidad o factor)
+      - todos: campos que tendrá el catálogo; los no declarados quedan en NaN
+      - requerido: campo cuyas filas vacías se descartan (el primero de `todos`)
+      - tabla / consulta: origen en SQLite (consulta = SELECT propio)
+    """
+
+    def __init__(
+        self,
+        nombre: str,
+        campos: Dict[str, Tuple[str, Union[str, float]]],
+        todos: Sequence[str],
+        tabla: Optional[str] = None,
+        consulta: Optional[str] = None,
+    ) -> None:
+        self.nombre = nombre
+        self.todos = tuple(todos)
+        self.requerido = self.todos[0]
+        if self.requerido not in campos:
+            raise ValueError(f"El esquema debe declarar el campo {self.requerido!r}.")
+        desconocidos = set(campos) - set(self.todos)
+        if desconocidos:
+            raise ValueError(f"Campos desconocidos en el esquema: {sorted(desconocidos)}.")
+
+        self.campos: Dict[str, Tuple[str, float]] = {}
+        for campo, (columna, unidad) in campos.items():
+            if isinstance(unidad, str):
+                if unidad not in UNIDADES:
+                    raise ValueError(f"Unidad desconocida {unidad!r} para {campo}.")
+                factor = UNIDADES[unidad]
+            else:
+                factor = float(unidad)
+            self.campos[campo] = (columna, factor)
+        self.tabla = tabla
+        self.consulta = consulta
+
+    @classmethod
+    def resortes(cls, nombre: str, campos: Dict[str, Tuple[str, Union[str, float]]], **origen) -> "Esquema":
+        return cls(nombre, campos, CAMPOS_RESORTES, **origen)
+
+    @classmethod
+    def aceites(cls, nombre: str, campos: Dict[str, Tuple[str, Union[str, float]]], **origen) -> "Esquema":
+        return cls(nombre, campos, CAMPOS_ACEITES, **origen)
+
+    @classmethod
+    def desde_dict(cls, d: Dict[str, object]) -> "Esquema":
+        """
+        Esquema desde un dict (p. ej. leído de JSON):
+            {"tipo": "resortes" | "aceites", "nombre": "...",
+             "campos": {"k_Nm": ["Rate", "N/mm"], ...}, "tabla": "...", "consulta": "..."}
+        """
+        tipos = {"resortes": CAMPOS_RESORTES, "aceites": CAMPOS_ACEITES}
+        if d.get("tipo") not in tipos:
+            raise ValueError("El esquema necesita \"tipo\": \"resortes\" o \"aceites\".")
+        campos = {campo: tuple(v) for campo, v in d["campos"].items()}
+        return cls(d["nombre"], campos, tipos[d["tipo"]], d.get("tabla"), d.get("consulta"))
+
+    @classmethod
+    def desde_json(cls, ruta: str) -> "Esquema":
+        with open(ruta, encoding="utf-8") as f:
+            return cls.desde_dict(json.load(f))
+
+    def columnas(self) -> List[str]:
+        """Columnas del archivo que hay que leer (sin repetir)."""
+        return list(dict.fromkeys([self.nombre, *(col for col, _ in self.campos.values())]))
+
+    def clave(self) -> str:
+        """Texto que identifica el esquema (para la caché del catálogo)."""
+        return json.dumps(
+            [self.nombre, sorted(self.campos.items()), self.todos, self.tabla, self.consulta], ensure_ascii=False
+        )
+
+
+def _desde_columnas(columnas: Dict[str, tuple], nombre: str, todos: Sequence[str]) -> Esquema:
+    return Esquema(nombre, {campo: (col, factor) for col, (campo, factor) in columnas.items()}, todos)
+
+
+# Esquemas de los Excel del proyecto
+ESQUEMA_RESORTES = _desde_columnas(catalogo.COLUMNAS_RESORTES, "Modelo", CAMPOS_RESORTES)
+ESQUEMA_ACEITES = _desde_columnas(catalogo.COLUMNAS_ACEITES, "Producto", CAMPOS_ACEITES)
+
+
+# ==========================================================
+#  LECTORES (un generador de bloques por formato)
+# ==========================================================
+def _tipos_pandas(esquema: Esquema) -> Dict[str, object]:
+    tipos = {col: np.float64 for col, _ in esquema.campos.values()}
+    tipos[esquema.nombre] = str
+    return tipos
+
+
+def _leer_csv(ruta: str, esquema: Esquema, columnas: List[str], tam_bloque: int) -> Iterator[Bloque]:
+    import pandas as pd  # import diferido
+
+    for df in pd.read_csv(ruta, usecols=columnas, dtype=_tipos_pandas(esquema), chunksize=tam_bloque):
+        yield {col: df[col].to_numpy() for col in columnas}
+
+
+def _leer_excel(ruta: str, esquema: Esquema, columnas: List[str], tam_bloque: int) -> Iterator[Bloque]:
+    import pandas as pd  # import diferido
+
+    # openpyxl no permite leer por bloques: un solo bloque con las columnas pedidas
+    df = pd.read_excel(ruta, usecols=columnas, dtype=_tipos_pandas(esquema))
+    yield {col: df[col].to_numpy() for col in columnas}
+
+
+def _leer_parquet(ruta: str, esquema: Esquema, columnas: List[str], tam_bloque: int) -> Iterator[Bloque]:
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Leer Parquet requiere pyarrow (pip install pyarrow).") from e
+
+    archivo = pq.ParquetFile(ruta)
+    for lote in archivo.iter_batches(batch_size=tam_bloque, columns=columnas):
+        # Por nombre: el lote trae las columnas en el orden del archivo, no en el de `columnas`
+        yield {col: lote.column(col).to_numpy(zero_copy_only=False) for col in columnas}
+
+
+def _leer_sqlite(ruta: str, esquema: Esquema, columnas: List[str], tam_bloque: int) -> Iterator[Bloque]:
+    if esquema.consulta:
+        sql = esquema.consulta
+    elif esquema.tabla:
+        lista = ", ".join('"' + c.replace('"', '""') + '"' for c in columnas)
+        sql = f'SELECT {lista} FROM "{esquema.tabla.replace(chr(34), chr(34) * 2)}"'
+    else:
+        raise ValueError("Para SQLite el esquema necesita tabla o consulta.")
+
+    con = sqlite3.connect(f"file:{os.path.abspath(ruta)}?mode=ro", uri=True)
+    try:
+        cur = con.execute(sql)
+        nombres = [d[0] for d in cur.description]
+        faltan = [c for c in columnas if c not in nombres]
+        if faltan:
+            raise ValueError(f"La consulta no devuelve las columnas {faltan}.")
+        pos = [nombres.index(c) for c in columnas]
+        while True:
+            filas = cur.fetchmany(tam_bloque)
+            if not filas:
+                return
+            valores = list(zip(*filas))
+            yield {col: np.array(valores[p], dtype=object) for col, p in zip(columnas, pos)}  # None → NaN al convertir
+    finally:
+        con.close()
+
+
+_lectores: Dict[str, Lector] = {
+    ".csv": _leer_csv,
+    ".txt": _leer_csv,
+    ".xlsx": _leer_excel,
+    ".xls": _leer_excel,
+    ".parquet": _leer_parquet,
+    ".pq": _leer_parquet,
+    ".db": _leer_sqlite,
+    ".sqlite": _leer_sqlite,
+    ".sqlite3": _leer_sqlite,
+}
+
+
+def registrar_lector(extension: str, lector: Lector) -> None:
+    """Asocia un lector a una extensión de archivo (p. ej. ".feather")."""
+    _lectores[extension.lower()] = lector
+
+
+# ==========================================================
+#  ENSAMBLADO
+# ==========================================================
+def _leer(ruta: str, esquema: Esquema, tam_bloque: int) -> Dict[str, np.ndarray]:
+    """Recorre los bloques y devuelve las columnas del catálogo en SI."""
+    ext = os.path.splitext(ruta)[1].lower()
+    lector = _lectores.get(ext)
+    if lector is None:
+        raise ValueError(f"Formato de catálogo no soportado: {ext!r}.")
+
+    partes: Dict[str, list] = {campo: [] for campo in ("nombre", *esquema.todos)}
+    col_req = esquema.campos[esquema.requerido][0]
+    for bloque in lector(ruta, esquema, esquema.columnas(), tam_bloque):
+        req = np.asarray(bloque[col_req], dtype=np.float64)
+        validas = ~np.isnan(req)
+        n = int(validas.sum())
+        partes["nombre"].append(np.asarray(bloque[esquema.nombre])[validas].astype(np.str_))
+        for campo in esquema.todos:
+            if campo in esquema.campos:
+                col, factor = esquema.campos[campo]
+                partes[campo].append(np.asarray(bloque[col], dtype=np.float64)[validas] * factor)
+            else:
+                partes[campo].append(np.full(n, np.nan))
+
+    return {
+        campo: np.concatenate(bloques) if bloques else np.empty(0, dtype=np.str_ if campo == "nombre" else np.float64)
+        for campo, bloques in partes.items()
+    }
+
+
+# ==========================================================
+#  API PÚBLICA
+# ==========================================================
+def cargar(ruta: str, esquema: Esquema, tam_bloque: int = 1 << 17) -> catalogo.Catalogo:
+    """
+    Catálogo de `ruta` (formato según la extensión) con las columnas del esquema.
+    Usa la misma caché en memoria y en .npz que catalogo.cargar_resortes.
+    """
+    if tam_bloque <= 0:
+        raise ValueError("tam_bloque debe ser > 0.")
+    return catalogo.cargar_fuente(ruta, lambda r: _leer(r, esquema, tam_bloque), esquema.clave())
+
+
+def _es_excel(ruta: str) -> bool:
+    return os.path.splitext(ruta)[1].lower() in (".xlsx", ".xls")
+
+
+def cargar_resortes(
+    ruta: str = catalogo.ARCHIVO_RESORTES, esquema: Optional[Esquema] = None, **opciones
+) -> catalogo.Catalogo:
+    """
+    Catálogo de resortes de cualquier formato. Sin esquema se usan las
+    columnas del Excel del proyecto (y para un Excel, catalogo.cargar_resortes).
+    """
+    if esquema is None:
+        if _es_excel(ruta):
+            return catalogo.cargar_resortes(ruta)
+        esquema = ESQUEMA_RESORTES
+    return cargar(ruta, esquema, **opciones)
+
+
+def cargar_aceites(
+    ruta: str = catalogo.ARCHIVO_ACEITES, esquema: Optional[Esquema] = None, **opciones
+) -> catalogo.Catalogo:
+    """Catálogo de aceites de cualquier formato (ver cargar_resortes)."""
+    if esquema is None:
+        if _es_excel(ruta):
+            return catalogo.cargar_aceites(ruta)
+        esquema = ESQUEMA_ACEITES
+    return cargar(ruta, esquema, **opciones)
@@ -0,0 +1,173 @@
+"""
+Diseño inverso del amortiguador: en vez de fijar alpha y buscar el aceite,
+se busca la combinación aceite + alpha que da el ζ objetivo.
+
+Con c = alpha·v (v = Visc_40, o η = ν·ρ si viscosidad="dinamica"),
+
+    ζ = alpha·v / (2·sqrt(m·k))   ⇒   alpha_req = ζ_obj·2·sqrt(m·k) / v
+
+para cada aceite en forma cerrada. Si alpha_req cae dentro de los límites
+fabricables [alpha_min, alpha_max] el aceite alcanza ζ_obj exactamente; si
+no, se usa el límite más cercano y queda una desviación.
+
+c_crit = 2·sqrt(m·k) (por punto) y v (por aceite, con su índice ordenado) se
+calculan una vez al crear DisenoInverso; resolver() con otro ζ objetivo,
+otra banda u otros límites de alpha sólo hace la búsqueda binaria.
+"""
+from typing import Optional, Tuple
+
+import numpy as np
+
+import catalogo
+from indice import IndiceAceites, IndiceOrdenado, IndiceResortes
+from restricciones import FiltroResortes, Limites
+from seleccion import ALPHA, ZETA_OBJ, ArrayLike, ResultadoSeleccion
+
+# Límites fabricables de alpha por defecto (mismas unidades que ALPHA)
+ALPHA_MIN = 1.0
+ALPHA_MAX = 20.0
+
+# Errores en ζ por debajo de esto se consideran iguales (desempate por alpha)
+_TOL_ZETA = 1e-12
+
+
+class DisenoInverso:
+    """
+    Precomputa el resorte (por k más cercana, como seleccionar_lote) y los
+    términos reutilizables para los puntos (ω_n, m).
+
+      - viscosidad="cinematica": v = Visc_40 (mm²/s), la regla del proyecto
+        (c = alpha·Visc_40, alpha = 5 por defecto)
+      - viscosidad="dinamica": v = η40 = ν·ρ (Pa·s) y alpha es un factor
+        geométrico en metros (c = alpha·η)
+
+    Métodos:
+      - alpha_requerido(zeta_obj): tabla (puntos, aceites) en forma cerrada
+      - resolver(...): mejor aceite + alpha por punto dentro de los límites
+    """
+
+    def __init__(
+        self,
+        w_n: ArrayLike,
+        m: ArrayLike,
+        resortes: Optional[catalogo.Catalogo] = None,
+        aceites: Optional[catalogo.Catalogo] = None,
+        viscosidad: str = "cinematica",
+        limites: Optional[Limites] = None,
+    ) -> None:
+        if viscosidad not in ("cinematica", "dinamica"):
+            raise ValueError("viscosidad debe ser 'cinematica' o 'dinamica'.")
+        if resortes is None:
+            resortes = catalogo.cargar_resortes()
+        if aceites is None:
+            aceites = catalogo.cargar_aceites()
+        w_n, m = np.broadcast_arrays(np.asarray(w_n, dtype=np.float64), np.asarray(m, dtype=np.float64))
+        if np.any(m <= 0):
+            raise ValueError("masa (kg) debe ser > 0.")
+
+        # Resorte por k más cercana (con o sin restricciones)
+        if limites is None:
+            i_resorte = np.asarray(IndiceResortes.desde_catalogo(resortes).mas_cercano(m * w_n**2))
+        else:
+            i_resorte = FiltroResortes.desde_catalogo(resortes).mas_cercano(m * w_n**2, limites, m, np.nan)
+        self.w_n = w_n
+        self.m = m
+        self.i_resorte = i_resorte
+        self.k = np.where(i_resorte < 0, np.nan, resortes["k_Nm"][i_resorte])
+        self.c_crit = 2 * np.sqrt(m * self.k)
+
+        # Término por aceite e índice ordenado sobre él
+        self.viscosidad = viscosidad
+        if viscosidad == "cinematica":
+            self.termino = aceites["Visc_40"]
+            self._indice: IndiceOrdenado = IndiceAceites.desde_catalogo(aceites)
+        else:
+            self.termino = aceites["Visc_40"] * aceites["densidad"] * 1e-3  # mm²/s·g/cm³ → Pa·s
+            self._indice = IndiceOrdenado(self.termino)
+
+    # ----------------------------------------------------------
+    def alpha_requerido(self, zeta_obj: ArrayLike = ZETA_OBJ) -> np.ndarray:
+        """alpha que da exactamente zeta_obj con cada aceite: forma (*puntos, aceites)."""
+        zeta_obj = np.asarray(zeta_obj, dtype=np.float64)
+        with np.errstate(divide="ignore"):
+            return (zeta_obj * self.c_crit)[..., None] / self.termino
+
+    def resolver(
+        self,
+        zeta_obj: ArrayLike = ZETA_OBJ,
+        banda: Optional[Tuple[float, float]] = None,
+        alpha_min: Optional[float] = None,
+        alpha_max: Optional[float] = None,
+        alpha_pref: Optional[float] = None,
+    ) -> ResultadoSeleccion:
+        """
+        Aceite y alpha ∈ [alpha_min, alpha_max] con ζ más cercano a zeta_obj.
+        Entre aceites que lo alcanzan exactamente se prefiere el de alpha más
+        cercano a alpha_pref (la geometría actual); después, la fila más baja.
+
+        Sólo hay que mirar los dos aceites vecinos de v* = ζ_obj·c_crit / alpha_pref:
+        ζ alcanzable con cada aceite es monótono en v, igual que en seleccionar_lote.
+
+        Con viscosidad="cinematica" los límites por defecto son ALPHA_MIN,
+        ALPHA_MAX y alpha_pref = ALPHA; con "dinamica" hay que dar los límites
+        (en m) y alpha_pref, si no se da, es su media geométrica.
+
+        Devuelve ResultadoSeleccion con, además, alpha y en_banda (ζ dentro de
+        `banda` = (ζ_min, ζ_max); por defecto la banda es el propio zeta_obj).
+        """
+        if self.viscosidad == "cinematica":
+            alpha_min = ALPHA_MIN if alpha_min is None else alpha_min
+            alpha_max = ALPHA_MAX if alpha_max is None else alpha_max
+            alpha_pref = ALPHA if alpha_pref is None else alpha_pref
+        elif alpha_min is None or alpha_max is None:
+            raise ValueError("Con viscosidad dinámica hay que dar alpha_min y alpha_max (m).")
+        if not 0 < alpha_min <= alpha_max:
+            raise ValueError("Se necesita 0 < alpha_min <= alpha_max.")
+        zeta_obj = np.broadcast_to(np.asarray(zeta_obj, dtype=np.float64), self.c_crit.shape)
+        if np.any(zeta_obj <= 0):
+            raise ValueError("zeta_obj debe ser > 0.")
+        lo, hi = (zeta_obj, zeta_obj) if banda is None else banda
+        if np.any(np.asarray(lo) > zeta_obj) or np.any(np.asarray(hi) < zeta_obj):
+            raise ValueError("La banda debe contener a zeta_obj.")
+        if alpha_pref is None:
+            alpha_pref = np.sqrt(alpha_min * alpha_max)
+        alpha_pref = min(max(alpha_pref, alpha_min), alpha_max)
+
+        objetivo = zeta_obj * self.c_crit  # = alpha·v buscado
+        izq, der = self._indice.vecinos(objetivo / alpha_pref)
+
+        def evaluar(fila):
+            alpha = np.clip(objetivo / self.termino[fila], alpha_min, alpha_max)
+            zeta = alpha * self.termino[fila] / self.c_crit
+            err = np.abs(zeta - zeta_obj)
+            err = np.where(err <= _TOL_ZETA * zeta_obj, 0.0, err)
+            return alpha, zeta, err
+
+        a_izq, z_izq, e_izq = evaluar(izq)
+        a_der, z_der, e_der = evaluar(der)
+        d_izq, d_der = np.abs(a_izq - alpha_pref), np.abs(a_der - alpha_pref)
+        usar_izq = (e_izq < e_der) | (
+            (e_izq == e_der) & ((d_izq < d_der) | ((d_izq == d_der) & (izq <= der)))
+        )
+
+        sin_resorte = self.i_resorte < 0
+        i_aceite = np.where(sin_resorte, -1, np.where(usar_izq, izq, der))
+        alpha = np.where(sin_resorte, np.nan, np.where(usar_izq, a_izq, a_der))
+        zeta = np.where(usar_izq, z_izq, z_der)
+        with np.errstate(invalid="ignore"):
+            w_d = self.w_n * np.sqrt(1 - zeta**2)
+            en_banda = (zeta >= np.asarray(lo) * (1 - _TOL_ZETA)) & (zeta <= np.asarray(hi) * (1 + _TOL_ZETA))
+
+        return ResultadoSeleccion(
+            w_n=self.w_n,
+            m=self.m,
+            A0=np.full(self.w_n.shape, np.nan),
+            i_resorte=self.i_resorte,
+            i_aceite=i_aceite,
+            k=self.k,
+            c=alpha * self.termino[i_aceite],
+            zeta=zeta,
+            w_d=w_d,
+            alpha=alpha,
+            en_banda=en_banda,
+        )
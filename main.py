@@ -1,7 +1,54 @@
 import math
 from typing import Union
 
+import numpy as np
+
 Number = Union[int, float]
+# Los métodos aceptan escalares o arrays de NumPy (se evalúan elemento a elemento)
+ArrayLike = Union[Number, np.ndarray]
+
+
+def _arr(x: ArrayLike) -> np.ndarray:
+    return np.asarray(x, dtype=np.float64)
+
+
+def _salida(a: np.ndarray) -> Union[float, np.ndarray]:
+    """Escalar de entrada → float de Python; array de entrada → array."""
+    return float(a) if a.ndim == 0 else a
+
+
+# ==========================================================
+#  VALIDACIONES (compartidas por objetos y bancos de arrays)
+# ==========================================================
+def validar_resorte(
+    k: ArrayLike, long_libre: ArrayLike, def_max: ArrayLike, dm_in: ArrayLike, dm_ex: ArrayLike
+) -> None:
+    """
+    Reglas de Resorte.__init__. Con arrays se comprueban todos los elementos
+    y basta uno inválido para lanzar ValueError.
+    """
+    k, long_libre, def_max = _arr(k), _arr(long_libre), _arr(def_max)
+    dm_in, dm_ex = _arr(dm_in), _arr(dm_ex)
+    if np.any(k <= 0):
+        raise ValueError("k (N/m) debe ser positivo.")
+    if np.any(long_libre <= 0):
+        raise ValueError("long_libre (m) debe ser positivo.")
+    if np.any(def_max < 0):
+        raise ValueError("def_max (m) debe ser >= 0.")
+    if np.any(dm_in < 0) or np.any(dm_ex < 0):
+        raise ValueError("Diámetros (m) deben ser >= 0.")
+    if np.any(dm_in > dm_ex):
+        raise ValueError("dm_in no puede ser mayor que dm_ex.")
+
+
+def validar_amortiguador(densidad: ArrayLike, visc_40: ArrayLike, visc_100: ArrayLike) -> None:
+    """
+    Reglas de Amortiguador.__init__, elemento a elemento como validar_resorte.
+    """
+    if np.any(_arr(visc_40) <= 0) or np.any(_arr(visc_100) <= 0):
+        raise ValueError("Viscosidades (mm²/s) deben ser > 0.")
+    if np.any(_arr(densidad) <= 0):
+        raise ValueError("Densidad debe ser > 0 (g/cm³).")
 
 
 # ==========================================================
@@ -23,6 +70,8 @@ class Resorte:
       - fuerza(deflexion) devuelve la fuerza en Newtons (N).
       - frec_natural(masa) devuelve la frecuencia natural en Hz.
       - omega_natural(masa) devuelve la frecuencia angular natural en rad/s.
+      - Todos aceptan también arrays de NumPy (barridos de deflexión o masa)
+        y devuelven un array de la misma forma.
     """
 
     def __init__(
@@ -35,16 +84,7 @@ class Resorte:
         dm_ex: Number,
     ) -> None:
         # Validaciones de entrada
-        if k <= 0:
-            raise ValueError("k (N/m) debe ser positivo.")
-        if long_libre <= 0:
-            raise ValueError("long_libre (m) debe ser positivo.")
-        if def_max < 0:
-            raise ValueError("def_max (m) debe ser >= 0.")
-        if dm_in < 0 or dm_ex < 0:
-            raise ValueError("Diámetros (m) deben ser >= 0.")
-        if dm_in > dm_ex:
-            raise ValueError("dm_in no puede ser mayor que dm_ex.")
+        validar_resorte(k, long_libre, def_max, dm_in, dm_ex)
 
         self.nombre = nombre
         self.k = float(k)
@@ -54,41 +94,42 @@ class Resorte:
         self.dm_ex = float(dm_ex)
 
     # ----------------------------------------------------------
-    def fuerza(self, deflexion: Number) -> float:
+    def fuerza(self, deflexion: ArrayLike) -> Union[float, np.ndarray]:
         """
         Calcula la fuerza ejercida por el resorte según la ley de Hooke:
             F = k * x
         """
-        return self.k * float(deflexion)
+        return _salida(self.k * _arr(deflexion))
 
     # ----------------------------------------------------------
-    def dentro_limites(self, deflexion: Number) -> bool:
+    def dentro_limites(self, deflexion: ArrayLike) -> Union[bool, np.ndarray]:
         """
         Indica si una deflexión (m) está dentro de la deformación máxima permitida.
         """
-        return abs(float(deflexion)) <= self.def_max
+        ok = np.abs(_arr(deflexion)) <= self.def_max
+        return bool(ok) if ok.ndim == 0 else ok
 
     # ----------------------------------------------------------
-    def frec_natural(self, masa: Number) -> float:
+    def frec_natural(self, masa: ArrayLike) -> Union[float, np.ndarray]:
         """
         Calcula la frecuencia natural en Hz del sistema masa-resorte:
             f = (1 / 2π) * sqrt(k / m)
         """
-        m = float(masa)
-        if m <= 0:
+        m = _arr(masa)
+        if np.any(m <= 0):
             raise ValueError("masa (kg) debe ser > 0.")
-        return (1.0 / (2.0 * math.pi)) * math.sqrt(self.k / m)
+        return _salida((1.0 / (2.0 * math.pi)) * np.sqrt(self.k / m))
 
     # ----------------------------------------------------------
-    def omega_natural(self, masa: Number) -> float:
+    def omega_natural(self, masa: ArrayLike) -> Union[float, np.ndarray]:
         """
         Calcula la frecuencia angular natural en rad/s:
             ω = sqrt(k / m)
         """
-        m = float(masa)
-        if m <= 0:
+        m = _arr(masa)
+        if np.any(m <= 0):
             raise ValueError("masa (kg) debe ser > 0.")
-        return math.sqrt(self.k / m)
+        return _salida(np.sqrt(self.k / m))
 
 
 # ==========================================================
@@ -108,15 +149,15 @@ class Amortiguador:
       - viscosidad_dinamica(temp): devuelve η (Pa·s) a la temperatura indicada (°C)
       - coef_amortiguamiento(masa, k, factor): devuelve c = factor * c_crit (kg/s)
       - relacion_amortiguamiento(masa, k, c): calcula ζ = c / c_crit (adimensional)
+
+    Los métodos aceptan también arrays de NumPy (perfiles de temperatura,
+    barridos de masa o k) y devuelven un array con la forma común (broadcast).
     """
 
     def __init__(
         self, nombre: str, densidad: Number, visc_40: Number, visc_100: Number
     ) -> None:
-        if visc_40 <= 0 or visc_100 <= 0:
-            raise ValueError("Viscosidades (mm²/s) deben ser > 0.")
-        if densidad <= 0:
-            raise ValueError("Densidad debe ser > 0 (g/cm³).")
+        validar_amortiguador(densidad, visc_40, visc_100)
 
         self.nombre = nombre
         self.densidad = float(densidad)
@@ -124,44 +165,41 @@ class Amortiguador:
         self.visc_100 = float(visc_100)
 
     # ----------------------------------------------------------
-    def viscosidad_dinamica(self, temp: Number) -> float:
+    def viscosidad_dinamica(self, temp: ArrayLike) -> Union[float, np.ndarray]:
         """
         Calcula la viscosidad dinámica η (Pa·s) a una temperatura dada (°C).
         Usa interpolación lineal entre 40°C y 100°C si es necesario.
         """
-        t = float(temp)
+        t = _arr(temp)
         rho = self.densidad * 1000.0  # g/cm³ → kg/m³
 
         # Selección/interpolación
-        if t <= 40.0:
-            nu = self.visc_40 * 1e-6
-        elif t >= 100.0:
-            nu = self.visc_100 * 1e-6
-        else:
-            nu_interp = self.visc_40 + (self.visc_100 - self.visc_40) * (
-                t - 40.0
-            ) / 60.0
-            nu = nu_interp * 1e-6
-
-        return nu * rho  # η = ν * ρ
+        nu_interp = self.visc_40 + (self.visc_100 - self.visc_40) * (t - 40.0) / 60.0
+        nu = np.where(t <= 40.0, self.visc_40, np.where(t >= 100.0, self.visc_100, nu_interp)) * 1e-6
+
+        return _salida(nu * rho)  # η = ν * ρ
 
     # ----------------------------------------------------------
-    def coef_amortiguamiento(self, masa: Number, k: Number, factor: Number = 1.0) -> float:
+    def coef_amortiguamiento(
+        self, masa: ArrayLike, k: ArrayLike, factor: ArrayLike = 1.0
+    ) -> Union[float, np.ndarray]:
         """
         Calcula el coeficiente de amortiguamiento c (kg/s) según:
             c = factor * c_crit
         donde:
             c_crit = 2 * sqrt(k * masa)
         """
-        m = float(masa)
-        kf = float(k)
-        if m <= 0 or kf <= 0:
+        m = _arr(masa)
+        kf = _arr(k)
+        if np.any(m <= 0) or np.any(kf <= 0):
             raise ValueError("masa (kg) y k (N/m) deben ser > 0.")
-        c_crit = 2.0 * math.sqrt(kf * m)
-        return float(factor) * c_crit
+        c_crit = 2.0 * np.sqrt(kf * m)
+        return _salida(_arr(factor) * c_crit)
 
     # ----------------------------------------------------------
-    def relacion_amortiguamiento(self, masa: Number, k: Number, c: Number) -> float:
+    def relacion_amortiguamiento(
+        self, masa: ArrayLike, k: ArrayLike, c: ArrayLike
+    ) -> Union[float, np.ndarray]:
         """
         Calcula la razón de amortiguamiento ζ = c / c_crit (adimensional).
 
@@ -170,8 +208,12 @@ class Amortiguador:
           ζ = 1 → críticamente amortiguado
           ζ > 1 → sobreamortiguado
         """
-        c_crit = 2.0 * math.sqrt(float(k) * float(masa))
-        return float(c) / c_crit
+        m = _arr(masa)
+        kf = _arr(k)
+        if np.any(m <= 0) or np.any(kf <= 0):
+            raise ValueError("masa (kg) y k (N/m) deben ser > 0.")
+        c_crit = 2.0 * np.sqrt(kf * m)
+        return _salida(_arr(c) / c_crit)
 
 """
 # ==========================================================
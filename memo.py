@@ -0,0 +1,138 @@
+import sys
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional
+
+import numpy as np
+
+import catalogo
+
+
+# ----------------------------------------------------------
+def tamano(valor: object) -> int:
+    """
+    Tamaño aproximado en bytes de un valor cacheado: nbytes de los arrays de
+    NumPy y sys.getsizeof del resto, recorriendo tuplas, listas, dicts y
+    objetos con __dict__ (p. ej. ResultadoSeleccion).
+    """
+    if isinstance(valor, np.ndarray):
+        return valor.nbytes
+    if isinstance(valor, (tuple, list)):
+        return sys.getsizeof(valor) + sum(tamano(v) for v in valor)
+    if isinstance(valor, dict):
+        return sys.getsizeof(valor) + sum(tamano(v) for v in valor.values())
+    if hasattr(valor, "__dict__"):
+        return tamano(vars(valor))
+    return sys.getsizeof(valor)
+
+
+def version_catalogos(
+    resortes: Optional[catalogo.Catalogo] = None, aceites: Optional[catalogo.Catalogo] = None
+) -> str:
+    """
+    Versión combinada de los catálogos (hash de contenido de cada archivo).
+    Va en la clave de caché: si un Excel cambia, las entradas viejas no vuelven a acertar.
+    """
+    if resortes is None:
+        resortes = catalogo.cargar_resortes()
+    if aceites is None:
+        aceites = catalogo.cargar_aceites()
+    return f"{resortes.version}:{aceites.version}"
+
+
+# ==========================================================
+#  CLASE: CACHÉ LRU ACOTADA
+# ==========================================================
+class CacheLRU:
+    """
+    Caché LRU acotada por número de entradas y por bytes (ver tamano()).
+
+    - obtener_o_calcular(clave, fn) devuelve el valor cacheado o llama a fn()
+      y lo guarda; al superar los límites se desalojan las entradas menos
+      usadas recientemente.
+    - con_version(version) vacía la caché si la versión de los catálogos
+      cambió desde la última llamada.
+    - Contadores: aciertos, fallos, desalojos (ver estadisticas()).
+
+    Es segura entre hilos (un candado protege la estructura; fn() se ejecuta
+    fuera del candado, así que dos hilos pueden calcular la misma clave a la vez).
+    """
+
+    def __init__(self, max_entradas: int = 256, max_bytes: int = 64 * 2**20) -> None:
+        if max_entradas <= 0 or max_bytes <= 0:
+            raise ValueError("max_entradas y max_bytes deben ser > 0.")
+
+        self.max_entradas = max_entradas
+        self.max_bytes = max_bytes
+        self._datos: "OrderedDict[Hashable, tuple]" = OrderedDict()  # clave → (valor, bytes)
+        self._bytes = 0
+        self._version: Optional[str] = None
+        self._candado = threading.Lock()
+
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+
+    def __len__(self) -> int:
+        return len(self._datos)
+
+    def __contains__(self, clave: Hashable) -> bool:
+        return clave in self._datos
+
+    # ----------------------------------------------------------
+    def obtener(self, clave: Hashable, defecto: object = None) -> object:
+        with self._candado:
+            entrada = self._datos.get(clave)
+            if entrada is None:
+                self.fallos += 1
+                return defecto
+            self._datos.move_to_end(clave)
+            self.aciertos += 1
+            return entrada[0]
+
+    def guardar(self, clave: Hashable, valor: object) -> None:
+        n = tamano(valor)
+        with self._candado:
+            previo = self._datos.pop(clave, None)
+            if previo is not None:
+                self._bytes -= previo[1]
+            if n > self.max_bytes:
+                return  # no cabe ni sola: no se guarda
+            self._datos[clave] = (valor, n)
+            self._bytes += n
+            while len(self._datos) > self.max_entradas or self._bytes > self.max_bytes:
+                _, (_, n_viejo) = self._datos.popitem(last=False)
+                self._bytes -= n_viejo
+                self.desalojos += 1
+
+    def obtener_o_calcular(self, clave: Hashable, fn: Callable[[], object]) -> object:
+        faltante = object()
+        valor = self.obtener(clave, faltante)
+        if valor is faltante:
+            valor = fn()
+            self.guardar(clave, valor)
+        return valor
+
+    # ----------------------------------------------------------
+    def con_version(self, version: str) -> "CacheLRU":
+        """Invalida todo si la versión de los catálogos cambió; devuelve self."""
+        with self._candado:
+            if version != self._version:
+                self._datos.clear()
+                self._bytes = 0
+                self._version = version
+        return self
+
+    def invalidar(self) -> None:
+        with self._candado:
+            self._datos.clear()
+            self._bytes = 0
+
+    def estadisticas(self) -> Dict[str, int]:
+        return {
+            "entradas": len(self._datos),
+            "bytes": self._bytes,
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "desalojos": self.desalojos,
+        }
@@ -0,0 +1,230 @@
+"""
+Análisis de tolerancias por Monte Carlo para pares resorte-aceite.
+
+Por cada muestra se perturban k, Visc_40 y Visc_100 y se toma una temperatura
+de operación; el amortiguamiento es c = alpha·ν(T), con ν(T) de ASTM D341
+(viscosidad.nu_walther), que coincide con la regla c = alpha·Visc_40 a 40 °C.
+De cada muestra salen ω_n, ζ y el sobrepaso máximo de la respuesta al escalón
+    Mp = exp(-π·ζ / sqrt(1 - ζ²))   (0 si ζ >= 1).
+
+Las muestras se evalúan en bloques vectorizados de unas tam_bloque, así que
+los temporales del cálculo no dependen de n_muestras; sí los valores de cada
+métrica (3 arrays de n_muestras por par, en proceso), que se guardan para
+calcular los percentiles exactos. Los números aleatorios salen de
+SeedSequence(semilla).spawn: un flujo por par y, dentro de él, uno por cada
+tramo de _MUESTRAS_SUBFLUJO muestras; los bloques son tramos enteros, así
+que el resultado es el mismo con cualquier tam_bloque y número de procesos.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+import catalogo
+import seleccion
+import viscosidad
+
+ArrayLike = Union[float, np.ndarray]
+
+PERCENTILES = (1.0, 5.0, 50.0, 95.0, 99.0)
+METRICAS = ("w_n", "zeta", "sobrepaso")
+_MUESTRAS_SUBFLUJO = 1 << 12  # muestras por flujo aleatorio (fijo: no depende de tam_bloque)
+
+
+# ==========================================================
+#  CLASE: TOLERANCIAS
+# ==========================================================
+class Tolerancias:
+    """
+    Dispersión de las entradas:
+      - k, visc_40, visc_100: tolerancia relativa; cada muestra se multiplica
+        por (1 + u) con u uniforme en [-tol, tol] (0 = sin dispersión)
+      - temp_media, temp_desv: temperatura de operación normal (°C)
+    Visc_40 y Visc_100 se perturban por separado: cambia también la pendiente
+    viscosidad-temperatura del aceite.
+    """
+
+    def __init__(
+        self,
+        k: float = 0.10,
+        visc_40: float = 0.05,
+        visc_100: float = 0.05,
+        temp_media: float = 40.0,
+        temp_desv: float = 10.0,
+    ) -> None:
+        for nombre, tol in (("k", k), ("visc_40", visc_40), ("visc_100", visc_100)):
+            if not 0 <= tol < 1:
+                raise ValueError(f"La tolerancia de {nombre} debe estar en [0, 1).")
+        if temp_desv < 0:
+            raise ValueError("temp_desv debe ser >= 0.")
+        self.k = float(k)
+        self.visc_40 = float(visc_40)
+        self.visc_100 = float(visc_100)
+        self.temp_media = float(temp_media)
+        self.temp_desv = float(temp_desv)
+
+
+# ==========================================================
+#  CLASE: RESULTADO
+# ==========================================================
+class ResultadoMC:
+    """
+    Resultado para P pares:
+      - percentiles: los percentiles pedidos (n_p,)
+      - w_n, zeta, sobrepaso: percentiles de cada métrica, forma (P, n_p)
+      - media_w_n, media_zeta, media_sobrepaso, desv_*: media y desviación (P,)
+      - frac_sobreamortiguado: fracción de muestras con ζ >= 1 (P,)
+      - n_muestras
+    """
+
+    def __init__(self, **campos: np.ndarray) -> None:
+        self.__dict__.update(campos)
+
+    def __len__(self) -> int:
+        return int(self.w_n.shape[0])
+
+
+# ==========================================================
+#  EVALUACIÓN DE UN PAR
+# ==========================================================
+def _sortear(rng: np.random.Generator, n: int, k: float, v40: float, v100: float, tol: Tolerancias) -> np.ndarray:
+    """Entradas perturbadas (k, Visc_40, Visc_100, T) de n muestras de un flujo, forma (4, n)."""
+    return np.stack(
+        (
+            k * (1 + rng.uniform(-tol.k, tol.k, n)),
+            v40 * (1 + rng.uniform(-tol.visc_40, tol.visc_40, n)),
+            v100 * (1 + rng.uniform(-tol.visc_100, tol.visc_100, n)),
+            rng.normal(tol.temp_media, tol.temp_desv, n),
+        )
+    )
+
+
+def _bloque(
+    flujos: Sequence[np.random.SeedSequence],
+    n: int,
+    m: float,
+    k: float,
+    v40: float,
+    v100: float,
+    alpha: float,
+    tol: Tolerancias,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Métricas de n muestras sacadas de los flujos dados (_MUESTRAS_SUBFLUJO por flujo, el último incompleto)."""
+    tramos = [
+        _sortear(np.random.default_rng(sem), min(_MUESTRAS_SUBFLUJO, n - i * _MUESTRAS_SUBFLUJO), k, v40, v100, tol)
+        for i, sem in enumerate(flujos)
+    ]
+    k_s, v40_s, v100_s, temp = np.concatenate(tramos, axis=1)
+
+    c = alpha * viscosidad.nu_walther(v40_s, v100_s, temp)
+    raiz_mk = np.sqrt(m * k_s)
+    w_n = raiz_mk / m  # = sqrt(k/m)
+    zeta = c / (2 * raiz_mk)
+    sub = zeta < 1
+    sobrepaso = np.zeros(n)
+    z = zeta[sub]
+    sobrepaso[sub] = np.exp(-np.pi * z / np.sqrt(1 - z * z))
+    return w_n, zeta, sobrepaso
+
+
+def _analizar_par(
+    args: Tuple[float, float, float, float, float, Tolerancias, int, int, Sequence[float], np.random.SeedSequence]
+) -> Dict[str, np.ndarray]:
+    """Todas las muestras de un par, bloque a bloque; devuelve sus estadísticas."""
+    m, k, v40, v100, alpha, tol, n_muestras, tam_bloque, percentiles, semilla = args
+    valores = {nombre: np.empty(n_muestras) for nombre in METRICAS}
+
+    flujos = semilla.spawn(-(-n_muestras // _MUESTRAS_SUBFLUJO))
+    por_bloque = max(tam_bloque // _MUESTRAS_SUBFLUJO, 1)  # flujos enteros por bloque
+    for f in range(0, len(flujos), por_bloque):
+        ini = f * _MUESTRAS_SUBFLUJO
+        fin = min(ini + por_bloque * _MUESTRAS_SUBFLUJO, n_muestras)
+        w_n, zeta, sobrepaso = _bloque(flujos[f : f + por_bloque], fin - ini, m, k, v40, v100, alpha, tol)
+        valores["w_n"][ini:fin] = w_n
+        valores["zeta"][ini:fin] = zeta
+        valores["sobrepaso"][ini:fin] = sobrepaso
+
+    salida = {}
+    for nombre, v in valores.items():
+        salida[nombre] = np.percentile(v, percentiles)
+        salida["media_" + nombre] = v.mean()
+        salida["desv_" + nombre] = v.std()
+    salida["frac_sobreamortiguado"] = np.count_nonzero(valores["zeta"] >= 1) / n_muestras
+    return salida
+
+
+# ==========================================================
+#  API PÚBLICA
+# ==========================================================
+def analizar(
+    m: ArrayLike,
+    k: ArrayLike,
+    visc_40: ArrayLike,
+    visc_100: ArrayLike,
+    alpha: ArrayLike = seleccion.ALPHA,
+    tolerancias: Optional[Tolerancias] = None,
+    n_muestras: int = 10**6,
+    tam_bloque: int = 1 << 16,
+    semilla: Optional[int] = None,
+    percentiles: Sequence[float] = PERCENTILES,
+    procesos: int = 1,
+) -> ResultadoMC:
+    """
+    Distribución de ω_n, ζ y sobrepaso para P pares (m, k, Visc_40, Visc_100,
+    alpha), cada uno escalar o array 1-D (con broadcasting).
+
+    n_muestras por par; tam_bloque acota los temporales de cada bloque (se
+    redondea a múltiplos de _MUESTRAS_SUBFLUJO y no cambia el resultado).
+    semilla: entero para resultados reproducibles (None = entropía del sistema).
+    procesos > 1 reparte los pares entre procesos (None = os.cpu_count()).
+    """
+    m, k, visc_40, visc_100, alpha = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(a, dtype=np.float64)) for a in (m, k, visc_40, visc_100, alpha))
+    )
+    if m.ndim != 1:
+        raise ValueError("m, k, visc_40, visc_100 y alpha deben ser escalares o arrays 1-D.")
+    if np.any(m <= 0) or np.any(k <= 0):
+        raise ValueError("masa (kg) y k (N/m) deben ser > 0.")
+    if np.any(visc_40 <= 0) or np.any(visc_100 <= 0):
+        raise ValueError("Las viscosidades deben ser > 0.")
+    if np.any(alpha <= 0):
+        raise ValueError("alpha debe ser > 0.")
+    if n_muestras <= 0 or tam_bloque <= 0:
+        raise ValueError("n_muestras y tam_bloque deben ser > 0.")
+    tol = Tolerancias() if tolerancias is None else tolerancias
+    percentiles = tuple(float(p) for p in percentiles)
+
+    semillas = np.random.SeedSequence(semilla).spawn(len(m))
+    trabajos = [
+        (m[i], k[i], visc_40[i], visc_100[i], alpha[i], tol, n_muestras, tam_bloque, percentiles, semillas[i])
+        for i in range(len(m))
+    ]
+    if procesos == 1 or len(trabajos) <= 1:
+        por_par = [_analizar_par(t) for t in trabajos]
+    else:
+        with ProcessPoolExecutor(max_workers=procesos or os.cpu_count()) as pool:
+            por_par = list(pool.map(_analizar_par, trabajos))
+
+    campos = {nombre: np.array([r[nombre] for r in por_par]) for nombre in por_par[0]}
+    return ResultadoMC(percentiles=np.array(percentiles), n_muestras=n_muestras, **campos)
+
+
+def analizar_seleccion(
+    res: seleccion.ResultadoSeleccion,
+    resortes: catalogo.Catalogo,
+    aceites: catalogo.Catalogo,
+    alpha: ArrayLike = seleccion.ALPHA,
+    **opciones,
+) -> ResultadoMC:
+    """
+    analizar() para los pares de una selección por catálogo (uno por punto
+    de res). alpha debe ser el usado en la selección.
+    """
+    i_r = np.ravel(res.i_resorte)
+    i_a = np.ravel(res.i_aceite)
+    if np.any(i_r < 0):
+        raise ValueError("La selección tiene puntos sin resorte (i_resorte = -1).")
+    return analizar(
+        np.ravel(res.m), resortes["k_Nm"][i_r], aceites["Visc_40"][i_a], aceites["Visc_100"][i_a], alpha, **opciones
+    )
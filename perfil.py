@@ -0,0 +1,219 @@
+"""
+Medición opcional por etapas del proceso de selección.
+
+    perfil.activar(perfil.Registro())        # o SumideroLog(), SumideroJSON("perfil.jsonl")
+    with perfil.etapa("seleccion_resorte"):
+        ...
+
+Etapas instrumentadas: carga, lectura_excel, conversion_si (catalogo),
+seleccion_resorte, seleccion_aceite (seleccion), simulacion y render (resoil).
+
+Cada etapa produce una medición (dict) con: etapa, padre, inicio (epoch s),
+duracion_s, hilo y, si se activó con memoria=True, bytes (asignación neta)
+y pico_bytes (pico sobre el inicio de la etapa) según tracemalloc. La
+memoria se traza para todo el proceso: si varios hilos miden a la vez, cada
+etapa incluye también lo que asignen los demás.
+
+Desactivado (por defecto), etapa() devuelve siempre el mismo contexto vacío:
+no se toma el tiempo, no se reserva memoria y no se llama a ningún sumidero.
+"""
+import json
+import logging
+import threading
+import time
+import tracemalloc
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional
+
+Medicion = Dict[str, object]
+
+_sumideros: List[Callable[[Medicion], None]] = []
+_memoria = False
+_tracemalloc_propio = False  # tracemalloc lo arrancó activar() y lo para desactivar()
+_pilas = threading.local()  # etapas abiertas en cada hilo (para "padre" y el pico)
+
+
+# ==========================================================
+#  SUMIDEROS
+# ==========================================================
+class Registro:
+    """
+    Sumidero en memoria: acumula por etapa llamadas, tiempo total y máximo
+    y bytes, y guarda las últimas `max_mediciones` mediciones completas.
+    Pensado para consultarlo desde la interfaz (ver resumen()).
+    """
+
+    def __init__(self, max_mediciones: int = 1000) -> None:
+        self.mediciones: Deque[Medicion] = deque(maxlen=max_mediciones)
+        self._totales: Dict[str, Dict[str, float]] = {}
+        self._candado = threading.Lock()
+
+    def __call__(self, med: Medicion) -> None:
+        with self._candado:
+            self.mediciones.append(med)
+            tot = self._totales.setdefault(
+                med["etapa"], {"llamadas": 0, "total_s": 0.0, "max_s": 0.0, "bytes": 0, "pico_bytes": 0}
+            )
+            tot["llamadas"] += 1
+            tot["total_s"] += med["duracion_s"]
+            tot["max_s"] = max(tot["max_s"], med["duracion_s"])
+            if "bytes" in med:
+                tot["bytes"] += med["bytes"]
+                tot["pico_bytes"] = max(tot["pico_bytes"], med["pico_bytes"])
+
+    def resumen(self) -> Dict[str, Dict[str, float]]:
+        """etapa → {llamadas, total_s, media_s, max_s, bytes, pico_bytes}."""
+        with self._candado:
+            return {
+                etapa: {**tot, "media_s": tot["total_s"] / tot["llamadas"]}
+                for etapa, tot in self._totales.items()
+            }
+
+    def limpiar(self) -> None:
+        with self._candado:
+            self.mediciones.clear()
+            self._totales.clear()
+
+    def texto(self) -> str:
+        """Resumen en una tabla de texto (una línea por etapa)."""
+        filas = [f"{'etapa':<18} {'llamadas':>8} {'total ms':>10} {'media ms':>10} {'máx ms':>10}"]
+        for etapa, r in self.resumen().items():
+            filas.append(
+                f"{etapa:<18} {r['llamadas']:>8} {r['total_s'] * 1e3:10.2f} "
+                f"{r['media_s'] * 1e3:10.2f} {r['max_s'] * 1e3:10.2f}"
+            )
+        return "\n".join(filas)
+
+
+class SumideroLog:
+    """Escribe una línea de log por medición."""
+
+    def __init__(self, logger: Optional[logging.Logger] = None, nivel: int = logging.INFO) -> None:
+        self.logger = logger or logging.getLogger("resoil.perfil")
+        self.nivel = nivel
+
+    def __call__(self, med: Medicion) -> None:
+        extra = f" {med['bytes']} B (pico {med['pico_bytes']} B)" if "bytes" in med else ""
+        self.logger.log(self.nivel, "%s: %.3f ms%s", med["etapa"], med["duracion_s"] * 1e3, extra)
+
+
+class SumideroJSON:
+    """Añade cada medición como una línea JSON al archivo `ruta`."""
+
+    def __init__(self, ruta: str) -> None:
+        self.ruta = ruta
+        self._candado = threading.Lock()
+
+    def __call__(self, med: Medicion) -> None:
+        linea = json.dumps(med, ensure_ascii=False)
+        with self._candado, open(self.ruta, "a", encoding="utf-8") as f:
+            f.write(linea + "\n")
+
+
+# ==========================================================
+#  ACTIVACIÓN
+# ==========================================================
+def activar(*sumideros: Callable[[Medicion], None], memoria: bool = False) -> None:
+    """
+    Empieza a medir y envía cada medición a los sumideros dados (cualquier
+    invocable que reciba el dict de la medición). Con memoria=True también
+    se miden asignaciones con tracemalloc, que ralentiza todo el proceso
+    mientras está activo.
+    """
+    global _memoria, _tracemalloc_propio
+    if not sumideros:
+        raise ValueError("Se necesita al menos un sumidero.")
+    _sumideros[:] = sumideros
+    _memoria = memoria
+    if memoria and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _tracemalloc_propio = True
+
+
+def desactivar() -> None:
+    global _memoria, _tracemalloc_propio
+    _sumideros.clear()
+    _memoria = False
+    if _tracemalloc_propio:
+        tracemalloc.stop()
+        _tracemalloc_propio = False
+
+
+def activo() -> bool:
+    return bool(_sumideros)
+
+
+# ==========================================================
+#  ETAPAS
+# ==========================================================
+class _Nulo:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc) -> bool:
+        return False
+
+
+_NULO = _Nulo()
+
+
+class _Etapa:
+    __slots__ = ("nombre", "padre", "inicio", "t0", "mem0", "pico")
+
+    def __init__(self, nombre: str) -> None:
+        self.nombre = nombre
+
+    def __enter__(self) -> "_Etapa":
+        pila = getattr(_pilas, "pila", None)
+        if pila is None:
+            pila = _pilas.pila = []
+        self.padre = pila[-1] if pila else None
+        pila.append(self)
+
+        self.mem0 = None
+        if _memoria and tracemalloc.is_tracing():
+            actual, pico = tracemalloc.get_traced_memory()
+            # reset_peak borra el pico de la etapa padre: se le pasa antes
+            if self.padre is not None and self.padre.mem0 is not None:
+                self.padre.pico = max(self.padre.pico, pico)
+            tracemalloc.reset_peak()
+            self.mem0 = self.pico = actual
+
+        self.inicio = time.time()
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        duracion = time.perf_counter() - self.t0
+        _pilas.pila.pop()
+
+        med: Medicion = {
+            "etapa": self.nombre,
+            "padre": None if self.padre is None else self.padre.nombre,
+            "inicio": self.inicio,
+            "duracion_s": duracion,
+            "hilo": threading.current_thread().name,
+        }
+        if self.mem0 is not None and tracemalloc.is_tracing():
+            actual, pico = tracemalloc.get_traced_memory()
+            pico = max(pico, self.pico)
+            if self.padre is not None and self.padre.mem0 is not None:
+                self.padre.pico = max(self.padre.pico, pico)
+            med["bytes"] = actual - self.mem0
+            med["pico_bytes"] = pico - self.mem0
+
+        for sumidero in tuple(_sumideros):
+            sumidero(med)
+        return False
+
+
+def etapa(nombre: str):
+    """
+    Contexto que mide la etapa `nombre` si la medición está activa.
+    Las etapas pueden anidarse; la medición lleva el nombre de la etapa padre.
+    """
+    if not _sumideros:
+        return _NULO
+    return _Etapa(nombre)
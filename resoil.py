@@ -1,12 +1,120 @@
 # tk_frontend.py
+import sys
+
+# Con argumentos (python -m resoil select ...) se usa la línea de comandos sin
+# interfaz; se despacha antes de importar Tk y matplotlib para arrancar rápido.
+if __name__ == "__main__" and len(sys.argv) > 1:
+    import cli
+    sys.exit(cli.main_cli(sys.argv[1:]))
+
 import tkinter as tk
 from tkinter import filedialog, ttk, messagebox, simpledialog
 import numpy as np
 import main  
+import catalogo
+import seleccion
+import memo
+import tareas
+import grafica
+import perfil
+import restricciones
+import respuesta
+import almacen
 import io
 import math
-import pandas as pd
-import matplotlib.pyplot as plt
+import sqlite3
+import time
+# -----------------------------
+# Utilidades
+# -----------------------------
+# Resultados de selección ya calculados (mismas entradas → respuesta inmediata)
+_cache_seleccion = memo.CacheLRU(max_entradas=128, max_bytes=32 * 2**20)
+
+# Tiempos por etapa (menú Perfil); sólo se mide mientras está activado
+_registro_perfil = perfil.Registro()
+
+# Historial persistente de selecciones (almacen.ARCHIVO_RESULTADOS); se abre con la primera
+_almacen_resultados = None
+
+
+def _sin_informe(fraccion, texto=""):
+    pass
+
+
+def precargar_catalogos(informar=_sin_informe):
+    """
+    Carga ambos catálogos y construye sus índices (se llama en segundo plano
+    al abrir la ventana para que el primer clic no tenga que esperar).
+    """
+    informar(0.0, "Cargando catálogo de resortes...")
+    resortes = catalogo.cargar_resortes()
+    informar(0.4, "Cargando catálogo de aceites...")
+    aceites = catalogo.cargar_aceites()
+    informar(0.8, "Construyendo índices...")
+    seleccion.seleccionar_lote(1.0, 1.0, None, resortes, aceites)
+    informar(1.0, f"Catálogos listos ({len(resortes)} resortes, {len(aceites)} aceites)")
+    return resortes, aceites
+
+
+def abrir_almacen():
+    """Almacén de resultados, abierto la primera vez; None si no se puede abrir."""
+    global _almacen_resultados
+    if _almacen_resultados is None:
+        try:
+            _almacen_resultados = almacen.Almacen(tam_lote=1)  # cada selección se escribe al momento
+        except sqlite3.Error:
+            return None
+    return _almacen_resultados
+
+
+def calcular_seleccion(w_n_obj, m, A0, limites=None, informar=_sin_informe):
+    """
+    Selecciona resorte y aceite y genera la señal x(t) para (ω_n, m, A0).
+    limites (restricciones.Limites) restringe los resortes candidatos.
+    El resultado se memoriza; la caché se vacía si cambia algún Excel.
+    Cada selección nueva queda en el almacén de resultados (con la señal
+    submuestreada) y, si ya estaba guardada, se reutiliza sin recalcular.
+    informar(fraccion, texto) recibe el avance por etapas (ver tareas.Tarea).
+    """
+    informar(0.0, "Cargando catálogos...")
+    resortes = catalogo.cargar_resortes()
+    aceites = catalogo.cargar_aceites()
+    version = memo.version_catalogos(resortes, aceites)
+    cache = _cache_seleccion.con_version(version)
+
+    def calcular():
+        informar(0.3, "Seleccionando resorte y aceite...")
+        alm = abrir_almacen()
+        guardado = False
+        if alm is not None:
+            guardado, res = alm.buscar(w_n_obj, m, A0, version, limites=limites)
+        if not guardado:
+            res = seleccion.seleccionar_lote(w_n_obj, m, A0, resortes, aceites, limites=limites)
+        if res.i_resorte < 0:
+            raise ValueError("Ningún resorte del catálogo cumple la deflexión máxima para esa masa y amplitud.")
+        zeta = float(res.zeta)
+        w_d = float(res.w_d)
+
+        # Generar señal
+        informar(0.7, "Simulando x(t)...")
+        with perfil.etapa("simulacion"):
+            t = np.linspace(0, 5, 2000)
+            # Forma cerrada válida también con ζ >= 1 (sobreamortiguado: w_d = 0)
+            x = respuesta.respuesta_libre(float(res.m), float(res.k), float(res.c), t, A0)[0]
+        if alm is not None and not guardado:
+            alm.agregar(res, resortes, aceites, limites=limites, t=t, x=x)
+        return {
+            "sel_resorte": resortes.fila(int(res.i_resorte)),
+            "sel_aceite": aceites.fila(int(res.i_aceite)),
+            "zeta": zeta,
+            "w_d": w_d,
+            "t": t,
+            "x": x,
+        }
+
+    clave_limites = None if limites is None else limites.clave()
+    return cache.obtener_o_calcular((w_n_obj, m, A0, clave_limites), calcular)
+
 # -----------------------------
 # Clase principal
 # -----------------------------
@@ -18,16 +126,26 @@ class Resoil:
 
         self.img = None
         self.img2 = None
-        self.result = None
+        self.result = None  # gráfica con el último resultado (grafica.GraficaRespuesta)
+        self.grafica = None  # se crea con la primera selección (importa matplotlib)
 
         # Objetos físicos (inicialmente None)
         self.resorte = None
         self.amortiguador = None
 
+        # Tarea en segundo plano en curso (tareas.Tarea), qué hacer al terminar
+        # y id del root.after que la sondea (un solo sondeo a la vez)
+        self.tarea = None
+        self._al_terminar = None
+        self._sondeo = None
+
         self._crear_menu()
         self._crear_panel_controles()
         self._crear_canvas()
 
+        # Cargar catálogos sin bloquear la ventana
+        self._lanzar_tarea(tareas.Tarea(precargar_catalogos), lambda _: None)
+
     # ----------------------------
     # Secciones de UI
     # ----------------------------
@@ -38,6 +156,18 @@ class Resoil:
         archivo_menu.add_separator()
         archivo_menu.add_command(label="Salir", command=self.root.quit)
         menubar.add_cascade(label="Archivo", menu=archivo_menu)
+
+        perfil_menu = tk.Menu(menubar, tearoff=0)
+        self.var_perfil = tk.BooleanVar(value=perfil.activo())
+        perfil_menu.add_checkbutton(label="Medir etapas", variable=self.var_perfil,
+                                    command=self.alternar_perfil)
+        perfil_menu.add_command(label="Ver tiempos por etapa", command=self.ver_perfil)
+        perfil_menu.add_command(label="Reiniciar tiempos", command=_registro_perfil.limpiar)
+        menubar.add_cascade(label="Perfil", menu=perfil_menu)
+
+        resultados_menu = tk.Menu(menubar, tearoff=0)
+        resultados_menu.add_command(label="Ver historial", command=self.ver_historial)
+        menubar.add_cascade(label="Resultados", menu=resultados_menu)
         self.root.config(menu=menubar)
 
     def _crear_panel_controles(self):
@@ -65,7 +195,21 @@ class Resoil:
         ttk.Label(frame, text="=== RESORTE ===", font=("Arial", 10, "bold")).pack(pady=(5,8))
         
         ttk.Button(frame, text="Seleccionar resorte y aceite y graficar",
-                   command=self.seleccionar_y_graficar).pack(fill=tk.X, pady=10)
+                   command=self.seleccionar_y_graficar).pack(fill=tk.X, pady=(10,4))
+        self.var_deflexion = tk.BooleanVar(value=False)
+        ttk.Checkbutton(frame, text="Respetar deflexión máxima (m·g/k + A0)",
+                        variable=self.var_deflexion).pack(anchor=tk.W, pady=2)
+
+        # Avance de la tarea en segundo plano
+        self.barra_progreso = ttk.Progressbar(frame, maximum=1.0)
+        self.barra_progreso.pack(fill=tk.X, pady=2)
+        self.label_estado = ttk.Label(frame, text="", wraplength=280)
+        self.label_estado.pack(pady=2)
+        self.boton_cancelar = ttk.Button(frame, text="Cancelar", command=self.cancelar_tarea,
+                                         state=tk.DISABLED)
+        self.boton_cancelar.pack(fill=tk.X, pady=(2,4))
+        self.label_seleccion = ttk.Label(frame, text="", foreground="blue", wraplength=280)
+        self.label_seleccion.pack(pady=(2,10))
 
         ttk.Label(frame, text="Nombre").pack()
         self.entry_r_nombre = ttk.Entry(frame, width=20)
@@ -198,12 +342,49 @@ class Resoil:
 
     def guardar_resultado(self):
         if self.result is None:
-            messagebox.showwarning("Aviso", "No hay imagen para guardar.")
+            messagebox.showwarning("Aviso", "No hay resultado para guardar.")
             return
-        path = filedialog.asksaveasfilename(defaultextension=".png")
+        path = filedialog.asksaveasfilename(
+            defaultextension=".png",
+            filetypes=[("Imagen PNG", "*.png"), ("PDF", "*.pdf"), ("SVG", "*.svg"),
+                       ("Datos CSV (t, x)", "*.csv"), ("Datos NumPy (t, x)", "*.npy")])
         if path:
-            self.result.save(path)
-            messagebox.showinfo("Guardado", f"Imagen guardada en {path}")
+            try:
+                self.result.guardar(path)
+                messagebox.showinfo("Guardado", f"Resultado guardado en {path}")
+            except Exception as e:
+                messagebox.showerror("Error guardando", str(e))
+
+    # -----------------------------
+    # Medición por etapas (perfil)
+    # -----------------------------
+    def alternar_perfil(self):
+        if self.var_perfil.get():
+            perfil.activar(_registro_perfil, memoria=True)
+        else:
+            perfil.desactivar()
+
+    def ver_perfil(self):
+        if not _registro_perfil.resumen():
+            messagebox.showinfo("Perfil", "No hay mediciones. Active Perfil → Medir etapas y haga una selección.")
+            return
+        messagebox.showinfo("Tiempos por etapa", _registro_perfil.texto())
+
+    # -----------------------------
+    # Historial de selecciones (almacen)
+    # -----------------------------
+    def ver_historial(self):
+        alm = abrir_almacen()
+        filas = [] if alm is None else alm.historial(20)
+        if not filas:
+            messagebox.showinfo("Historial", "Todavía no hay selecciones guardadas.")
+            return
+        lineas = [
+            f"{time.strftime('%Y-%m-%d %H:%M', time.localtime(f['creado']))}  "
+            f"ω_n={f['wn']:g} m={f['m']:g}  {f['resorte']} + {f['aceite']}  ζ={f['zeta']:.3f}"
+            for f in filas if f["resorte"] is not None
+        ]
+        messagebox.showinfo(f"Últimas selecciones ({almacen.ARCHIVO_RESULTADOS})", "\n".join(lineas))
 
     # -----------------------------
     # Transformaciones de imagen (ejemplo que llamará a main si existen)
@@ -327,10 +508,59 @@ class Resoil:
             messagebox.showinfo("Relación amortiguamiento", texto)
         except Exception as e:
             messagebox.showerror("Error calculando ζ", str(e))
-       # ---------------------------------------------------------
+    # -----------------------------
+    # Tareas en segundo plano (el cálculo no corre en el hilo de Tk)
+    # -----------------------------
+    def _lanzar_tarea(self, tarea, al_terminar):
+        self.tarea = tarea
+        self._al_terminar = al_terminar
+        self.barra_progreso.config(value=0.0)
+        self.boton_cancelar.config(state=tk.NORMAL)
+        tarea.iniciar()
+        if self._sondeo is not None:
+            # La tarea anterior se abandona: su sondeo no debe seguir junto al nuevo
+            self.root.after_cancel(self._sondeo)
+        self._sondeo = self.root.after(50, self._sondear_tarea)
+
+    def _sondear_tarea(self):
+        self._sondeo = None
+        tarea = self.tarea
+        if tarea is None:
+            return
+        for evento in tarea.eventos():
+            tipo = evento[0]
+            if tipo == "progreso":
+                self.barra_progreso.config(value=evento[1])
+                self.label_estado.config(text=evento[2])
+                continue
+            # Evento final: resultado, error o cancelación
+            self.tarea = None
+            self.boton_cancelar.config(state=tk.DISABLED)
+            if tipo == "resultado":
+                self.barra_progreso.config(value=1.0)
+                self._al_terminar(evento[1])
+            elif tipo == "error":
+                self.label_estado.config(text="Error")
+                messagebox.showerror("Error", str(evento[1]))
+            else:
+                self.barra_progreso.config(value=0.0)
+                self.label_estado.config(text="Cancelado")
+            return
+        self._sondeo = self.root.after(50, self._sondear_tarea)
+
+    def cancelar_tarea(self):
+        if self.tarea is not None:
+            self.tarea.cancelar()
+            self.label_estado.config(text="Cancelando...")
+
+    # ---------------------------------------------------------
     # FUNCIÓN: Buscar resorte, aceite y graficar x(t)
     # ---------------------------------------------------------
     def seleccionar_y_graficar(self):
+        if self.tarea is not None and self.tarea.activa:
+            # p. ej. la precarga: la carga en curso termina igual y la selección
+            # espera al candado de catalogo en vez de leer el archivo otra vez
+            self.tarea.cancelar()
         try:
             # Pedir datos al usuario
             w_n_obj = float(simpledialog.askstring("Frecuencia natural",
@@ -339,63 +569,35 @@ class Resoil:
                                              "Ingrese la masa (kg):"))
             A0 = float(simpledialog.askstring("Amplitud",
                                               "Ingrese la amplitud inicial (m):"))
-
-            # --- Cargar Excel ---
-            df_resortes = pd.read_excel("Resortes_resoil.xlsx")
-            df_aceites = pd.read_excel("Aceites_resoil.xlsx")
-
-            # Buscar columna de k
-            col_k = "[Y] Constante elástica (lbs/in)"
-            # k requerido
-            k_req = m * w_n_obj**2
-            
-            
-            # convertir la k del Excel
-            df_resortes["k_Nm"] = df_resortes[col_k] * 175.1268
-
-
-            df_resortes["error_k"] = abs(df_resortes["k_Nm"] - k_req)
-            sel_resorte = df_resortes.loc[df_resortes["error_k"].idxmin()]
-            k = sel_resorte["k_Nm"]
-
-            # Buscar columna de viscosidad
-            col_visc = "Visc_40 (mm²/s)"
-            alpha = 5  # factor geométrico del amortiguador
-            df_aceites["c_calc"] = df_aceites[col_visc] * alpha
-            df_aceites["zeta"] = df_aceites["c_calc"] / (2 * np.sqrt(m*k))
-            df_aceites["error_z"] = abs(df_aceites["zeta"] - 0.2)
-
-            sel_aceite = df_aceites.loc[df_aceites["error_z"].idxmin()]
-            c = sel_aceite["c_calc"]
-
-            # Cálculos dinámicos
-            zeta = c / (2 * np.sqrt(m*k))
-            w_d = w_n_obj * np.sqrt(1 - zeta**2)
-
-            # Generar señal
-            t = np.linspace(0, 5, 2000)
-            x = A0 * np.exp(-zeta * w_n_obj * t) * np.cos(w_d * t)
-
-            # Mostrar info seleccionada
-            info = (
-                f"Resorte seleccionado:\n{sel_resorte}\n\n"
-                f"Aceite seleccionado:\n{sel_aceite}\n\n"
-                f"ζ = {zeta:.4f}\n"
-                f"ω_d = {w_d:.4f} rad/s"
-            )
-            messagebox.showinfo("Selección automática", info)
-
-            # Graficar
-            plt.figure()
-            plt.plot(t, x)
-            plt.title("Respuesta x(t)")
-            plt.xlabel("Tiempo (s)")
-            plt.ylabel("Desplazamiento (m)")
-            plt.grid(True)
-            plt.show()
-
         except Exception as e:
             messagebox.showerror("Error", str(e))
+            return
+
+        # --- Selección y señal en segundo plano (memorizadas por entradas + versión de catálogos) ---
+        limites = restricciones.Limites() if self.var_deflexion.get() else None
+        self._lanzar_tarea(tareas.Tarea(calcular_seleccion, w_n_obj, m, A0, limites), self._mostrar_seleccion)
+
+    def _mostrar_seleccion(self, r):
+        sel_resorte, sel_aceite = r["sel_resorte"], r["sel_aceite"]
+        zeta, w_d = r["zeta"], r["w_d"]
+        t, x = r["t"], r["x"]
+
+        # Mostrar info seleccionada (resumen, sin bloquear la ventana)
+        info = (
+            f"Resorte: {sel_resorte['nombre']} (k = {sel_resorte['k_Nm']:.1f} N/m)\n"
+            f"Aceite: {sel_aceite['nombre']} (Visc_40 = {sel_aceite['Visc_40']:g} mm²/s)\n"
+            f"ζ = {zeta:.4f}\n"
+            f"ω_d = {w_d:.4f} rad/s"
+        )
+        self.label_seleccion.config(text=info)
+        self.label_estado.config(text="Selección lista")
+
+        # Graficar en el canvas de la ventana (una sola figura reutilizada)
+        with perfil.etapa("render"):
+            if self.grafica is None:
+                self.grafica = grafica.GraficaRespuesta(self.canvas)
+            self.grafica.actualizar(t, x, titulo=f"Respuesta x(t) — {sel_resorte['nombre']} + {sel_aceite['nombre']}")
+        self.result = self.grafica
 
 
 # -----------------------------
@@ -0,0 +1,302 @@
+from functools import partial
+from typing import Callable, Iterator, Optional, Tuple, Union
+
+import numpy as np
+
+ArrayLike = Union[float, np.ndarray]
+
+# |ζ - 1| por debajo de esta tolerancia se trata como amortiguamiento crítico
+# (las fórmulas sub/sobreamortiguadas pierden precisión cerca de ζ = 1).
+TOL_CRITICO = 1e-6
+
+
+# ----------------------------------------------------------
+def _sistemas(m: ArrayLike, k: ArrayLike, c: ArrayLike, x0: ArrayLike, v0: ArrayLike):
+    """
+    Lleva m, k, c, x0, v0 a arrays 1-D de la misma longitud (un elemento por sistema).
+    """
+    m, k, c, x0, v0 = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(a, dtype=np.float64)) for a in (m, k, c, x0, v0))
+    )
+    if m.ndim != 1:
+        raise ValueError("m, k, c, x0 y v0 deben ser escalares o arrays 1-D (uno por sistema).")
+    if np.any(m <= 0) or np.any(k <= 0):
+        raise ValueError("masa (kg) y k (N/m) deben ser > 0.")
+    if np.any(c < 0):
+        raise ValueError("c (N·s/m) debe ser >= 0.")
+    return m, k, c, x0, v0
+
+
+def _buffer(out: Optional[np.ndarray], forma: Tuple[int, int], dtype) -> np.ndarray:
+    if out is None:
+        return np.empty(forma, dtype=dtype)
+    if out.shape != forma:
+        raise ValueError(f"El buffer de salida debe tener forma {forma}, no {out.shape}.")
+    return out
+
+
+def _col(dtype, q: np.ndarray) -> np.ndarray:
+    """Parámetros por sistema como columna (S, 1) para combinarlos con t (1, T)."""
+    return q.astype(dtype, copy=False)[:, None]
+
+
+def _polo_max(m: np.ndarray, k: np.ndarray, c: np.ndarray) -> np.ndarray:
+    """
+    Módulo del polo más rápido de m·x'' + c·x' + k·x: ω_n si ζ <= 1 (polos
+    complejos sobre el círculo de radio ω_n), c/2m + sqrt((c/2m)² - ω_n²) si ζ > 1.
+    """
+    a = c / (2 * m)
+    w2 = k / m
+    return np.where(a * a > w2, a + np.sqrt(np.maximum(a * a - w2, 0.0)), np.sqrt(w2))
+
+
+def regimen(zeta: ArrayLike) -> np.ndarray:
+    """
+    Clasifica cada ζ: -1 subamortiguado, 0 crítico (|ζ-1| < TOL_CRITICO), 1 sobreamortiguado.
+    """
+    zeta = np.asarray(zeta, dtype=np.float64)
+    return np.where(np.abs(zeta - 1) < TOL_CRITICO, 0, np.where(zeta < 1, -1, 1))
+
+
+# ==========================================================
+#  RESPUESTA LIBRE EN FORMA CERRADA
+# ==========================================================
+def respuesta_libre(
+    m: ArrayLike,
+    k: ArrayLike,
+    c: ArrayLike,
+    t: np.ndarray,
+    x0: ArrayLike,
+    v0: ArrayLike = 0.0,
+    out: Optional[np.ndarray] = None,
+    out_v: Optional[np.ndarray] = None,
+    dtype=np.float64,
+) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+    """
+    Respuesta libre x(t) de S sistemas masa-resorte-amortiguador,
+        m·x'' + c·x' + k·x = 0,  x(0) = x0,  x'(0) = v0,
+    evaluada en forma cerrada sobre la malla de tiempos t (s).
+
+    Con ω_n = sqrt(k/m), ζ = c / (2·sqrt(m·k)) y σ = ζ·ω_n:
+      - ζ < 1 (sub):   x = e^(-σt)·(x0·cos ω_d t + (v0 + σ·x0)/ω_d · sin ω_d t),  ω_d = ω_n·sqrt(1-ζ²)
+      - ζ = 1 (crít.): x = e^(-ω_n t)·(x0 + (v0 + ω_n·x0)·t)
+      - ζ > 1 (sobre): x = C1·e^(s1 t) + C2·e^(s2 t),  s1,2 = -ω_n·(ζ ∓ sqrt(ζ²-1))
+
+    m, k, c, x0, v0: escalares o arrays 1-D (uno por sistema, con broadcasting).
+    t: array 1-D de T tiempos.
+    out / out_v: buffers (S, T) opcionales donde escribir x y v (se reutilizan
+    entre llamadas para no reservar memoria cada vez).
+    dtype: np.float64 (por defecto) o np.float32 para la salida.
+
+    Devuelve x con forma (S, T); si se pasa out_v devuelve (x, v).
+    """
+    m, k, c, x0, v0 = _sistemas(m, k, c, x0, v0)
+    t = np.asarray(t, dtype=np.float64)
+    if t.ndim != 1:
+        raise ValueError("t debe ser un array 1-D.")
+
+    forma = (len(m), len(t))
+    x = _buffer(out, forma, dtype)
+    v = None if out_v is None else _buffer(out_v, forma, dtype)
+    tt = t.astype(x.dtype, copy=False)[None, :]
+    col = partial(_col, x.dtype)
+
+    w_n = np.sqrt(k / m)
+    zeta = c / (2 * np.sqrt(m * k))
+    reg = regimen(zeta)
+
+    # Cada régimen se evalúa sólo sobre sus filas: ninguna rama produce NaN.
+    sub = np.flatnonzero(reg < 0)
+    if sub.size:
+        wn, z, a = w_n[sub], zeta[sub], x0[sub]
+        sigma = z * wn
+        wd = wn * np.sqrt(1 - z**2)
+        b = (v0[sub] + sigma * a) / wd
+        env = np.exp(-col(sigma) * tt)
+        cos = np.cos(col(wd) * tt)
+        sin = np.sin(col(wd) * tt)
+        x[sub] = env * (col(a) * cos + col(b) * sin)
+        if v is not None:
+            v[sub] = env * (col(b * wd - sigma * a) * cos - col(a * wd + sigma * b) * sin)
+
+    crit = np.flatnonzero(reg == 0)
+    if crit.size:
+        wn, a = w_n[crit], x0[crit]
+        b = v0[crit] + wn * a
+        env = np.exp(-col(wn) * tt)
+        lin = col(a) + col(b) * tt
+        x[crit] = env * lin
+        if v is not None:
+            v[crit] = env * (col(b) - col(wn) * lin)
+
+    sobre = np.flatnonzero(reg > 0)
+    if sobre.size:
+        wn, z, a = w_n[sobre], zeta[sobre], x0[sobre]
+        raiz = np.sqrt(z**2 - 1)
+        s1 = -wn * (z - raiz)
+        s2 = -wn * (z + raiz)
+        c1 = (v0[sobre] - s2 * a) / (s1 - s2)
+        c2 = a - c1
+        e1 = np.exp(col(s1) * tt)
+        e2 = np.exp(col(s2) * tt)
+        x[sobre] = col(c1) * e1 + col(c2) * e2
+        if v is not None:
+            v[sobre] = col(c1 * s1) * e1 + col(c2 * s2) * e2
+
+    return x if v is None else (x, v)
+
+
+# ==========================================================
+#  RESPUESTA POR BLOQUES (simulaciones largas)
+# ==========================================================
+def respuesta_por_bloques(
+    m: ArrayLike,
+    k: ArrayLike,
+    c: ArrayLike,
+    x0: ArrayLike,
+    v0: ArrayLike = 0.0,
+    duracion: float = 5.0,
+    fs: float = 1000.0,
+    tam_bloque: int = 65536,
+    archivo: Optional[str] = None,
+    dtype=np.float64,
+) -> Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Genera la respuesta libre en bloques de tiempo de tam_bloque muestras,
+    con memoria acotada sin importar la duración.
+
+    Se muestrean N = floor(duracion·fs) instantes t_i = i/fs. Cada bloque se
+    evalúa en forma cerrada (respuesta_libre) partiendo del estado (x, v) con
+    que terminó el anterior, así que la señal es continua entre bloques.
+
+    Cada iteración produce (t, x, v, a): t con forma (n,) y x, v, a con forma
+    (S, n), con a = -(c·v + k·x)/m. Los arrays x, v y a reutilizan los mismos
+    buffers en todos los bloques: copiarlos si se quieren conservar.
+
+    archivo (opcional):
+      - "*.npy": se crea un .npy mapeado en memoria con forma (3, S, N)
+        (x, v, a) y cada bloque se escribe en su sitio.
+      - otro nombre: binario crudo al que se añade cada bloque como un
+        array (3, S, n) en orden C, con el dtype indicado.
+    """
+    m, k, c, x0, v0 = _sistemas(m, k, c, x0, v0)
+    if fs <= 0 or duracion < 0:
+        raise ValueError("fs debe ser > 0 y duracion >= 0.")
+    if tam_bloque <= 0:
+        raise ValueError("tam_bloque debe ser > 0.")
+
+    S = len(m)
+    N = int(np.floor(duracion * fs))
+    dt = 1.0 / fs
+    # Malla local común a todos los bloques completos (+1 muestra para el estado final)
+    t_local = np.arange(tam_bloque + 1) * dt
+    x = np.empty((S, tam_bloque + 1), dtype=dtype)
+    v = np.empty_like(x)
+    a = np.empty((S, tam_bloque), dtype=dtype)
+
+    destino = None
+    if archivo is not None:
+        if archivo.endswith(".npy"):
+            destino = np.lib.format.open_memmap(archivo, mode="w+", dtype=dtype, shape=(3, S, N))
+        else:
+            destino = open(archivo, "wb")
+
+    try:
+        xi, vi = x0, v0
+        for ini in range(0, N, tam_bloque):
+            n = min(tam_bloque, N - ini)
+            if n == tam_bloque:
+                xb, vb = x, v
+            else:
+                xb, vb = x[:, : n + 1], v[:, : n + 1]
+            respuesta_libre(m, k, c, t_local[: n + 1], xi, vi, out=xb, out_v=vb, dtype=dtype)
+
+            xs, vs, ac = xb[:, :n], vb[:, :n], a[:, :n]
+            np.multiply(c[:, None], vs, out=ac)
+            ac += k[:, None] * xs
+            ac /= -m[:, None]
+
+            if isinstance(destino, np.ndarray):
+                destino[0, :, ini : ini + n] = xs
+                destino[1, :, ini : ini + n] = vs
+                destino[2, :, ini : ini + n] = ac
+            elif destino is not None:
+                np.stack((xs, vs, ac)).tofile(destino)
+
+            # Estado al inicio del siguiente bloque
+            xi = xb[:, n].astype(np.float64)
+            vi = vb[:, n].astype(np.float64)
+            yield ini * dt + t_local[:n], xs, vs, ac
+    finally:
+        if isinstance(destino, np.ndarray):
+            destino.flush()
+        elif destino is not None:
+            destino.close()
+
+
+# ==========================================================
+#  INTEGRADOR NUMÉRICO (con fuerza externa)
+# ==========================================================
+def integrar(
+    m: ArrayLike,
+    k: ArrayLike,
+    c: ArrayLike,
+    t: np.ndarray,
+    fuerza: Optional[Callable[[float], ArrayLike]] = None,
+    x0: ArrayLike = 0.0,
+    v0: ArrayLike = 0.0,
+    out: Optional[np.ndarray] = None,
+    out_v: Optional[np.ndarray] = None,
+    dtype=np.float64,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Integra m·x'' + c·x' + k·x = F(t) con Runge-Kutta 4 de paso fijo sobre la
+    malla t, para S sistemas a la vez (cada paso es una operación vectorizada).
+
+    fuerza: función F(t) → escalar o array (S,) en N; None equivale a F = 0.
+    El paso es el de la malla (puede no ser uniforme). RK4 es estable si el
+    polo más rápido cumple |λ|·Δt <= 2.5 (todo el semicírculo de ese radio
+    está dentro de su región de estabilidad); en otro caso se lanza
+    ValueError. |λ| = ω_n con ζ <= 1 y ω_n·(ζ + sqrt(ζ² - 1)) con ζ > 1, así
+    que un sistema muy sobreamortiguado necesita un paso mucho menor.
+
+    Devuelve (x, v) con forma (S, T), escritos en out / out_v si se pasan.
+    """
+    m, k, c, x0, v0 = _sistemas(m, k, c, x0, v0)
+    t = np.asarray(t, dtype=np.float64)
+    if t.ndim != 1 or len(t) == 0:
+        raise ValueError("t debe ser un array 1-D no vacío.")
+
+    dt = np.diff(t)
+    if dt.size and np.max(_polo_max(m, k, c)) * np.max(dt) > 2.5:
+        raise ValueError("Paso de tiempo demasiado grande para RK4 (|λ|·Δt > 2.5).")
+
+    forma = (len(m), len(t))
+    x = _buffer(out, forma, dtype)
+    v = _buffer(out_v, forma, dtype)
+
+    F = (lambda _t: 0.0) if fuerza is None else fuerza
+    inv_m = 1.0 / m
+
+    def acel(ti, xi, vi):
+        return (np.asarray(F(ti), dtype=np.float64) - c * vi - k * xi) * inv_m
+
+    xi = x0.copy()
+    vi = v0.copy()
+    x[:, 0] = xi
+    v[:, 0] = vi
+    for n, h in enumerate(dt):
+        ti = t[n]
+        a1 = acel(ti, xi, vi)
+        x2, v2 = xi + 0.5 * h * vi, vi + 0.5 * h * a1
+        a2 = acel(ti + 0.5 * h, x2, v2)
+        x3, v3 = xi + 0.5 * h * v2, vi + 0.5 * h * a2
+        a3 = acel(ti + 0.5 * h, x3, v3)
+        x4, v4 = xi + h * v3, vi + h * a3
+        a4 = acel(ti + h, x4, v4)
+        xi = xi + h / 6.0 * (vi + 2 * v2 + 2 * v3 + v4)
+        vi = vi + h / 6.0 * (a1 + 2 * a2 + 2 * a3 + a4)
+        x[:, n + 1] = xi
+        v[:, n + 1] = vi
+
+    return x, v
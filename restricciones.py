@@ -0,0 +1,497 @@
+"""
+Restricciones de geometría y deflexión sobre el catálogo de resortes.
+
+Las restricciones de geometría son máscaras booleanas sobre las filas del
+catálogo; se combinan con AND y con el resultado se filtra el índice ordenado
+por k *antes* de buscar el resorte más cercano. Filtrar el índice no
+reordena nada (se toman las posiciones permitidas del orden ya calculado),
+así que una consulta muy restringida cuesta lo mismo que una sin
+restricciones: O(n) para la máscara, que se guarda en caché, y O(log n) por
+punto para la búsqueda.
+
+La deflexión depende de cada punto (m, A0), así que no se resuelve con una
+máscara por punto. En el orden de k, las filas se agrupan en bloques de
+_FILAS_BLOQUE y los bloques en un árbol binario; cada nodo guarda la
+envolvente superior de sus puntos (k, k·def_max), de modo que
+
+    max k·(def_max - A0) en el nodo = max (k·def_max - A0·k) sobre la envolvente
+
+se obtiene para cualquier A0 con una búsqueda binaria. El primer resorte
+permitido a cada lado de k_req se encuentra subiendo y bajando por el árbol
+(saltando nodos cuya carga máxima no alcanza m·g) y recorriendo un solo
+bloque fila a fila: O(log n) por punto, sea cual sea la cantidad de valores
+distintos de m y A0. El árbol depende sólo de los límites de geometría y se
+construye una vez por límites.
+
+Las filas sin dato (NaN) en una columna restringida no cumplen la restricción.
+"""
+from typing import Hashable, List, Optional, Tuple
+
+import numpy as np
+
+import catalogo
+import memo
+from indice import IndiceResortes, elegir
+
+G = 9.81  # m/s²
+
+# Filas por bloque del árbol de deflexión (dentro de un bloque se comprueba fila a fila)
+_FILAS_BLOQUE = 8
+# Árboles de deflexión guardados por filtro (uno por límites de geometría distintos)
+_MAX_ARBOLES = 8
+
+
+# ==========================================================
+#  CLASE: LÍMITES
+# ==========================================================
+class Limites:
+    """
+    Límites que debe cumplir el resorte (None = sin límite):
+      - deflexion: la compresión máxima no supera def_max:
+            m·g/k + A0 <= def_max     (A0 = 0 si no se conoce la amplitud)
+      - d_alojamiento: diámetro del alojamiento (m); exige dm_ex <= d_alojamiento
+      - d_vastago: diámetro del vástago o guía (m); exige dm_in >= d_vastago
+      - long_max: longitud libre máxima (m); exige long_libre <= long_max
+    """
+
+    def __init__(
+        self,
+        deflexion: bool = True,
+        d_alojamiento: Optional[float] = None,
+        d_vastago: Optional[float] = None,
+        long_max: Optional[float] = None,
+    ) -> None:
+        for nombre, valor in (("d_alojamiento", d_alojamiento), ("d_vastago", d_vastago), ("long_max", long_max)):
+            if valor is not None and not valor > 0:
+                raise ValueError(f"{nombre} debe ser > 0.")
+        self.deflexion = bool(deflexion)
+        self.d_alojamiento = None if d_alojamiento is None else float(d_alojamiento)
+        self.d_vastago = None if d_vastago is None else float(d_vastago)
+        self.long_max = None if long_max is None else float(long_max)
+
+    def clave(self) -> Tuple:
+        """Tupla hashable con los límites (para cachés)."""
+        return (self.deflexion, self.d_alojamiento, self.d_vastago, self.long_max)
+
+    def __repr__(self) -> str:
+        return (
+            f"Limites(deflexion={self.deflexion}, d_alojamiento={self.d_alojamiento}, "
+            f"d_vastago={self.d_vastago}, long_max={self.long_max})"
+        )
+
+
+# ==========================================================
+#  CLASE: FILTRO DE RESORTES
+# ==========================================================
+class FiltroResortes:
+    """
+    Máscaras precalculadas sobre un catálogo de resortes e índices de k
+    filtrados por ellas.
+
+    - Las máscaras de geometría (alojamiento, vástago, longitud) sólo
+      dependen del límite; la de deflexión depende de (m, A0), porque
+      m·g/k + A0 <= def_max  ⇔  k·(def_max - A0) >= m·g.
+    - Cada máscara y cada índice filtrado se guardan en una caché LRU, y el
+      árbol de deflexión de cada límite en otra, con el tope de bytes
+      calculado para el tamaño del catálogo; repetir los mismos límites no
+      vuelve a recorrer el catálogo.
+    """
+
+    def __init__(self, cat: catalogo.Catalogo, max_entradas: int = 256) -> None:
+        self.indice = IndiceResortes.desde_catalogo(cat)
+        self.k = cat["k_Nm"]
+        self.def_max = cat["def_max"]
+        self.dm_in = cat["dm_in"]
+        self.dm_ex = cat["dm_ex"]
+        self.long_libre = cat["long_libre"]
+        self._cache = memo.CacheLRU(max_entradas=max_entradas)
+        self._arboles = memo.CacheLRU(
+            max_entradas=_MAX_ARBOLES, max_bytes=_MAX_ARBOLES * _ArbolDeflexion.cota_bytes(len(self.indice.orden))
+        )
+
+    @classmethod
+    def desde_catalogo(cls, cat: catalogo.Catalogo) -> "FiltroResortes":
+        """Filtro del catálogo, construido una sola vez por catálogo cargado."""
+        filtro = cat.__dict__.get("_filtro")
+        if filtro is None:
+            filtro = cat.__dict__["_filtro"] = cls(cat)
+        return filtro
+
+    def __len__(self) -> int:
+        return len(self.k)
+
+    # ----------------------------------------------------------
+    def _mascara(self, clave: Hashable, calcular) -> np.ndarray:
+        return self._cache.obtener_o_calcular(("mascara", clave), calcular)
+
+    def mascara(self, limites: Limites, m: Optional[float] = None, A0: Optional[float] = None) -> np.ndarray:
+        """
+        Filas que cumplen todos los límites (AND de las máscaras individuales).
+        La deflexión sólo se comprueba si limites.deflexion y se da m.
+        """
+        partes = []
+        if limites.deflexion and m is not None:
+            a0 = 0.0 if A0 is None or np.isnan(A0) else float(A0)
+            carga = float(m) * G
+            partes.append(self._mascara(("deflexion", carga, a0), lambda: self.k * (self.def_max - a0) >= carga))
+        if limites.d_alojamiento is not None:
+            d = limites.d_alojamiento
+            partes.append(self._mascara(("alojamiento", d), lambda: self.dm_ex <= d))
+        if limites.d_vastago is not None:
+            d = limites.d_vastago
+            partes.append(self._mascara(("vastago", d), lambda: self.dm_in >= d))
+        if limites.long_max is not None:
+            lm = limites.long_max
+            partes.append(self._mascara(("long_max", lm), lambda: self.long_libre <= lm))
+
+        if not partes:
+            return np.ones(len(self), dtype=bool)
+        mascara = partes[0].copy()
+        for p in partes[1:]:
+            mascara &= p
+        return mascara
+
+    def indice_filtrado(
+        self, limites: Limites, m: Optional[float] = None, A0: Optional[float] = None
+    ) -> Optional[IndiceResortes]:
+        """
+        Índice de k restringido a las filas permitidas, o None si no queda
+        ninguna. Se obtiene del índice completo sin reordenar.
+        """
+        a0 = None if A0 is None or np.isnan(A0) else float(A0)
+        clave = ("indice", limites.clave(), None if m is None else float(m), a0)
+
+        def calcular():
+            # Sólo se guardan los arrays propios del índice filtrado (valores es compartido)
+            permitidas = self.mascara(limites, m, a0)[self.indice.orden]
+            return self.indice.orden[permitidas], self.indice.ordenado[permitidas]
+
+        orden, ordenado = self._cache.obtener_o_calcular(clave, calcular)
+        if len(orden) == 0:
+            return None
+        return IndiceResortes.desde_ordenado(self.indice.valores, orden, ordenado)
+
+    # ----------------------------------------------------------
+    def _geometria(self, limites: Limites) -> np.ndarray:
+        """Máscara sólo con los límites de geometría (sin deflexión)."""
+        return self.mascara(Limites(False, limites.d_alojamiento, limites.d_vastago, limites.long_max))
+
+    def _arbol(self, limites: Limites) -> "_ArbolDeflexion":
+        """Árbol de deflexión sobre las filas que cumplen la geometría (en caché por límites)."""
+        orden = self.indice.orden
+
+        def calcular():
+            return _ArbolDeflexion(self.k[orden], self.def_max[orden], self._geometria(limites)[orden])
+
+        return self._arboles.obtener_o_calcular(limites.clave(), calcular)
+
+    def mas_cercano(self, k_req: np.ndarray, limites: Limites, m: np.ndarray, A0: np.ndarray) -> np.ndarray:
+        """
+        Fila con k más cercana a k_req entre las que cumplen los límites para
+        su (m, A0); -1 donde ninguna los cumple. Empates como idxmin(): gana
+        la fila que aparece primero en el catálogo.
+        """
+        k_req, m, A0 = np.broadcast_arrays(*(np.asarray(a, dtype=np.float64) for a in (k_req, m, A0)))
+        filas = np.full(k_req.shape, -1, dtype=np.intp)
+
+        if not limites.deflexion:
+            ind = self.indice_filtrado(limites)
+            if ind is not None:
+                filas[...] = ind.mas_cercano(k_req)
+            return filas
+
+        q = k_req.ravel()
+        carga = np.nan_to_num(m.ravel() * G, nan=np.inf)  # sin masa no se admite ninguna fila
+        a0 = np.nan_to_num(A0.ravel(), nan=0.0)  # amplitud desconocida = 0
+        ordenado = self.indice.ordenado
+        n = len(ordenado)
+        arbol = self._arbol(limites)
+
+        p = np.searchsorted(ordenado, q, side="left")
+        der = arbol.primero(p, a0, carga)
+        i = arbol.ultimo(p, a0, carga)
+        # Entre k repetidas, la primera fila permitida del grupo (como idxmin)
+        izq = i.copy()
+        if n:
+            desde = np.searchsorted(ordenado, ordenado[np.maximum(i, 0)], side="left")
+            repetida = np.flatnonzero((i >= 0) & (desde < i))
+            izq[repetida] = arbol.primero(desde[repetida], a0[repetida], carga[repetida])
+
+        hay_izq, hay_der = izq >= 0, der < n
+        fila_izq = self.indice.orden[np.clip(izq, 0, n - 1)]
+        fila_der = self.indice.orden[np.clip(der, 0, n - 1)]
+        err_izq = np.where(hay_izq, np.abs(ordenado[np.clip(izq, 0, n - 1)] - q), np.inf)
+        err_der = np.where(hay_der, np.abs(ordenado[np.clip(der, 0, n - 1)] - q), np.inf)
+        elegidas = elegir(err_izq, err_der, fila_izq, fila_der)
+        filas.reshape(-1)[...] = np.where(hay_izq | hay_der, elegidas, -1)
+        return filas
+
+
+# ==========================================================
+#  ÁRBOL DE DEFLEXIÓN
+# ==========================================================
+class _ArbolDeflexion:
+    """
+    Búsqueda de la primera / última fila permitida desde una posición, en el
+    orden de k, con la condición k·(def_max - A0) >= m·g de cada punto.
+
+    Las n filas se reparten en 2^T bloques de _FILAS_BLOQUE (los del final,
+    vacíos); el nodo i del nivel t cubre los bloques [i·2^t, (i+1)·2^t). Cada
+    nodo guarda, en formato compacto (vértices de todos los nodos seguidos y
+    desplazamientos), la envolvente superior de los puntos (k, c = k·def_max)
+    de sus filas permitidas por la geometría, con la pendiente hacia el
+    vértice siguiente. Como las filas están ordenadas por k, la envolvente de
+    un nodo es un tramo inicial de la de su hijo izquierdo seguido de un tramo
+    final de la del derecho (ver _unir()).
+    """
+
+    def __init__(self, k: np.ndarray, def_max: np.ndarray, permitida: np.ndarray) -> None:
+        n = len(k)
+        B = _FILAS_BLOQUE
+        self.n = n
+        self.niveles = max(-(-n // B) - 1, 0).bit_length() + 1  # T + 1
+        self.n_bloques = 1 << (self.niveles - 1)
+        relleno = self.n_bloques * B - n
+        self.k = np.concatenate((k, np.full(relleno, np.nan)))
+        self.def_max = np.concatenate((def_max, np.full(relleno, np.nan)))
+        with np.errstate(invalid="ignore"):
+            c = self.k * self.def_max
+        self.permitida = np.concatenate((permitida, np.zeros(relleno, dtype=bool))) & np.isfinite(c)
+
+        self.x: List[np.ndarray] = []  # k de los vértices
+        self.y: List[np.ndarray] = []  # k·def_max de los vértices
+        self.pendiente: List[np.ndarray] = []  # hacia el vértice siguiente (-inf en el último)
+        self.desde: List[np.ndarray] = []  # vértices del nodo i: [desde[i], desde[i + 1])
+        self.pasos: List[int] = []  # iteraciones de búsqueda binaria por nivel
+
+        # Nivel 0: cadena monótona dentro de cada bloque; los demás, uniendo las
+        # envolventes de los dos hijos por su puente (tangente superior común)
+        x, y, largo = _envolvente(
+            self.k.reshape(-1, B), np.where(self.permitida, c, 0.0).reshape(-1, B), self.permitida.reshape(-1, B)
+        )
+        validos = np.arange(x.shape[1]) < largo[:, None]
+        xs, ys = x[validos], y[validos]
+        for t in range(self.niveles):
+            if t:
+                xs, ys, largo = _unir(xs, ys, largo)
+            self._guardar(xs, ys, largo)
+
+    @staticmethod
+    def cota_bytes(n: int) -> int:
+        """Tamaño máximo del árbol para n filas (todas las filas, vértices en todos los niveles)."""
+        bloques = 1 << max(-(-n // _FILAS_BLOQUE) - 1, 0).bit_length()
+        filas = bloques * _FILAS_BLOQUE
+        niveles = bloques.bit_length()
+        return filas * 17 + niveles * filas * 24 + 2 * bloques * 8 + 4096
+
+    def _guardar(self, xs: np.ndarray, ys: np.ndarray, largo: np.ndarray) -> None:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            pendiente = np.diff(ys) / np.diff(xs) if len(xs) else xs
+        fin = np.cumsum(largo)
+        pendiente = np.append(pendiente, -np.inf)
+        pendiente[fin[largo > 0] - 1] = -np.inf  # último vértice de cada nodo
+        # Un vértice de más al final para que los nodos vacíos no indexen fuera del array
+        self.x.append(np.append(xs, 0.0))
+        self.y.append(np.append(ys, -np.inf))
+        self.pendiente.append(np.append(pendiente, -np.inf))
+        self.desde.append(np.concatenate(([0], fin)))
+        self.pasos.append(int(largo.max(initial=0)).bit_length())
+
+    # ----------------------------------------------------------
+    def _puede(self, t: int, nodo: np.ndarray, a0: np.ndarray, carga: np.ndarray) -> np.ndarray:
+        """
+        ¿Puede el nodo tener alguna fila con k·(def_max - A0) >= carga? Con un
+        margen relativo de 1e-9 por el redondeo: un sí de más sólo obliga a
+        revisar un bloque fila a fila.
+        """
+        ini = self.desde[t][nodo]
+        fin = self.desde[t][nodo + 1]
+        lo, hi = ini, np.maximum(fin - 1, ini)
+        pendiente = self.pendiente[t]
+        # Primer vértice con pendiente hacia el siguiente <= A0: ahí está el máximo de c - A0·k
+        for _ in range(self.pasos[t]):
+            medio = (lo + hi) // 2
+            subir = pendiente[medio] > a0
+            lo = np.where(subir, medio + 1, lo)
+            hi = np.where(subir, hi, medio)
+        y, ax = self.y[t][lo], a0 * self.x[t][lo]
+        with np.errstate(invalid="ignore"):
+            return (fin > ini) & (y - ax >= carga - 1e-9 * (np.abs(y) + np.abs(ax) + np.abs(carga)))
+
+    def _bloque(self, j: np.ndarray, a0: np.ndarray, carga: np.ndarray, atras: bool) -> np.ndarray:
+        """
+        Primer bloque >= j (último <= j si atras) que puede tener una fila
+        permitida; n_bloques (o -1) si no hay. Sube por el árbol saltando
+        nodos completos y baja por el primer hijo que puede tenerla.
+        """
+        nb, T = self.n_bloques, self.niveles - 1
+        pos = (nb - 1 - j) if atras else j.copy()  # hacia atrás: índices espejados
+        nivel = np.full(len(j), -1)
+
+        def puede(t, i, sel):
+            nodo = ((nb >> t) - 1 - i) if atras else i
+            return self._puede(t, nodo, a0[sel], carga[sel])
+
+        for t in range(T + 1):
+            i = pos >> t
+            mirar = np.flatnonzero((nivel < 0) & (pos >= 0) & (pos < nb) & (((i & 1) == 1) | (t == T)))
+            if mirar.size:
+                si = puede(t, i[mirar], mirar)
+                nivel[mirar[si]] = t
+                pos[mirar[~si]] += 1 << t
+        for t in range(T - 1, -1, -1):
+            bajar = np.flatnonzero(nivel > t)
+            if bajar.size:
+                si = puede(t, pos[bajar] >> t, bajar)
+                pos[bajar[~si]] += 1 << t
+
+        if atras:
+            return np.where(nivel >= 0, nb - 1 - pos, -1)
+        return np.where(nivel >= 0, pos, nb)
+
+    def _en_bloque(
+        self, b: np.ndarray, a0: np.ndarray, carga: np.ndarray, lo: np.ndarray, hi: np.ndarray, atras: bool
+    ) -> np.ndarray:
+        """Primera (última si atras) posición permitida en [lo, hi) dentro del bloque b; -1 si no hay."""
+        B = _FILAS_BLOQUE
+        pos = b[:, None] * B + np.arange(B)
+        with np.errstate(invalid="ignore"):
+            ok = self.k[pos] * (self.def_max[pos] - a0[:, None]) >= carga[:, None]
+        ok &= self.permitida[pos] & (pos >= lo[:, None]) & (pos < hi[:, None])
+        col = (B - 1 - ok[:, ::-1].argmax(axis=1)) if atras else ok.argmax(axis=1)
+        return np.where(ok.any(axis=1), b * B + col, -1)
+
+    def _buscar(self, p: np.ndarray, a0: np.ndarray, carga: np.ndarray, atras: bool) -> np.ndarray:
+        B, n = _FILAS_BLOQUE, self.n
+        vacio = -1 if atras else n
+        res = np.full(len(p), vacio, dtype=np.intp)
+        inicio = (p - 1) if atras else p  # primera posición a revisar
+        pend = np.flatnonzero((inicio >= 0) & (inicio < n))
+        if pend.size == 0:
+            return res
+
+        # 1) Resto del bloque de la posición inicial
+        b = inicio[pend] // B
+        lo, hi = (b * B, p[pend]) if atras else (p[pend], np.full(pend.size, n))
+        r = self._en_bloque(b, a0[pend], carga[pend], lo, hi, atras)
+        res[pend[r >= 0]] = r[r >= 0]
+        pend, j = pend[r < 0], (b - 1 if atras else b + 1)[r < 0]
+
+        # 2) Bloques siguientes (o anteriores) que el árbol no descarta
+        while pend.size:
+            b = self._bloque(j, a0[pend], carga[pend], atras)
+            hay = (b >= 0) & (b < self.n_bloques)
+            pend, b = pend[hay], b[hay]
+            r = self._en_bloque(b, a0[pend], carga[pend], b * B, np.full(pend.size, n), atras)
+            res[pend[r >= 0]] = r[r >= 0]
+            pend, j = pend[r < 0], (b - 1 if atras else b + 1)[r < 0]  # sí de más por redondeo
+        return res
+
+    def primero(self, p: np.ndarray, a0: np.ndarray, carga: np.ndarray) -> np.ndarray:
+        """Primera posición >= p permitida para cada punto (n si no hay)."""
+        return self._buscar(p, a0, carga, atras=False)
+
+    def ultimo(self, p: np.ndarray, a0: np.ndarray, carga: np.ndarray) -> np.ndarray:
+        """Última posición < p permitida para cada punto (-1 si no hay)."""
+        return self._buscar(p, a0, carga, atras=True)
+
+
+def _envolvente(x: np.ndarray, y: np.ndarray, validos: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Envolvente superior de los puntos (x, y) válidos de cada fila, con x no
+    decreciente a lo largo de la fila (cadena monótona, todas las filas a la
+    vez). Con x repetida se queda el de mayor y. Devuelve (x, y, largo) con
+    los vértices al principio de cada fila.
+    """
+    filas, columnas = x.shape
+    hx = np.zeros_like(x)
+    hy = np.zeros_like(y)
+    largo = np.zeros(filas, dtype=np.intp)
+    r = np.arange(filas)
+    for j in range(columnas):
+        xj, yj = x[:, j], y[:, j]
+        v = validos[:, j].copy()
+        if not v.any():
+            continue
+        # Misma x que el último vértice: gana el de mayor y
+        ult = np.maximum(largo - 1, 0)
+        igual = v & (largo >= 1) & (hx[r, ult] == xj)
+        v &= ~(igual & (hy[r, ult] >= yj))
+        largo -= igual & v
+        while True:
+            i1, i2 = np.maximum(largo - 1, 0), np.maximum(largo - 2, 0)
+            ox, oy = hx[r, i2], hy[r, i2]
+            cruz = (hx[r, i1] - ox) * (yj - oy) - (hy[r, i1] - oy) * (xj - ox)
+            quitar = v & (largo >= 2) & (cruz >= 0)
+            if not quitar.any():
+                break
+            largo -= quitar
+        hx[r[v], largo[v]] = xj[v]
+        hy[r[v], largo[v]] = yj[v]
+        largo += v
+    ancho = max(int(largo.max(initial=0)), 1)
+    return hx[:, :ancho], hy[:, :ancho], largo
+
+
+def _cruz(ox, oy, ax, ay, bx, by) -> np.ndarray:
+    """Producto cruz (a - o) × (b - o): > 0 si b queda por encima de la recta o→a (a a la derecha de o)."""
+    return (ax - ox) * (by - oy) - (ay - oy) * (bx - ox)
+
+
+def _unir(xs: np.ndarray, ys: np.ndarray, largo: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Envolventes superiores de los pares de nodos (2i, 2i + 1), dadas las de
+    cada nodo en formato compacto (vértices seguidos, largo por nodo) y con
+    las x del nodo izquierdo <= las del derecho. La unión es L[..i] + R[j..],
+    con (i, j) el puente: para cada vértice de L se busca por bisección su
+    tangente a R, e i es el primer vértice de L cuyo siguiente no queda por
+    encima de esa tangente. Todo vectorizado: O(v·log v) por nivel, sin
+    bucles que dependan del largo de las envolventes.
+    """
+    desde = np.concatenate(([0], np.cumsum(largo)))
+    ini_l, ini_r, fin_r = desde[0:-1:2], desde[1::2], desde[2::2]
+    m = len(ini_l)
+    largo_l, largo_r = ini_r - ini_l, fin_r - ini_r
+    ambos = (largo_l > 0) & (largo_r > 0)
+
+    # Vértices de los hijos izquierdos con hijo derecho no vacío
+    cuenta = np.where(ambos, largo_l, 0)
+    nodo = np.repeat(np.arange(m), cuenta)
+    v = np.arange(int(cuenta.sum())) + np.repeat(ini_l - (np.cumsum(cuenta) - cuenta), cuenta)
+    px, py = xs[v], ys[v]
+
+    # Tangente desde cada vértice de L: primer j de R con r[j+1] por debajo de la recta P→r[j]
+    ultimo_r = fin_r[nodo] - 1
+    lo, hi = ini_r[nodo], ultimo_r.copy()
+    siguiente = np.minimum(np.arange(len(xs)) + 1, len(xs) - 1)
+    for _ in range(int(largo_r.max(initial=0)).bit_length()):
+        medio = (lo + hi) // 2
+        s = siguiente[medio]
+        baja = (medio >= ultimo_r) | (_cruz(px, py, xs[medio], ys[medio], xs[s], ys[s]) < 0)
+        lo = np.where(baja, lo, medio + 1)
+        hi = np.where(baja, medio, hi)
+    tangente = lo
+
+    # Puente: primer vértice de L cuyo siguiente no queda por encima de su tangente
+    s = siguiente[v]
+    es_ultimo = v == ini_r[nodo] - 1
+    puente = es_ultimo | (_cruz(px, py, xs[tangente], ys[tangente], xs[s], ys[s]) <= 0)
+    nodos_puente, primera = np.unique(nodo[puente], return_index=True)
+    i = ini_r - 1  # último vértice de L que se queda (L entero si R está vacío)
+    j = ini_r.copy()  # primer vértice de R que se queda (R entero si L está vacío)
+    i[nodos_puente] = v[puente][primera]
+    j[nodos_puente] = tangente[puente][primera]
+
+    # Misma x en los dos extremos del puente (k repetida entre hijos): gana el de mayor y
+    empate = ambos & (i >= ini_l) & (j < fin_r)
+    empate[empate] = xs[i[empate]] == xs[j[empate]]
+    gana_l = empate.copy()
+    gana_l[empate] = ys[i[empate]] >= ys[j[empate]]
+    j = j + gana_l
+    i = i - (empate & ~gana_l)
+
+    n_l, n_r = i - ini_l + 1, fin_r - j
+    inicios = np.stack((ini_l, j), axis=1).ravel()
+    cuentas = np.stack((n_l, n_r), axis=1).ravel()
+    idx = np.arange(int(cuentas.sum())) + np.repeat(inicios - (np.cumsum(cuentas) - cuentas), cuentas)
+    return xs[idx], ys[idx], n_l + n_r
@@ -0,0 +1,232 @@
+from typing import Optional, Union
+
+import numpy as np
+
+import catalogo
+import perfil
+from indice import IndiceAceites, IndiceResortes, elegir
+from restricciones import FiltroResortes, Limites
+
+ArrayLike = Union[float, np.ndarray]
+
+# Reglas de selección (las mismas que usa Resoil.seleccionar_y_graficar)
+ALPHA = 5.0  # factor geométrico del amortiguador: c = alpha * Visc_40
+ZETA_OBJ = 0.2  # razón de amortiguamiento buscada
+
+
+# ==========================================================
+#  CLASE: RESULTADO DE SELECCIÓN
+# ==========================================================
+class ResultadoSeleccion:
+    """
+    Resultado de seleccionar resorte y aceite para uno o varios puntos de diseño.
+
+    Todos los campos son arrays con la forma común (broadcast) de las entradas:
+      - w_n, m, A0: entradas (rad/s, kg, m)
+      - i_resorte, i_aceite: fila seleccionada en cada catálogo (-1 si ningún
+        resorte cumple los límites pedidos; entonces k, c, zeta y w_d son NaN)
+      - k: constante del resorte seleccionado (N/m)
+      - c: coeficiente de amortiguamiento alpha·Visc_40 del aceite seleccionado
+      - zeta: razón de amortiguamiento ζ = c / (2·sqrt(m·k))
+      - w_d: frecuencia amortiguada ω_n·sqrt(1 - ζ²) (rad/s; NaN si ζ >= 1)
+
+    Otras funciones pueden añadir campos propios (ver optimizar_par).
+    """
+
+    def __init__(self, **campos: np.ndarray) -> None:
+        self.__dict__.update(campos)
+
+    def __len__(self) -> int:
+        return int(np.size(self.i_resorte))
+
+
+# ----------------------------------------------------------
+def seleccionar_lote(
+    w_n: ArrayLike,
+    m: ArrayLike,
+    A0: Optional[ArrayLike] = None,
+    resortes: Optional[catalogo.Catalogo] = None,
+    aceites: Optional[catalogo.Catalogo] = None,
+    alpha: ArrayLike = ALPHA,
+    zeta_obj: ArrayLike = ZETA_OBJ,
+    limites: Optional[Limites] = None,
+) -> ResultadoSeleccion:
+    """
+    Selecciona resorte y aceite para todos los puntos (ω_n, m) de una vez.
+
+    Reglas (idénticas a la selección de la interfaz):
+      1. k_req = m·ω_n²; se toma el resorte con k_Nm más cercana.
+      2. Con esa k, c = alpha·Visc_40 y ζ = c / (2·sqrt(m·k)); se toma el
+         aceite con ζ más cercano a zeta_obj.
+
+    w_n, m, A0, alpha y zeta_obj se combinan por broadcasting de NumPy
+    (alpha y zeta_obj pueden variar por punto en barridos). Ambos pasos usan
+    búsqueda binaria sobre los índices ordenados, de modo que el coste es
+    O(N·log n) para N puntos y n filas de catálogo, sin tablas intermedias
+    de tamaño N·n.
+
+    Con `limites` (restricciones.Limites) el resorte se busca sólo entre las
+    filas que cumplen deflexión máxima y geometría para cada (m, A0).
+    """
+    if resortes is None:
+        resortes = catalogo.cargar_resortes()
+    if aceites is None:
+        aceites = catalogo.cargar_aceites()
+    w_n, m, A0, alpha, zeta_obj = np.broadcast_arrays(
+        *(np.asarray(a, dtype=np.float64) for a in (w_n, m, np.nan if A0 is None else A0, alpha, zeta_obj))
+    )
+    if np.any(alpha <= 0):
+        raise ValueError("alpha debe ser > 0.")
+    if np.any(m <= 0):
+        raise ValueError("masa (kg) debe ser > 0.")
+
+    # 1) Resorte por k más cercana
+    with perfil.etapa("seleccion_resorte"):
+        if limites is None:
+            i_resorte = np.asarray(IndiceResortes.desde_catalogo(resortes).mas_cercano(m * w_n**2))
+        else:
+            i_resorte = FiltroResortes.desde_catalogo(resortes).mas_cercano(m * w_n**2, limites, m, A0)
+        sin_resorte = i_resorte < 0
+        k = np.where(sin_resorte, np.nan, resortes["k_Nm"][i_resorte])
+
+    # 2) Aceite por ζ más cercano: sólo hace falta evaluar los dos vecinos de Visc_40*
+    with perfil.etapa("seleccion_aceite"):
+        c_crit = 2 * np.sqrt(m * k)
+        visc = aceites["Visc_40"]
+        izq, der = IndiceAceites.desde_catalogo(aceites).vecinos(zeta_obj * c_crit / alpha)
+        i_aceite = elegir(
+            np.abs(visc[izq] * alpha / c_crit - zeta_obj),
+            np.abs(visc[der] * alpha / c_crit - zeta_obj),
+            izq,
+            der,
+        )
+        i_aceite = np.where(sin_resorte, -1, i_aceite)
+        c = np.where(sin_resorte, np.nan, visc[i_aceite] * alpha)
+
+    # Cálculos dinámicos
+    zeta = c / c_crit
+    with np.errstate(invalid="ignore"):
+        w_d = w_n * np.sqrt(1 - zeta**2)
+
+    return ResultadoSeleccion(
+        w_n=w_n,
+        m=m,
+        A0=A0,
+        i_resorte=i_resorte,
+        i_aceite=i_aceite,
+        k=k,
+        c=c,
+        zeta=zeta,
+        w_d=w_d,
+    )
+
+
+# ----------------------------------------------------------
+def optimizar_par(
+    w_n: float,
+    m: float,
+    resortes: Optional[catalogo.Catalogo] = None,
+    aceites: Optional[catalogo.Catalogo] = None,
+    alpha: float = ALPHA,
+    zeta_obj: float = ZETA_OBJ,
+    peso_w: float = 1.0,
+    peso_z: float = 1.0,
+    tol_w: float = 0.1,
+) -> ResultadoSeleccion:
+    """
+    Optimización conjunta resorte + aceite para un punto de diseño (ω_n, m).
+
+    Cada par (resorte i, aceite j) tiene dos errores relativos:
+      - err_w = |sqrt(k_i/m) - ω_n| / ω_n
+      - err_z = |ζ_ij - zeta_obj| / zeta_obj,  ζ_ij = alpha·Visc_40_j / (2·sqrt(m·k_i))
+    y el objetivo ponderado costo = peso_w·err_w + peso_z·err_z.
+
+    Devuelve el frente de Pareto de (err_w, err_z) ordenado por costo
+    (el primero es el óptimo ponderado). Campos, además de los de
+    seleccionar_lote: w_obj (ω_n pedida), w_n (ω_n real del resorte),
+    err_w, err_z, costo y tol_w (ventana final de la búsqueda, ver abajo).
+
+    Poda (nunca se construye el producto resortes × aceites):
+      - err_w sólo depende del resorte, así que para cada resorte basta el
+        aceite con menor err_z, que es uno de los dos vecinos de Visc_40* en
+        el índice de aceites (ζ es monótona en c).
+      - Sólo se recorren los resortes con err_w <= tol_w, obtenidos con una
+        consulta de rango en el índice de k. Si el mejor costo encontrado
+        supera peso_w·tol_w, un resorte de fuera podría ganar, y la ventana
+        se duplica hasta que eso no ocurre o cubre todo el catálogo.
+    El frente se limita a esa ventana final (pares con err_w <= tol_w); con
+    tol_w = np.inf se obtiene el frente completo del catálogo.
+    """
+    if resortes is None:
+        resortes = catalogo.cargar_resortes()
+    if aceites is None:
+        aceites = catalogo.cargar_aceites()
+    if alpha <= 0:
+        raise ValueError("alpha debe ser > 0.")
+    if m <= 0 or w_n <= 0:
+        raise ValueError("masa (kg) y ω_n (rad/s) deben ser > 0.")
+    if tol_w <= 0:
+        raise ValueError("tol_w debe ser > 0.")
+    if peso_w <= 0 or peso_z <= 0:
+        raise ValueError("peso_w y peso_z deben ser > 0.")
+
+    w_obj = float(w_n)
+    m = float(m)
+    ind_k = IndiceResortes.desde_catalogo(resortes)
+    ind_v = IndiceAceites.desde_catalogo(aceites)
+    visc = aceites["Visc_40"]
+
+    while True:
+        # Resortes con |ω - ω_obj| <= tol_w·ω_obj  ⇔  k en [m·(ω(1-tol))², m·(ω(1+tol))²]
+        w_lo = max(w_obj * (1 - tol_w), 0.0)
+        filas = ind_k.en_rango(m * w_lo**2, m * (w_obj * (1 + tol_w)) ** 2)
+        if filas.size == 0:
+            filas = np.atleast_1d(ind_k.mas_cercano(m * w_obj**2))
+
+        k = resortes["k_Nm"][filas]
+        w_real = np.sqrt(k / m)
+        err_w = np.abs(w_real - w_obj) / w_obj
+
+        c_crit = 2 * np.sqrt(m * k)
+        izq, der = ind_v.vecinos(zeta_obj * c_crit / alpha)
+        i_aceite = elegir(
+            np.abs(visc[izq] * alpha / c_crit - zeta_obj),
+            np.abs(visc[der] * alpha / c_crit - zeta_obj),
+            izq,
+            der,
+        )
+        zeta = visc[i_aceite] * alpha / c_crit
+        err_z = np.abs(zeta - zeta_obj) / zeta_obj
+        costo = peso_w * err_w + peso_z * err_z
+
+        cubre_todo = filas.size == len(ind_k)
+        if cubre_todo or costo.min() <= peso_w * tol_w:
+            break
+        tol_w *= 2
+
+    # Frente de Pareto: ordenar por err_w y quedarse con los que mejoran err_z
+    orden = np.lexsort((err_z, err_w))
+    ez = err_z[orden]
+    mejor_previo = np.concatenate(([np.inf], np.minimum.accumulate(ez)[:-1]))
+    frente = orden[ez < mejor_previo]
+    frente = frente[np.argsort(costo[frente], kind="stable")]
+
+    zeta = zeta[frente]
+    with np.errstate(invalid="ignore"):
+        w_d = w_real[frente] * np.sqrt(1 - zeta**2)
+
+    return ResultadoSeleccion(
+        w_obj=np.full(frente.size, w_obj),
+        m=np.full(frente.size, m),
+        i_resorte=filas[frente],
+        i_aceite=i_aceite[frente],
+        k=k[frente],
+        c=visc[i_aceite[frente]] * alpha,
+        w_n=w_real[frente],
+        zeta=zeta,
+        w_d=w_d,
+        err_w=err_w[frente],
+        err_z=err_z[frente],
+        costo=costo[frente],
+        tol_w=np.full(frente.size, tol_w),
+    )
@@ -0,0 +1,356 @@
+"""
+Servicio local de selección resorte/aceite (asyncio, HTTP/1.1 sobre TCP o socket Unix).
+
+    python -m resoil serve --port 8765
+    python -m resoil serve --unix /tmp/resoil.sock
+
+Rutas:
+  - POST /seleccionar   cuerpo {"wn": 100, "m": 2, "A0": 0.01} o una lista de ellos
+  - GET  /metricas      contadores, tamaño de lote, latencias y peticiones/s
+  - GET  /salud         {"ok": true, "resortes": n, "aceites": n}
+
+Los catálogos se cargan una vez y quedan en memoria. Las peticiones que
+llegan a la vez se agrupan en un solo seleccion.seleccionar_lote (micro-lotes):
+mientras se evalúa un lote, las siguientes se acumulan en la cola y salen
+juntas en el próximo. Sin dependencias fuera de la biblioteca estándar.
+"""
+import asyncio
+import json
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+
+import catalogo
+import seleccion
+
+_MAX_CUERPO = 16 * 2**20
+_RAZONES = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large"}
+
+
+# ==========================================================
+#  CLASE: SERVICIO (núcleo, sin red)
+# ==========================================================
+class Servicio:
+    """
+    Selección con micro-lotes sobre catálogos residentes.
+
+    - await seleccionar(wn, m, A0) devuelve el dict de un punto; es también
+      el cliente en proceso (sin red) para pruebas y para otras corrutinas.
+    - max_lote acota los puntos por evaluación; espera_max (s) es cuánto
+      esperar a que se llene un lote antes de evaluarlo (0 = no esperar:
+      sólo se agrupa lo que ya está en cola).
+    """
+
+    def __init__(
+        self,
+        resortes: Optional[catalogo.Catalogo] = None,
+        aceites: Optional[catalogo.Catalogo] = None,
+        alpha: float = seleccion.ALPHA,
+        zeta_obj: float = seleccion.ZETA_OBJ,
+        max_lote: int = 4096,
+        espera_max: float = 0.0,
+    ) -> None:
+        if max_lote <= 0 or espera_max < 0:
+            raise ValueError("max_lote debe ser > 0 y espera_max >= 0.")
+        self.resortes = catalogo.cargar_resortes() if resortes is None else resortes
+        self.aceites = catalogo.cargar_aceites() if aceites is None else aceites
+        self.alpha = alpha
+        self.zeta_obj = zeta_obj
+        self.max_lote = max_lote
+        self.espera_max = espera_max
+        # Construye los índices ahora y no con la primera petición
+        seleccion.seleccionar_lote(1.0, 1.0, None, self.resortes, self.aceites, alpha, zeta_obj)
+
+        self._cola: Optional[asyncio.Queue] = None
+        self._tarea: Optional[asyncio.Task] = None
+        self._inicio = time.monotonic()
+        self._latencias: Deque[float] = deque(maxlen=10_000)
+        self._ventana: Deque[Tuple[float, int]] = deque(maxlen=256)  # (instante, puntos) por lote
+        self.peticiones = 0
+        self.errores = 0
+        self.lotes = 0
+        self.lote_max = 0
+
+    # ----------------------------------------------------------
+    def iniciar(self) -> None:
+        """Arranca el agrupador en el bucle de eventos actual (idempotente)."""
+        if self._tarea is None or self._tarea.done():
+            self._cola = asyncio.Queue()
+            self._tarea = asyncio.get_running_loop().create_task(self._agrupar())
+
+    async def detener(self) -> None:
+        if self._tarea is not None:
+            self._tarea.cancel()
+            try:
+                await self._tarea
+            except asyncio.CancelledError:
+                pass
+            self._tarea = None
+
+    async def seleccionar(self, wn: float, m: float, A0: Optional[float] = None) -> Dict[str, object]:
+        wn, m = float(wn), float(m)
+        if not wn > 0 or not np.isfinite(wn):
+            raise ValueError("wn debe ser un número > 0.")
+        if not m > 0 or not np.isfinite(m):
+            raise ValueError("masa (kg) debe ser > 0.")
+        self.iniciar()
+        futuro = asyncio.get_running_loop().create_future()
+        await self._cola.put((wn, m, None if A0 is None else float(A0), time.perf_counter(), futuro))
+        return await futuro
+
+    # ----------------------------------------------------------
+    def _tomar(self, lote: list) -> None:
+        while len(lote) < self.max_lote:
+            try:
+                lote.append(self._cola.get_nowait())
+            except asyncio.QueueEmpty:
+                return
+
+    async def _agrupar(self) -> None:
+        while True:
+            lote = [await self._cola.get()]
+            await asyncio.sleep(0)  # deja encolar a las corrutinas ya listas
+            self._tomar(lote)
+            if self.espera_max > 0 and len(lote) < self.max_lote:
+                await asyncio.sleep(self.espera_max)
+                self._tomar(lote)
+            self._evaluar(lote)
+
+    def _evaluar(self, lote: list) -> None:
+        wn = np.array([p[0] for p in lote])
+        m = np.array([p[1] for p in lote])
+        A0 = np.array([np.nan if p[2] is None else p[2] for p in lote])
+        try:
+            res = seleccion.seleccionar_lote(wn, m, A0, self.resortes, self.aceites, self.alpha, self.zeta_obj)
+            registros = _registros(res, self.resortes, self.aceites)
+        except Exception as e:  # no debería pasar (entradas ya validadas): se informa a todos
+            self.errores += len(lote)
+            for *_, futuro in lote:
+                if not futuro.done():
+                    futuro.set_exception(e)
+            return
+
+        ahora = time.perf_counter()
+        for (*_, t0, futuro), reg in zip(lote, registros):
+            if not futuro.done():  # el cliente pudo haberse ido
+                futuro.set_result(reg)
+            self._latencias.append(ahora - t0)
+        self.peticiones += len(lote)
+        self.lotes += 1
+        self.lote_max = max(self.lote_max, len(lote))
+        self._ventana.append((time.monotonic(), len(lote)))
+
+    # ----------------------------------------------------------
+    def metricas(self) -> Dict[str, object]:
+        lat = np.fromiter(self._latencias, dtype=np.float64)
+        p50, p95, p99 = (np.percentile(lat, (50, 95, 99)) * 1e3).tolist() if lat.size else (None, None, None)
+        # Peticiones por segundo en los últimos lotes (ventana deslizante)
+        por_segundo = 0.0
+        if len(self._ventana) >= 2:
+            dt = self._ventana[-1][0] - self._ventana[0][0]
+            if dt > 0:
+                por_segundo = sum(n for _, n in list(self._ventana)[1:]) / dt
+        return {
+            "peticiones": self.peticiones,
+            "errores": self.errores,
+            "lotes": self.lotes,
+            "lote_medio": self.peticiones / self.lotes if self.lotes else 0.0,
+            "lote_max": self.lote_max,
+            "latencia_ms": {"p50": p50, "p95": p95, "p99": p99},
+            "por_segundo": por_segundo,
+            "activo_s": time.monotonic() - self._inicio,
+        }
+
+
+def _registros(
+    res: seleccion.ResultadoSeleccion, resortes: catalogo.Catalogo, aceites: catalogo.Catalogo
+) -> List[Dict[str, object]]:
+    """Un dict JSON por punto (mismas claves que la línea de comandos)."""
+    nombres_r = resortes["nombre"][res.i_resorte]
+    nombres_a = aceites["nombre"][res.i_aceite]
+    w_n = np.sqrt(res.k / res.m)
+    columnas = zip(
+        res.w_n.tolist(), res.m.tolist(), res.A0.tolist(), nombres_r.tolist(), nombres_a.tolist(),
+        res.k.tolist(), res.c.tolist(), w_n.tolist(), res.zeta.tolist(), res.w_d.tolist(),
+    )
+    return [
+        {
+            "wn": wn,
+            "m": m,
+            "A0": None if a0 != a0 else a0,
+            "resorte": r,
+            "aceite": a,
+            "k_Nm": k,
+            "c": c,
+            "omega_n": w,
+            "zeta": z,
+            "omega_d": None if wd != wd else wd,  # NaN → null (ζ >= 1)
+        }
+        for wn, m, a0, r, a, k, c, w, z, wd in columnas
+    ]
+
+
+# ==========================================================
+#  HTTP
+# ==========================================================
+def _respuesta(estado: int, cuerpo: object) -> bytes:
+    datos = json.dumps(cuerpo, ensure_ascii=False).encode()
+    cabecera = (
+        f"HTTP/1.1 {estado} {_RAZONES.get(estado, '')}\r\n"
+        "Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(datos)}\r\n"
+        "Connection: keep-alive\r\n\r\n"
+    )
+    return cabecera.encode() + datos
+
+
+async def _atender(servicio: Servicio, metodo: str, ruta: str, cuerpo: bytes) -> Tuple[int, object]:
+    if ruta == "/salud":
+        return 200, {"ok": True, "resortes": len(servicio.resortes), "aceites": len(servicio.aceites)}
+    if ruta == "/metricas":
+        return 200, servicio.metricas()
+    if ruta != "/seleccionar":
+        return 404, {"error": f"Ruta desconocida: {ruta}"}
+    if metodo != "POST":
+        return 405, {"error": "Use POST."}
+
+    try:
+        pedido = json.loads(cuerpo or b"null")
+        lista = pedido if isinstance(pedido, list) else [pedido]
+        puntos = [(p.get("wn", p.get("w_n")), p["m"], p.get("A0")) for p in lista]
+    except (ValueError, KeyError, TypeError, AttributeError) as e:
+        return 400, {"error": f"Pedido inválido: {e}"}
+    try:
+        resultados = await asyncio.gather(*(servicio.seleccionar(*p) for p in puntos))
+    except (ValueError, TypeError) as e:
+        return 400, {"error": str(e)}
+    return 200, resultados if isinstance(pedido, list) else resultados[0]
+
+
+async def _conexion(servicio: Servicio, lector: asyncio.StreamReader, escritor: asyncio.StreamWriter) -> None:
+    """Atiende peticiones HTTP/1.1 sucesivas en la misma conexión (keep-alive)."""
+    try:
+        while True:
+            linea = await lector.readline()
+            if not linea:
+                return
+            try:
+                metodo, ruta, _ = linea.decode("latin-1").split(" ", 2)
+            except ValueError:
+                escritor.write(_respuesta(400, {"error": "Línea de petición inválida."}))
+                return
+            texto_largo = ""
+            cerrar = False
+            while True:
+                cab = await lector.readline()
+                if cab in (b"\r\n", b"\n", b""):
+                    break
+                nombre, _, valor = cab.decode("latin-1").partition(":")
+                nombre = nombre.strip().lower()
+                if nombre == "content-length":
+                    texto_largo = valor.strip()
+                elif nombre == "connection" and valor.strip().lower() == "close":
+                    cerrar = True
+            try:
+                # Sólo dígitos ASCII: int() también aceptaría "-1", "+1" o "1_0"
+                if texto_largo and not (texto_largo.isascii() and texto_largo.isdigit()):
+                    raise ValueError(texto_largo)
+                largo = int(texto_largo or 0)
+            except ValueError:
+                # Sin un largo válido no se sabe dónde acaba el cuerpo: se cierra la conexión
+                escritor.write(_respuesta(400, {"error": "Content-Length inválido."}))
+                return
+            if largo > _MAX_CUERPO:
+                escritor.write(_respuesta(413, {"error": "Cuerpo demasiado grande."}))
+                return
+            cuerpo = await lector.readexactly(largo) if largo else b""
+
+            estado, datos = await _atender(servicio, metodo.upper(), ruta.split("?", 1)[0], cuerpo)
+            escritor.write(_respuesta(estado, datos))
+            await escritor.drain()
+            if cerrar:
+                return
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        escritor.close()
+
+
+async def servir(
+    servicio: Servicio, host: str = "127.0.0.1", puerto: int = 8765, unix: Optional[str] = None
+) -> asyncio.AbstractServer:
+    """
+    Arranca el servidor (TCP en host:puerto o socket Unix en `unix`) y lo
+    devuelve ya escuchando; se detiene con servidor.close().
+    """
+    servicio.iniciar()
+
+    async def manejar(lector, escritor):
+        await _conexion(servicio, lector, escritor)
+
+    if unix is not None:
+        return await asyncio.start_unix_server(manejar, path=unix)
+    return await asyncio.start_server(manejar, host, puerto)
+
+
+# ==========================================================
+#  CLIENTE HTTP (asyncio, una conexión keep-alive)
+# ==========================================================
+class Cliente:
+    """
+    Cliente mínimo para el servicio: Cliente(puerto=8765) o Cliente(unix=ruta).
+    Las peticiones de un mismo cliente van en serie por su conexión; para
+    peticiones concurrentes se usan varios clientes.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", puerto: int = 8765, unix: Optional[str] = None) -> None:
+        self.host = host
+        self.puerto = puerto
+        self.unix = unix
+        self._lector: Optional[asyncio.StreamReader] = None
+        self._escritor: Optional[asyncio.StreamWriter] = None
+        self._candado = asyncio.Lock()
+
+    async def _conectar(self) -> None:
+        if self.unix is not None:
+            self._lector, self._escritor = await asyncio.open_unix_connection(self.unix)
+        else:
+            self._lector, self._escritor = await asyncio.open_connection(self.host, self.puerto)
+
+    async def pedir(self, metodo: str, ruta: str, cuerpo: object = None) -> Tuple[int, object]:
+        datos = b"" if cuerpo is None else json.dumps(cuerpo).encode()
+        async with self._candado:
+            if self._escritor is None:
+                await self._conectar()
+            self._escritor.write(
+                f"{metodo} {ruta} HTTP/1.1\r\nHost: resoil\r\nContent-Type: application/json\r\n"
+                f"Content-Length: {len(datos)}\r\n\r\n".encode() + datos
+            )
+            await self._escritor.drain()
+
+            estado = int((await self._lector.readline()).split()[1])
+            largo = 0
+            while True:
+                cab = await self._lector.readline()
+                if cab in (b"\r\n", b""):
+                    break
+                nombre, _, valor = cab.decode("latin-1").partition(":")
+                if nombre.strip().lower() == "content-length":
+                    largo = int(valor)
+            return estado, json.loads(await self._lector.readexactly(largo))
+
+    async def seleccionar(self, wn: float, m: float, A0: Optional[float] = None) -> Dict[str, object]:
+        estado, datos = await self.pedir("POST", "/seleccionar", {"wn": wn, "m": m, "A0": A0})
+        if estado != 200:
+            raise ValueError(datos.get("error", f"HTTP {estado}"))
+        return datos
+
+    async def metricas(self) -> Dict[str, object]:
+        return (await self.pedir("GET", "/metricas"))[1]
+
+    async def cerrar(self) -> None:
+        if self._escritor is not None:
+            self._escritor.close()
+            self._escritor = self._lector = None
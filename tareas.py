@@ -0,0 +1,72 @@
+import queue
+import threading
+from typing import Callable, List, Optional, Tuple
+
+
+class Cancelado(Exception):
+    """Se lanza dentro de una tarea cuando se pidió cancelarla."""
+
+
+# ==========================================================
+#  CLASE: TAREA EN SEGUNDO PLANO
+# ==========================================================
+class Tarea:
+    """
+    Ejecuta fn(*args, informar=...) en un hilo aparte, sin tocar la interfaz.
+
+    - informar(fraccion, texto) publica el avance (0..1) y lanza Cancelado
+      si se llamó a cancelar(); así la cancelación ocurre entre etapas.
+    - El hilo sólo deja mensajes en una cola. El hilo de la interfaz los
+      recoge con eventos() (p. ej. sondeando con root.after), porque Tk no
+      se debe llamar desde otros hilos.
+
+    Mensajes de eventos():
+      ("progreso", fraccion, texto) | ("resultado", valor) | ("error", excepcion) | ("cancelado",)
+    """
+
+    def __init__(self, fn: Callable, *args) -> None:
+        self._fn = fn
+        self._args = args
+        self._cola: "queue.Queue[Tuple]" = queue.Queue()
+        self._cancelar = threading.Event()
+        self._hilo: Optional[threading.Thread] = None
+
+    def iniciar(self) -> "Tarea":
+        self._hilo = threading.Thread(target=self._correr, daemon=True)
+        self._hilo.start()
+        return self
+
+    def cancelar(self) -> None:
+        self._cancelar.set()
+
+    @property
+    def activa(self) -> bool:
+        return self._hilo is not None and self._hilo.is_alive()
+
+    def eventos(self) -> List[Tuple]:
+        """Mensajes pendientes (no bloquea)."""
+        salida = []
+        while True:
+            try:
+                salida.append(self._cola.get_nowait())
+            except queue.Empty:
+                return salida
+
+    # ----------------------------------------------------------
+    def _informar(self, fraccion: float, texto: str = "") -> None:
+        if self._cancelar.is_set():
+            raise Cancelado()
+        self._cola.put(("progreso", fraccion, texto))
+
+    def _correr(self) -> None:
+        try:
+            valor = self._fn(*self._args, informar=self._informar)
+        except Cancelado:
+            self._cola.put(("cancelado",))
+        except Exception as e:  # se muestra en la interfaz, no se pierde en el hilo
+            self._cola.put(("error", e))
+        else:
+            if self._cancelar.is_set():
+                self._cola.put(("cancelado",))
+            else:
+                self._cola.put(("resultado", valor))
@@ -0,0 +1,61 @@
+"""
+Configuración común de las pruebas: los módulos de resoil están en la raíz
+del repositorio (no es un paquete), así que se añade al path.
+
+Las pruebas usan catálogos sintéticos pequeños, con k y viscosidades
+repetidas (para los desempates) y algunos datos vacíos, en lugar de los
+Excel del proyecto.
+
+Uso (desde la raíz del repositorio):
+    python -m pytest -q
+"""
+import os
+import sys
+
+import numpy as np
+import pytest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+import catalogo  # noqa: E402
+
+
+def catalogo_resortes(n: int = 300, semilla: int = 0) -> catalogo.Catalogo:
+    rng = np.random.default_rng(semilla)
+    k = rng.choice(np.geomspace(500.0, 5e5, n // 3), n)  # ~3 filas por valor de k
+    k[rng.choice(n, 3, replace=False)] = np.nan
+    def_max = rng.uniform(0.005, 0.08, n)
+    def_max[rng.choice(n, 5, replace=False)] = np.nan
+    dm_in = rng.uniform(0.005, 0.04, n)
+    columnas = {
+        "nombre": np.array([f"R{i:03d}" for i in range(n)]),
+        "k_Nm": k,
+        "long_libre": rng.uniform(0.02, 0.4, n),
+        "def_max": def_max,
+        "dm_in": dm_in,
+        "dm_ex": dm_in + rng.uniform(0.002, 0.02, n),
+    }
+    return catalogo.Catalogo(columnas, f"resortes-{semilla}", "resortes_prueba")
+
+
+def catalogo_aceites(n: int = 60, semilla: int = 0) -> catalogo.Catalogo:
+    rng = np.random.default_rng(semilla)
+    visc_40 = rng.choice(np.round(np.geomspace(2.0, 400.0, n // 2), 1), n)
+    columnas = {
+        "nombre": np.array([f"A{i:02d}" for i in range(n)]),
+        "densidad": rng.uniform(0.8, 0.95, n),
+        "Visc_40": visc_40,
+        "Visc_100": visc_40 / rng.uniform(4.0, 8.0, n),
+    }
+    return catalogo.Catalogo(columnas, f"aceites-{semilla}", "aceites_prueba")
+
+
+@pytest.fixture(scope="session")
+def resortes() -> catalogo.Catalogo:
+    return catalogo_resortes()
+
+
+@pytest.fixture(scope="session")
+def aceites() -> catalogo.Catalogo:
+    return catalogo_aceites()
@@ -0,0 +1,98 @@
+"""Almacén de resultados: sólo inserciones, reutilización y consultas."""
+import sqlite3
+
+import numpy as np
+import pytest
+
+import almacen
+import respuesta
+import seleccion
+from restricciones import Limites
+
+
+@pytest.fixture
+def alm(tmp_path):
+    with almacen.Almacen(str(tmp_path / "resultados.db"), tam_lote=7) as a:
+        yield a
+
+
+def _puntos(n: int = 40, semilla: int = 4):
+    rng = np.random.default_rng(semilla)
+    A0 = rng.uniform(0.0, 0.01, n)
+    A0[::5] = np.nan
+    return rng.uniform(5.0, 200.0, n), rng.uniform(0.2, 80.0, n), A0
+
+
+@pytest.mark.parametrize("sql", ["UPDATE resultados SET k = 0", "DELETE FROM resultados", "DELETE FROM resultados WHERE id = 1"])
+def test_solo_admite_inserciones(alm, resortes, aceites, sql):
+    alm.seleccionar(*_puntos(), resortes, aceites)
+    with pytest.raises(sqlite3.DatabaseError, match="sólo admite inserciones"):
+        with alm._con:
+            alm._con.execute(sql)
+    assert len(alm) == 40
+
+
+def test_reutiliza_resultados_previos(alm, resortes, aceites):
+    w_n, m, A0 = _puntos()
+    limites = Limites(d_alojamiento=0.03)
+    primero = alm.seleccionar(w_n[:25], m[:25], A0[:25], resortes, aceites, limites=limites)
+    assert not primero.reutilizado.any()
+    segundo = alm.seleccionar(w_n, m, A0, resortes, aceites, limites=limites)
+    np.testing.assert_array_equal(segundo.reutilizado, np.arange(40) < 25)
+    assert len(alm) == 40
+
+    directo = seleccion.seleccionar_lote(w_n, m, A0, resortes, aceites, limites=limites)
+    for campo in ("i_resorte", "i_aceite", "k", "c", "zeta", "w_d"):
+        np.testing.assert_array_equal(getattr(segundo, campo), getattr(directo, campo))
+
+    # Otros parámetros: nada se reutiliza
+    otro = alm.seleccionar(w_n, m, A0, resortes, aceites, alpha=4.0, limites=limites)
+    assert not otro.reutilizado.any()
+    assert len(alm) == 80
+
+
+def test_consultar_filtra_como_numpy(alm, resortes, aceites):
+    w_n, m, A0 = _puntos(200)
+    res = alm.seleccionar(w_n, m, A0, resortes, aceites)
+    nombres = resortes["nombre"][res.i_resorte]
+    aceite = aceites["nombre"][res.i_aceite]
+
+    todo = alm.consultar()
+    np.testing.assert_array_equal(todo.w_n, w_n)
+    np.testing.assert_array_equal(todo.A0, A0)
+    np.testing.assert_array_equal(todo.i_resorte, res.i_resorte)
+
+    sel = alm.consultar(wn=(50.0, 120.0), m=(10.0, 60.0))
+    np.testing.assert_array_equal(sel.w_n, w_n[(w_n >= 50) & (w_n <= 120) & (m >= 10) & (m <= 60)])
+    sel = alm.consultar(resorte=str(nombres[0]))
+    np.testing.assert_array_equal(sel.m, m[nombres == nombres[0]])
+    sel = alm.consultar(aceite=str(aceite[0]), limite=3)
+    np.testing.assert_array_equal(sel.m, m[aceite == aceite[0]][:3])
+    assert len(alm.consultar(desde=todo.creado.max() + 1)) == 0
+    assert len(alm.consultar(hasta=todo.creado.max())) == 200
+    assert [f["id"] for f in alm.historial(3)] == [200, 199, 198]
+
+
+def test_respuesta_guardada(alm, resortes, aceites):
+    w_n, m, _ = _puntos(3)
+    res = seleccion.seleccionar_lote(w_n, m, None, resortes, aceites)
+    t = np.linspace(0.0, 1.0, 1001)
+    x = respuesta.respuesta_libre(res.m, res.k, res.c, t, 0.01)
+    alm.agregar(res, resortes, aceites, t=t, x=x)
+    t_guardado, x_guardado = alm.respuesta(2)
+    paso = -(-len(t) // almacen.MAX_MUESTRAS)
+    np.testing.assert_allclose(t_guardado, t[::paso])
+    np.testing.assert_allclose(x_guardado, x[1, ::paso], rtol=1e-6)
+    assert alm.respuesta(99) is None
+
+
+def test_respuesta_sin_tiempos_se_rechaza(alm, resortes, aceites):
+    w_n, m, _ = _puntos(3)
+    res = seleccion.seleccionar_lote(w_n, m, None, resortes, aceites)
+    t = np.linspace(0.0, 1.0, 11)
+    x = respuesta.respuesta_libre(res.m, res.k, res.c, t, 0.01)
+    with pytest.raises(ValueError, match="hace falta t"):
+        alm.agregar(res, resortes, aceites, x=x)
+    with pytest.raises(ValueError, match="forma"):
+        alm.agregar(res, resortes, aceites, t=t[:-1], x=x)
+    assert alm.vaciar() == 0
@@ -0,0 +1,71 @@
+"""Bancos de resortes y aceites (estructura de arrays) frente a los objetos de main."""
+import numpy as np
+import pytest
+
+import bancos
+import main
+
+
+@pytest.fixture
+def banco_r():
+    rng = np.random.default_rng(0)
+    n = 50
+    dm_in = rng.uniform(0.005, 0.03, n)
+    return bancos.BancoResortes(
+        rng.uniform(500.0, 5e4, n),
+        rng.uniform(0.02, 0.3, n),
+        rng.uniform(0.005, 0.05, n),
+        dm_in,
+        dm_in + rng.uniform(0.002, 0.01, n),
+        np.array([f"R{i}" for i in range(n)]),
+    )
+
+
+@pytest.fixture
+def banco_a():
+    rng = np.random.default_rng(1)
+    n = 20
+    visc_40 = rng.uniform(10.0, 300.0, n)
+    return bancos.BancoAmortiguadores(rng.uniform(0.8, 0.95, n), visc_40, visc_40 / rng.uniform(5.0, 15.0, n))
+
+
+def test_metodos_del_banco_igual_a_los_objetos(banco_r):
+    objetos = [v.como_objeto() for v in banco_r]
+    np.testing.assert_allclose(banco_r.omega_natural(2.0), [o.omega_natural(2.0) for o in objetos], rtol=1e-15)
+    np.testing.assert_allclose(banco_r.frec_natural(2.0), [o.frec_natural(2.0) for o in objetos], rtol=1e-15)
+    np.testing.assert_allclose(banco_r.fuerza(0.01), [o.fuerza(0.01) for o in objetos], rtol=1e-15)
+    np.testing.assert_array_equal(banco_r.dentro_limites(0.02), [o.dentro_limites(0.02) for o in objetos])
+
+
+def test_vistas_ligeras_y_subbancos(banco_r):
+    v = banco_r[-1]
+    assert isinstance(v, bancos.VistaResorte) and not hasattr(v, "__dict__")
+    assert v.nombre == "R49" and v.k == banco_r.k[-1]
+    assert v.omega_natural(3.0) == pytest.approx(np.sqrt(banco_r.k[-1] / 3.0))
+
+    mascara = banco_r.k > 1e4
+    sub = banco_r[mascara]
+    assert isinstance(sub, bancos.BancoResortes) and len(sub) == np.count_nonzero(mascara)
+    np.testing.assert_array_equal(sub.k, banco_r.k[mascara])
+    np.testing.assert_array_equal(sub.nombre, banco_r.nombre[mascara])
+    assert sub.k.flags.c_contiguous
+    with pytest.raises(IndexError):
+        banco_r[len(banco_r)]
+
+
+def test_amortiguadores_igual_a_los_objetos(banco_a):
+    objetos = [v.como_objeto() for v in banco_a]
+    temps = np.array([[20.0], [40.0], [70.0], [120.0]])
+    esperado = np.array([[o.viscosidad_dinamica(float(t)) for o in objetos] for t in temps[:, 0]])
+    np.testing.assert_allclose(banco_a.viscosidad_dinamica(temps), esperado, rtol=1e-15)
+    assert banco_a[3].nombre == "3"  # sin nombres: la posición
+    assert banco_a[3].visc_40 == banco_a.visc_40[3]
+
+
+def test_validacion_como_los_objetos():
+    with pytest.raises(ValueError, match="k"):
+        bancos.BancoResortes(np.array([1.0, -1.0]), np.ones(2), np.ones(2), np.zeros(2), np.ones(2))
+    with pytest.raises(ValueError, match="misma longitud"):
+        bancos.BancoResortes(np.ones(2), np.ones(3), np.ones(2), np.zeros(2), np.ones(2))
+    with pytest.raises(ValueError):
+        main.Resorte("x", -1.0, 1.0, 1.0, 0.0, 1.0)
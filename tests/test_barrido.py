@@ -0,0 +1,41 @@
+"""Barrido en varios procesos frente a una sola llamada a seleccionar_lote."""
+import numpy as np
+import pytest
+
+import barrido
+import seleccion
+
+
+def test_barrido_igual_a_seleccionar_lote(tmp_path, resortes, aceites):
+    w_n = np.linspace(5.0, 200.0, 23)
+    m = np.array([0.3, 2.0, 45.0])
+    alpha = np.array([2.0, 5.0])
+    zeta_obj = np.array([0.1, 0.4])
+    avances = []
+    res = barrido.barrido(
+        w_n, m, alpha, zeta_obj,
+        salida=str(tmp_path / "barrido.npy"), procesos=2, tam_tramo=37,
+        resortes=resortes, aceites=aceites, progreso=lambda hechos, total: avances.append((hechos, total)),
+    )
+
+    total = len(w_n) * len(m) * len(alpha) * len(zeta_obj)
+    assert res.shape == (total,) and res.dtype == barrido.DTYPE_RESULTADO
+    assert avances[-1] == (total, total) and len(avances) == -(-total // 37)
+
+    # Orden C de la rejilla w_n × m × alpha × zeta_obj
+    W, M, A, Z = (g.ravel() for g in np.meshgrid(w_n, m, alpha, zeta_obj, indexing="ij"))
+    ref = seleccion.seleccionar_lote(W, M, None, resortes, aceites, A, Z)
+    np.testing.assert_array_equal(res["w_n"], W)
+    np.testing.assert_array_equal(res["alpha"], A)
+    np.testing.assert_array_equal(res["zeta_obj"], Z)
+    np.testing.assert_array_equal(res["i_resorte"], ref.i_resorte)
+    np.testing.assert_array_equal(res["i_aceite"], ref.i_aceite)
+    for campo in ("k", "c", "zeta", "w_d"):
+        np.testing.assert_array_equal(res[campo], getattr(ref, campo))
+
+
+def test_barrido_rechaza_rejillas_invalidas(tmp_path, resortes, aceites):
+    with pytest.raises(ValueError):
+        barrido.barrido(10.0, [1.0, -1.0], salida=str(tmp_path / "b.npy"), resortes=resortes, aceites=aceites)
+    with pytest.raises(ValueError):
+        barrido.barrido(np.ones((2, 2)), 1.0, salida=str(tmp_path / "b.npy"), resortes=resortes, aceites=aceites)
@@ -0,0 +1,105 @@
+"""Cadena de N masas: modos por Sturm e iteración inversa frente a eigh denso, y Newmark frente a la solución modal."""
+import numpy as np
+import pytest
+
+import cadena
+
+
+def _cadena(n: int, fija: bool = False, semilla: int = 0, c=None) -> cadena.Cadena:
+    rng = np.random.default_rng(semilla)
+    m = rng.uniform(0.5, 2.0, n)
+    k = rng.uniform(1e3, 5e3, n + fija)
+    return cadena.Cadena(m, k, 0.002 * k if c is None else c)
+
+
+def _denso(cad: cadena.Cadena):
+    diag, sub = cad.K
+    K = np.diag(diag) + np.diag(sub, 1) + np.diag(sub, -1)
+    raiz_m = np.sqrt(cad.m)
+    return np.linalg.eigh(K / np.outer(raiz_m, raiz_m)), K
+
+
+def test_biseccion_de_sturm_coincide_con_eigvalsh():
+    cad = _cadena(700, fija=True)
+    diag, sub = cad.K
+    raiz_m = np.sqrt(cad.m)
+    lam = cadena._autovalores_menores(diag / cad.m, sub / (raiz_m[:-1] * raiz_m[1:]), 12)
+    (lam_ref, _), _ = _denso(cad)
+    np.testing.assert_allclose(lam, lam_ref[:12], rtol=2 * cadena._TOL_BISECCION)
+
+
+@pytest.mark.parametrize("fija", [False, True])
+def test_modos_por_iteracion_inversa_coinciden_con_eigh(fija):
+    cad = _cadena(900, fija=fija, semilla=1)
+    md = cad.modos(10)  # 4·10 < 900 > _N_DENSO: camino de Sturm
+    (lam_ref, V_ref), K = _denso(cad)
+    np.testing.assert_allclose(md.w, np.sqrt(lam_ref[:10]), rtol=1e-10)
+    # Normalizados en masa y con residuo K·φ - ω²·M·φ despreciable
+    np.testing.assert_allclose(md.phi.T @ (cad.m[:, None] * md.phi), np.eye(10), atol=1e-10)
+    residuo = K @ md.phi - md.w**2 * (cad.m[:, None] * md.phi)
+    assert np.max(np.abs(residuo)) <= 1e-8 * np.max(np.abs(K @ md.phi))
+    # Misma forma modal (salvo signo) que eigh
+    phi_ref = V_ref[:, :10] / np.sqrt(cad.m)[:, None]
+    np.testing.assert_allclose(np.abs(np.sum(cad.m[:, None] * md.phi * phi_ref, axis=0)), 1.0, atol=1e-8)
+
+
+def test_amortiguamiento_modal_en_cache_sin_recalcular_modos():
+    cad = _cadena(30, semilla=2)
+    md = cad.modos()
+    otra = cadena.Cadena(cad.m, cad.k, 2 * cad.c)
+    fallos = cadena._modos.fallos
+    md2 = otra.modos()
+    assert cadena._modos.fallos == fallos + 1  # sólo la proyección de la nueva C
+    assert md2.phi is md.phi
+    np.testing.assert_allclose(md2.zeta, 2 * md.zeta, rtol=1e-12)
+    assert cad.modos().c_modal is md.c_modal
+
+
+def test_simular_cadena_larga_usa_pocos_modos_por_defecto():
+    cad = _cadena(cadena._N_DENSO + 100, semilla=3)
+    x = cad.simular(np.linspace(0.0, 0.1, 50), x0=0.001, gdl=[0, -1])
+    assert x.shape == (2, 50)
+    assert (cad.clave(), cadena._MODOS_SIMULACION) in cadena._modos
+    assert (cad.clave(), len(cad)) not in cadena._modos
+
+
+def test_modal_exacto_con_amortiguamiento_proporcional():
+    # C = β·K: los modos desacoplan C y la solución modal es exacta
+    cad = _cadena(6, fija=True, semilla=4)
+    t = np.linspace(0.0, 0.5, 501)
+    x0 = np.linspace(0.001, 0.002, 6)
+    x = cad.simular(t, x0=x0)
+
+    (lam, V), K = _denso(cad)
+    diag_c, sub_c = cad.C
+    C = np.diag(diag_c) + np.diag(sub_c, 1) + np.diag(sub_c, -1)
+    # Integración de referencia: exponencial de la matriz del sistema de primer orden
+    n = len(cad)
+    A = np.block([[np.zeros((n, n)), np.eye(n)], [-K / cad.m[:, None], -C / cad.m[:, None]]])
+    val, vec = np.linalg.eig(A)
+    coef = np.linalg.solve(vec, np.concatenate((x0, np.zeros(n))))
+    ref = np.real(vec[:n] @ (coef[:, None] * np.exp(np.outer(val, t))))
+    np.testing.assert_allclose(x, ref, atol=1e-12)
+
+
+def test_newmark_converge_a_la_solucion_modal():
+    cad = _cadena(5, semilla=5)
+    x0 = np.full(5, 0.001)
+    errores = []
+    for pasos in (400, 800):
+        t = np.linspace(0.0, 0.2, pasos + 1)
+        x_modal = cad.simular(t, x0=x0, metodo="modal")
+        x_imp = cad.simular(t, x0=x0, metodo="implicito")
+        errores.append(np.max(np.abs(x_imp - x_modal)))
+    assert errores[1] < 0.3 * errores[0]  # segundo orden: ~1/4 al dividir el paso
+    assert errores[1] < 1e-2 * np.max(np.abs(x0))
+
+
+def test_fuerza_constante_tiende_a_la_estatica():
+    cad = _cadena(8, semilla=6, c=50.0)
+    f = cad.m * 9.81
+    x = cad.simular(np.array([0.0, 50.0]), f=f)
+    (_, _), K = _denso(cad)
+    np.testing.assert_allclose(cad.estatica(f), np.linalg.solve(K, f), rtol=1e-12)
+    np.testing.assert_allclose(x[:, -1], np.linalg.solve(K, f), rtol=1e-8)
+    np.testing.assert_allclose(x[:, 0], 0.0, atol=1e-15)
@@ -0,0 +1,51 @@
+"""Carga de catálogos: copia en memoria, caché .npz y cargas concurrentes."""
+import os
+import threading
+import time
+
+import numpy as np
+
+import catalogo
+
+
+def _fuente(tmp_path, contenido=b"1,2,3"):
+    ruta = tmp_path / "fuente.csv"
+    ruta.write_bytes(contenido)
+    return str(ruta)
+
+
+def _lector(llamadas, espera=0.0):
+    def leer(ruta):
+        llamadas.append(threading.get_ident())
+        time.sleep(espera)
+        return {"nombre": np.array(["a", "b", "c"]), "k_Nm": np.array([1.0, 2.0, 3.0])}
+
+    return leer
+
+
+def test_cargas_concurrentes_leen_una_sola_vez(tmp_path):
+    ruta = _fuente(tmp_path)
+    llamadas, resultados = [], []
+    leer = _lector(llamadas, espera=0.2)
+    hilos = [threading.Thread(target=lambda: resultados.append(catalogo.cargar_fuente(ruta, leer))) for _ in range(4)]
+    for h in hilos:
+        h.start()
+    for h in hilos:
+        h.join()
+
+    assert len(llamadas) == 1
+    assert all(r is resultados[0] for r in resultados)
+    # La caché quedó completa y sin temporales a medio escribir
+    assert sorted(os.listdir(tmp_path)) == ["fuente.cache.npz", "fuente.csv"]
+
+
+def test_cache_en_disco_se_reutiliza(tmp_path):
+    ruta = _fuente(tmp_path, b"4,5,6")
+    llamadas = []
+    primero = catalogo.cargar_fuente(ruta, _lector(llamadas))
+    catalogo._en_memoria.clear()  # como en un proceso nuevo
+    segundo = catalogo.cargar_fuente(ruta, _lector(llamadas))
+    assert len(llamadas) == 1
+    assert segundo is not primero and segundo.version == primero.version
+    np.testing.assert_array_equal(segundo["k_Nm"], primero["k_Nm"])
+    np.testing.assert_array_equal(segundo["nombre"], primero["nombre"])
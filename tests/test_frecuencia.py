@@ -0,0 +1,43 @@
+"""Resonancia en forma cerrada frente a la respuesta en frecuencia evaluada en una malla densa."""
+import numpy as np
+import pytest
+
+import frecuencia
+
+# ζ a ambos lados de 1/√2 (la receptancia deja de tener pico por encima)
+_ZETAS = np.array([0.01, 0.05, 0.2, 0.5, 0.69, 0.75, 1.5])
+_M, _K = 2.0, 5000.0
+
+
+@pytest.mark.parametrize("tipo", frecuencia.TIPOS)
+def test_pico_en_forma_cerrada_coincide_con_malla_densa(tipo):
+    c = _ZETAS * 2 * np.sqrt(_M * _K)
+    w_n = np.sqrt(_K / _M)
+    w = np.linspace(0.0, 3 * w_n, 600001)
+    w_malla, pico_malla = frecuencia.bode(_M, _K, c, w, tipo).pico()
+    res = frecuencia.resonancia(_M, _K, c, tipo)
+    np.testing.assert_allclose(res.pico, pico_malla, rtol=1e-8)
+    np.testing.assert_allclose(res.w_pico, w_malla, atol=2 * (w[1] - w[0]))
+
+
+@pytest.mark.parametrize("tipo", frecuencia.TIPOS)
+def test_bordes_de_banda_a_menos_3_db(tipo):
+    c = _ZETAS * 2 * np.sqrt(_M * _K)
+    res = frecuencia.resonancia(_M, _K, c, tipo)
+    mag_sup = frecuencia.bode(_M, _K, c, res.w_sup[:, None], tipo).mag[:, 0]
+    np.testing.assert_allclose(mag_sup, res.pico / np.sqrt(2), rtol=1e-9)
+    hay_inf = res.w_inf > 0
+    mag_inf = frecuencia.bode(_M, _K, c[hay_inf], res.w_inf[hay_inf, None], tipo).mag[:, 0]
+    np.testing.assert_allclose(mag_inf, res.pico[hay_inf] / np.sqrt(2), rtol=1e-9)
+
+
+def test_malla_adaptativa_encuentra_el_pico():
+    c = _ZETAS[:4] * 2 * np.sqrt(_M * _K)
+    _, pico = frecuencia.bode(_M, _K, c, n_fino=400).pico()
+    np.testing.assert_allclose(pico, frecuencia.resonancia(_M, _K, c).pico, rtol=1e-4)
+
+
+def test_receptancia_explicita():
+    w = np.array([0.0, 10.0, 50.0, 200.0])
+    H = frecuencia.bode(_M, _K, 30.0, w).H[0]
+    np.testing.assert_allclose(H, 1 / (_K - _M * w**2 + 1j * 30.0 * w))
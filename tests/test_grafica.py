@@ -0,0 +1,34 @@
+"""Diezmado min/max de la gráfica embebida (sin Tk)."""
+import numpy as np
+import pytest
+
+from grafica import decimar_minmax
+
+
+@pytest.mark.parametrize("n, columnas", [(100_000, 640), (100_003, 641), (1_000, 7)])
+def test_conserva_la_envolvente_por_columna(n, columnas):
+    rng = np.random.default_rng(n)
+    t = np.linspace(0.0, 5.0, n)
+    x = np.exp(-t) * np.cos(40 * t) + 0.01 * rng.standard_normal(n)
+    td, xd = decimar_minmax(t, x, columnas)
+
+    assert len(xd) <= 2 * columnas
+    assert np.all(np.diff(td) >= 0)  # en el orden de la señal
+    # Cada muestra conservada es de la señal, y cada tramo aporta su mínimo y su máximo
+    i = np.searchsorted(t, td)
+    np.testing.assert_array_equal(x[i], xd)
+    tam = -(-n // columnas)
+    tramo = np.arange(n) // tam
+    np.testing.assert_array_equal(np.unique(tramo[i]), np.unique(tramo))
+    for j in (0, tramo[-1] // 2, tramo[-1]):
+        sel = tramo[i] == j
+        assert xd[sel].min() == x[tramo == j].min() and xd[sel].max() == x[tramo == j].max()
+
+
+def test_senal_corta_sin_cambios():
+    t = np.arange(10.0)
+    td, xd = decimar_minmax(t, t**2, 5)
+    np.testing.assert_array_equal(td, t)
+    np.testing.assert_array_equal(xd, t**2)
+    with pytest.raises(ValueError):
+        decimar_minmax(t, t, 0)
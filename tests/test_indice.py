@@ -0,0 +1,52 @@
+"""Índices ordenados frente a búsquedas por fuerza bruta sobre el catálogo."""
+import numpy as np
+import pytest
+
+from indice import IndiceOrdenado, IndiceResortes
+
+
+def _consultas(valores: np.ndarray, semilla: int = 1) -> np.ndarray:
+    """Valores exactos, puntos medios (empates), extremos y valores al azar."""
+    v = np.unique(valores[~np.isnan(valores)])
+    rng = np.random.default_rng(semilla)
+    return np.concatenate((v, (v[1:] + v[:-1]) / 2, [0.0, v[0] / 2, v[-1] * 2], rng.uniform(v[0], v[-1], 200)))
+
+
+def _mas_cercano_bruto(valores: np.ndarray, q: np.ndarray) -> np.ndarray:
+    # nanargmin devuelve la primera fila entre empates, como idxmin()
+    return np.nanargmin(np.abs(valores[None, :] - q[:, None]), axis=1)
+
+
+def test_mas_cercano(resortes):
+    k = resortes["k_Nm"]
+    q = _consultas(k)
+    ind = IndiceResortes.desde_catalogo(resortes)
+    np.testing.assert_array_equal(ind.mas_cercano(q), _mas_cercano_bruto(k, q))
+    assert ind.mas_cercano(float(q[5])) == _mas_cercano_bruto(k, q[5:6])[0]
+
+
+def test_mas_cercano_conserva_la_forma(resortes):
+    q = _consultas(resortes["k_Nm"])[:60].reshape(3, 4, 5)
+    filas = IndiceResortes.desde_catalogo(resortes).mas_cercano(q)
+    assert filas.shape == q.shape
+    np.testing.assert_array_equal(filas.ravel(), _mas_cercano_bruto(resortes["k_Nm"], q.ravel()))
+
+
+@pytest.mark.parametrize("n", [1, 4, 17])
+def test_mas_cercanos(resortes, n):
+    k = resortes["k_Nm"]
+    ind = IndiceOrdenado(k)
+    filas = np.flatnonzero(~np.isnan(k))
+    for q in _consultas(k)[::25]:
+        err = np.abs(k[filas] - q)
+        esperado = filas[np.lexsort((filas, err))][:n]
+        np.testing.assert_array_equal(ind.mas_cercanos(q, n), esperado)
+
+
+def test_en_rango(resortes):
+    k = resortes["k_Nm"]
+    ind = IndiceOrdenado(k)
+    for lo, hi in [(1e3, 2e4), (k[0], k[0]), (0.0, 1.0), (0.0, np.inf)]:
+        filas = ind.en_rango(lo, hi)
+        assert set(filas.tolist()) == set(np.flatnonzero((k >= lo) & (k <= hi)).tolist())
+        assert np.all(np.diff(k[filas]) >= 0)
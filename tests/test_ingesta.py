@@ -0,0 +1,100 @@
+"""Ingesta por esquemas: ida y vuelta archivo → catálogo con conversión a SI."""
+import json
+import sqlite3
+
+import numpy as np
+import pytest
+
+import ingesta
+
+# Columnas en otro orden que el del esquema y una columna que no se usa
+_FILAS = {
+    "OD": [30.0, 25.0, 40.0, 12.0, 18.0],
+    "Extra": [1.0, 2.0, 3.0, 4.0, 5.0],
+    "Rate": [2.5, np.nan, 10.0, 0.4, 1.0],
+    "Part No": ["A", "B", "C", "D", "E"],
+    "Max Defl": [12.0, 8.0, 20.0, 5.0, 9.0],
+}
+_ESQUEMA = ingesta.Esquema.resortes(
+    nombre="Part No",
+    campos={"k_Nm": ("Rate", "N/mm"), "def_max": ("Max Defl", "mm"), "dm_ex": ("OD", "mm")},
+)
+
+
+def _comprobar(cat):
+    validas = ~np.isnan(_FILAS["Rate"])  # las filas sin k se descartan
+    np.testing.assert_array_equal(cat["nombre"], np.array(_FILAS["Part No"])[validas])
+    np.testing.assert_allclose(cat["k_Nm"], np.array(_FILAS["Rate"])[validas] * 1000.0)
+    np.testing.assert_allclose(cat["def_max"], np.array(_FILAS["Max Defl"])[validas] * 1e-3)
+    np.testing.assert_allclose(cat["dm_ex"], np.array(_FILAS["OD"])[validas] * 1e-3)
+    assert np.all(np.isnan(cat["dm_in"]))
+
+
+def test_parquet_lee_columnas_por_nombre(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    ruta = tmp_path / "resortes.parquet"
+    pq.write_table(pa.table(_FILAS), ruta)
+    _comprobar(ingesta.cargar_resortes(str(ruta), _ESQUEMA, tam_bloque=2))
+
+
+def test_csv(tmp_path):
+    pd = pytest.importorskip("pandas")
+    ruta = tmp_path / "resortes.csv"
+    pd.DataFrame(_FILAS).to_csv(ruta, index=False)
+    _comprobar(ingesta.cargar_resortes(str(ruta), _ESQUEMA, tam_bloque=2))
+
+
+def test_excel(tmp_path):
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("openpyxl")
+    ruta = tmp_path / "resortes.xlsx"
+    pd.DataFrame(_FILAS).to_excel(ruta, index=False)
+    _comprobar(ingesta.cargar_resortes(str(ruta), _ESQUEMA))
+
+
+def _base_sqlite(ruta):
+    con = sqlite3.connect(ruta)
+    with con:
+        con.execute('CREATE TABLE "muelles" ("OD" REAL, "Extra" REAL, "Rate" REAL, "Part No" TEXT, "Max Defl" REAL)')
+        filas = zip(*(_FILAS[c] for c in ("OD", "Extra", "Rate", "Part No", "Max Defl")))
+        con.executemany("INSERT INTO muelles VALUES (?, ?, ?, ?, ?)", [
+            tuple(None if isinstance(v, float) and np.isnan(v) else v for v in fila) for fila in filas
+        ])
+    con.close()
+
+
+def test_sqlite_tabla_y_consulta(tmp_path):
+    ruta = str(tmp_path / "proveedor.db")
+    _base_sqlite(ruta)
+    campos = {"k_Nm": ("Rate", "N/mm"), "def_max": ("Max Defl", "mm"), "dm_ex": ("OD", "mm")}
+    _comprobar(ingesta.cargar_resortes(ruta, ingesta.Esquema.resortes("Part No", campos, tabla="muelles"), tam_bloque=2))
+    consulta = 'SELECT "Max Defl", "Part No", "Rate", "OD" FROM muelles ORDER BY rowid'
+    _comprobar(ingesta.cargar_resortes(ruta, ingesta.Esquema.resortes("Part No", campos, consulta=consulta)))
+
+
+def test_aceites_desde_json(tmp_path):
+    pd = pytest.importorskip("pandas")
+    ruta = tmp_path / "aceites.csv"
+    pd.DataFrame({"Oil": ["X", "Y"], "nu40": [3.2e-5, 1.5e-4], "rho": [880.0, 905.0]}).to_csv(ruta, index=False)
+    ruta_esquema = tmp_path / "esquema.json"
+    ruta_esquema.write_text(json.dumps({
+        "tipo": "aceites", "nombre": "Oil",
+        "campos": {"Visc_40": ["nu40", "m²/s"], "densidad": ["rho", "kg/m³"]},
+    }), encoding="utf-8")
+    cat = ingesta.cargar_aceites(str(ruta), ingesta.Esquema.desde_json(str(ruta_esquema)))
+    np.testing.assert_array_equal(cat["nombre"], ["X", "Y"])
+    np.testing.assert_allclose(cat["Visc_40"], [32.0, 150.0])
+    np.testing.assert_allclose(cat["densidad"], [0.88, 0.905])
+    assert np.all(np.isnan(cat["Visc_100"]))
+
+
+def test_esquema_invalido(tmp_path):
+    with pytest.raises(ValueError):
+        ingesta.Esquema.resortes("Part No", {"def_max": ("Max Defl", "mm")})  # falta k_Nm
+    with pytest.raises(ValueError):
+        ingesta.Esquema.resortes("Part No", {"k_Nm": ("Rate", "furlong")})
+    ruta = tmp_path / "catalogo.feather"
+    ruta.write_bytes(b"")
+    with pytest.raises(ValueError):
+        ingesta.cargar_resortes(str(ruta), _ESQUEMA)
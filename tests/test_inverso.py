@@ -0,0 +1,85 @@
+"""Diseño inverso de alpha frente a la evaluación de todos los aceites."""
+import numpy as np
+import pytest
+
+import inverso
+from indice import IndiceResortes
+from restricciones import Limites
+
+
+def _puntos(n: int = 200, semilla: int = 3):
+    rng = np.random.default_rng(semilla)
+    return rng.uniform(5.0, 200.0, n), rng.uniform(0.2, 80.0, n)
+
+
+def _bruto(termino, c_crit, zeta_obj, alpha_min, alpha_max, alpha_pref):
+    """Aceite elegido por resolver(): menor error en ζ, luego alpha más cercano a alpha_pref, luego fila."""
+    alpha = np.clip(zeta_obj * c_crit / termino, alpha_min, alpha_max)
+    zeta = alpha * termino / c_crit
+    err = np.abs(zeta - zeta_obj)
+    err = np.where(err <= inverso._TOL_ZETA * zeta_obj, 0.0, err)
+    filas = np.arange(len(termino))
+    mejor = np.lexsort((filas, np.abs(alpha - alpha_pref), err))[0]
+    return mejor, alpha[mejor], zeta[mejor]
+
+
+def test_alpha_requerido_en_forma_cerrada(resortes, aceites):
+    w_n, m = _puntos(20)
+    diseno = inverso.DisenoInverso(w_n, m, resortes, aceites)
+    tabla = diseno.alpha_requerido(0.3)
+    assert tabla.shape == (20, len(aceites))
+    k = resortes["k_Nm"][IndiceResortes.desde_catalogo(resortes).mas_cercano(m * w_n**2)]
+    zeta = tabla * aceites["Visc_40"] / (2 * np.sqrt(m * k))[:, None]
+    np.testing.assert_allclose(zeta, 0.3)
+
+
+@pytest.mark.parametrize(
+    "zeta_obj, alpha_min, alpha_max, alpha_pref",
+    [(0.2, None, None, None), (0.05, 2.0, 6.0, 3.0), (0.9, 1.0, 20.0, 19.0), (0.3, 5.0, 5.0, None)],
+)
+def test_resolver_cinematica(resortes, aceites, zeta_obj, alpha_min, alpha_max, alpha_pref):
+    w_n, m = _puntos()
+    diseno = inverso.DisenoInverso(w_n, m, resortes, aceites)
+    res = diseno.resolver(zeta_obj, alpha_min=alpha_min, alpha_max=alpha_max, alpha_pref=alpha_pref)
+    a_min = inverso.ALPHA_MIN if alpha_min is None else alpha_min
+    a_max = inverso.ALPHA_MAX if alpha_max is None else alpha_max
+    a_pref = min(max(inverso.ALPHA if alpha_pref is None else alpha_pref, a_min), a_max)
+    for j in range(len(w_n)):
+        fila, alpha, zeta = _bruto(aceites["Visc_40"], diseno.c_crit[j], zeta_obj, a_min, a_max, a_pref)
+        assert res.i_aceite[j] == fila
+        assert res.alpha[j] == pytest.approx(alpha)
+        assert res.zeta[j] == pytest.approx(zeta)
+    assert np.all((res.alpha >= a_min) & (res.alpha <= a_max))
+    np.testing.assert_array_equal(res.en_banda, np.abs(res.zeta - zeta_obj) <= 1e-12 * zeta_obj)
+    np.testing.assert_allclose(res.c, res.alpha * aceites["Visc_40"][res.i_aceite])
+
+
+def test_resolver_dinamica_y_banda(resortes, aceites):
+    w_n, m = _puntos(100)
+    diseno = inverso.DisenoInverso(w_n, m, resortes, aceites, viscosidad="dinamica")
+    with pytest.raises(ValueError):
+        diseno.resolver(0.2)
+    res = diseno.resolver(0.2, banda=(0.15, 0.25), alpha_min=0.5, alpha_max=40.0)
+    termino = aceites["Visc_40"] * aceites["densidad"] * 1e-3
+    a_pref = np.sqrt(0.5 * 40.0)
+    for j in range(len(w_n)):
+        fila, alpha, _ = _bruto(termino, diseno.c_crit[j], 0.2, 0.5, 40.0, a_pref)
+        assert res.i_aceite[j] == fila
+        assert res.alpha[j] == pytest.approx(alpha)
+    np.testing.assert_array_equal(res.en_banda, (res.zeta >= 0.15 * (1 - 1e-12)) & (res.zeta <= 0.25 * (1 + 1e-12)))
+
+
+def test_resolver_sin_resorte_permitido(resortes, aceites):
+    # Ningún resorte del catálogo sintético tiene dm_in >= 5 cm
+    diseno = inverso.DisenoInverso([50.0, 80.0], [1.0, 2.0], resortes, aceites, limites=Limites(d_vastago=0.05))
+    res = diseno.resolver()
+    np.testing.assert_array_equal(res.i_resorte, -1)
+    np.testing.assert_array_equal(res.i_aceite, -1)
+    assert np.all(np.isnan(res.alpha))
+
+
+def test_resolver_valida_parametros(resortes, aceites):
+    diseno = inverso.DisenoInverso(50.0, 1.0, resortes, aceites)
+    for kwargs in ({"zeta_obj": 0.0}, {"alpha_min": 3.0, "alpha_max": 2.0}, {"banda": (0.25, 0.3)}):
+        with pytest.raises(ValueError):
+            diseno.resolver(**kwargs)
@@ -0,0 +1,33 @@
+"""Clases Resorte y Amortiguador: fórmulas en forma cerrada y validación."""
+import numpy as np
+import pytest
+
+import main
+
+
+@pytest.fixture
+def amort():
+    return main.Amortiguador("15W", densidad=0.881, visc_40=72.6, visc_100=11.6)
+
+
+def test_relacion_amortiguamiento_inversa_de_coef(amort):
+    masa = np.array([0.5, 1.0, 20.0])
+    k = np.array([100.0, 2e3, 5e4])
+    c = amort.coef_amortiguamiento(masa, k, factor=0.3)
+    np.testing.assert_allclose(amort.relacion_amortiguamiento(masa, k, c), 0.3)
+    assert amort.relacion_amortiguamiento(1.0, 100.0, 20.0) == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize(
+    "masa, k",
+    [(0.0, 100.0), (-1.0, 100.0), (1.0, 0.0), (1.0, -5.0), (np.array([1.0, 0.0]), 100.0), (1.0, np.array([10.0, -1.0]))],
+)
+def test_relacion_amortiguamiento_rechaza_masa_o_k_no_positivas(amort, masa, k):
+    with pytest.raises(ValueError):
+        amort.relacion_amortiguamiento(masa, k, 1.0)
+
+
+def test_omega_natural_y_frecuencia():
+    resorte = main.Resorte("A", k=200.0, long_libre=0.1, def_max=0.02, dm_in=0.02, dm_ex=0.03)
+    assert resorte.omega_natural(2.0) == pytest.approx(10.0)
+    assert resorte.frec_natural(2.0) == pytest.approx(10.0 / (2 * np.pi))
@@ -0,0 +1,74 @@
+"""Caché LRU acotada por entradas y bytes."""
+import threading
+
+import numpy as np
+import pytest
+
+import memo
+import seleccion
+
+
+def test_desaloja_la_menos_usada():
+    cache = memo.CacheLRU(max_entradas=3)
+    for clave in "abc":
+        cache.guardar(clave, clave.upper())
+    assert cache.obtener("a") == "A"  # "a" pasa a ser la más reciente
+    cache.guardar("d", "D")
+    assert "b" not in cache and all(c in cache for c in "acd")
+    assert cache.estadisticas() == {"entradas": 3, "bytes": cache._bytes, "aciertos": 1, "fallos": 0, "desalojos": 1}
+
+
+def test_limite_de_bytes():
+    cache = memo.CacheLRU(max_entradas=100, max_bytes=10_000)
+    for i in range(5):
+        cache.guardar(i, np.zeros(400))  # 3200 bytes cada uno
+    assert len(cache) == 3 and cache.estadisticas()["bytes"] == 3 * 3200
+    cache.guardar("grande", np.zeros(2000))  # no cabe ni sola: no se guarda ni desaloja
+    assert "grande" not in cache and len(cache) == 3
+
+
+def test_tamano_recorre_resultados(resortes, aceites):
+    res = seleccion.seleccionar_lote(np.linspace(10.0, 100.0, 50), 2.0, None, resortes, aceites)
+    arrays = sum(v.nbytes for v in vars(res).values() if isinstance(v, np.ndarray))
+    assert arrays <= memo.tamano(res) <= arrays + 4096
+
+
+def test_obtener_o_calcular_y_version():
+    cache = memo.CacheLRU()
+    llamadas = []
+
+    def calcular():
+        llamadas.append(1)
+        return 42
+
+    assert cache.con_version("v1").obtener_o_calcular("x", calcular) == 42
+    assert cache.con_version("v1").obtener_o_calcular("x", calcular) == 42
+    assert len(llamadas) == 1 and cache.aciertos == 1
+    cache.con_version("v2")  # catálogos distintos: se vacía
+    assert len(cache) == 0
+    cache.obtener_o_calcular("x", calcular)
+    assert len(llamadas) == 2
+
+
+def test_segura_entre_hilos():
+    cache = memo.CacheLRU(max_entradas=16)
+    errores = []
+
+    def trabajar(semilla):
+        rng = np.random.default_rng(semilla)
+        for clave in rng.integers(0, 64, 2000).tolist():
+            if cache.obtener_o_calcular(clave, lambda: clave * 2) != clave * 2:
+                errores.append(clave)
+
+    hilos = [threading.Thread(target=trabajar, args=(s,)) for s in range(4)]
+    for h in hilos:
+        h.start()
+    for h in hilos:
+        h.join()
+    assert not errores and len(cache) <= 16
+    assert cache.aciertos + cache.fallos == 4 * 2000
+
+
+def test_limites_invalidos():
+    with pytest.raises(ValueError):
+        memo.CacheLRU(max_entradas=0)
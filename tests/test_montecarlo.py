@@ -0,0 +1,51 @@
+"""Monte Carlo de tolerancias: reproducibilidad y límite sin dispersión."""
+import numpy as np
+import pytest
+
+import montecarlo
+from montecarlo import Tolerancias
+
+_PARES = dict(m=np.array([2.0, 40.0]), k=np.array([5e3, 2e4]), visc_40=np.array([68.0, 220.0]), visc_100=np.array([8.5, 19.0]))
+
+
+def _iguales(a, b):
+    for nombre in vars(a):
+        np.testing.assert_array_equal(getattr(a, nombre), getattr(b, nombre))
+
+
+@pytest.mark.parametrize("tam_bloque", [1, 5000, 1 << 16])
+def test_misma_semilla_mismo_resultado_con_cualquier_bloque(tam_bloque):
+    base = montecarlo.analizar(**_PARES, n_muestras=20000, semilla=7)
+    _iguales(montecarlo.analizar(**_PARES, n_muestras=20000, tam_bloque=tam_bloque, semilla=7), base)
+
+
+def test_mismo_resultado_con_varios_procesos():
+    base = montecarlo.analizar(**_PARES, n_muestras=10000, semilla=3)
+    _iguales(montecarlo.analizar(**_PARES, n_muestras=10000, semilla=3, procesos=2), base)
+
+
+def test_semillas_distintas_dan_muestras_distintas():
+    a = montecarlo.analizar(**_PARES, n_muestras=10000, semilla=1)
+    b = montecarlo.analizar(**_PARES, n_muestras=10000, semilla=2)
+    assert not np.array_equal(a.zeta, b.zeta)
+
+
+def test_sin_dispersion_coincide_con_la_seleccion_a_40_grados():
+    tol = Tolerancias(k=0.0, visc_40=0.0, visc_100=0.0, temp_media=40.0, temp_desv=0.0)
+    res = montecarlo.analizar(**_PARES, alpha=5.0, tolerancias=tol, n_muestras=1000, semilla=0)
+    m, k = _PARES["m"], _PARES["k"]
+    zeta = 5.0 * _PARES["visc_40"] / (2 * np.sqrt(m * k))
+    np.testing.assert_allclose(res.w_n, np.repeat(np.sqrt(k / m)[:, None], 5, axis=1), rtol=1e-12)
+    np.testing.assert_allclose(res.zeta, np.repeat(zeta[:, None], 5, axis=1), rtol=1e-9)
+    np.testing.assert_allclose(res.desv_zeta, 0.0, atol=1e-12)
+    assert zeta[0] > 1 > zeta[1]
+    sobre = [0.0, np.exp(-np.pi * zeta[1] / np.sqrt(1 - zeta[1] ** 2))]
+    np.testing.assert_allclose(res.media_sobrepaso, sobre, rtol=1e-9)
+    np.testing.assert_array_equal(res.frac_sobreamortiguado, (zeta >= 1).astype(float))
+
+
+def test_rechaza_entradas_invalidas():
+    with pytest.raises(ValueError):
+        montecarlo.analizar(1.0, 100.0, 68.0, 8.5, n_muestras=0)
+    with pytest.raises(ValueError):
+        Tolerancias(k=1.0)
@@ -0,0 +1,74 @@
+"""Medición por etapas: desactivada por defecto, anidamiento, memoria y sumideros."""
+import json
+
+import numpy as np
+import pytest
+
+import perfil
+import seleccion
+
+
+@pytest.fixture
+def registro():
+    reg = perfil.Registro()
+    perfil.activar(reg)
+    yield reg
+    perfil.desactivar()
+
+
+def test_desactivado_no_mide():
+    assert not perfil.activo()
+    assert perfil.etapa("a") is perfil.etapa("b")  # el mismo contexto vacío
+
+
+def test_etapas_anidadas(registro):
+    with perfil.etapa("externa"):
+        with perfil.etapa("interna"):
+            pass
+        with perfil.etapa("interna"):
+            pass
+    internas = [m for m in registro.mediciones if m["etapa"] == "interna"]
+    assert [m["padre"] for m in internas] == ["externa", "externa"]
+    (externa,) = [m for m in registro.mediciones if m["etapa"] == "externa"]
+    assert externa["padre"] is None and "bytes" not in externa
+    resumen = registro.resumen()
+    assert resumen["interna"]["llamadas"] == 2
+    assert resumen["externa"]["total_s"] >= resumen["interna"]["total_s"]
+    assert "interna" in registro.texto()
+
+
+def test_seleccion_instrumentada(registro, resortes, aceites):
+    seleccion.seleccionar_lote(np.linspace(10.0, 100.0, 20), 2.0, None, resortes, aceites)
+    assert {"seleccion_resorte", "seleccion_aceite"} <= set(registro.resumen())
+
+
+def test_memoria_y_pico_de_la_etapa_padre():
+    reg = perfil.Registro()
+    perfil.activar(reg, memoria=True)
+    try:
+        with perfil.etapa("padre"):
+            with perfil.etapa("hijo"):
+                temporal = np.ones(1 << 20)  # 8 MiB que se liberan al salir
+                del temporal
+            guardado = np.ones(1 << 17)  # 1 MiB que sigue vivo al cerrar "padre"
+    finally:
+        perfil.desactivar()
+    med = {m["etapa"]: m for m in reg.mediciones}
+    assert med["hijo"]["pico_bytes"] >= 8 << 20
+    assert med["padre"]["pico_bytes"] >= 8 << 20  # el pico del hijo cuenta para el padre
+    assert (1 << 20) <= med["padre"]["bytes"] < (2 << 20)
+    assert guardado.size == 1 << 17
+
+
+def test_sumidero_json(tmp_path):
+    ruta = tmp_path / "perfil.jsonl"
+    perfil.activar(perfil.SumideroJSON(str(ruta)))
+    try:
+        with perfil.etapa("a"):
+            pass
+    finally:
+        perfil.desactivar()
+    (linea,) = ruta.read_text(encoding="utf-8").splitlines()
+    assert json.loads(linea)["etapa"] == "a"
+    with pytest.raises(ValueError):
+        perfil.activar()
@@ -0,0 +1,71 @@
+"""Respuesta libre y forzada de 1 GDL frente a referencias en forma cerrada."""
+import numpy as np
+import pytest
+
+import respuesta
+
+
+def test_rk4_rechaza_paso_inestable_sobreamortiguado():
+    # ω_n·Δt = 0.05, pero el polo rápido es ≈ 1000 rad/s → |λ|·Δt ≈ 5
+    t = np.linspace(0.0, 1.0, 201)
+    with pytest.raises(ValueError):
+        respuesta.integrar(1.0, 100.0, 1000.0, t, x0=1.0)
+
+
+def test_rk4_sobreamortiguado_con_paso_fino_coincide_con_forma_cerrada():
+    t = np.linspace(0.0, 1.0, 2001)  # |λ|·Δt ≈ 0.5
+    x, _ = respuesta.integrar(1.0, 100.0, 1000.0, t, x0=1.0)
+    x_ref = respuesta.respuesta_libre(1.0, 100.0, 1000.0, t, 1.0)
+    np.testing.assert_allclose(x, np.reshape(x_ref, x.shape), rtol=1e-6, atol=1e-7)
+
+
+@pytest.mark.parametrize("zeta", [0.0, 0.05, 0.7, 1.0, 1.0 + 1e-8, 3.0])
+def test_forma_cerrada_coincide_con_rk4(zeta):
+    m, k = 2.0, 800.0  # ω_n = 20 rad/s
+    c = zeta * 2 * np.sqrt(m * k)
+    t = np.linspace(0.0, 2.0, 8001)
+    x_rk, v_rk = respuesta.integrar(m, k, c, t, x0=0.01, v0=-0.3)
+    x, v = respuesta.respuesta_libre(m, k, c, t, 0.01, -0.3, out_v=np.empty((1, len(t))))
+    np.testing.assert_allclose(x, x_rk, atol=1e-9)
+    np.testing.assert_allclose(v, v_rk, atol=1e-8)
+
+
+def test_forma_cerrada_subamortiguada_explicita():
+    m, k, c = 1.0, 100.0, 2.0  # ω_n = 10, ζ = 0.1
+    t = np.linspace(0.0, 3.0, 301)
+    wd = 10.0 * np.sqrt(1 - 0.1**2)
+    esperado = np.exp(-1.0 * t) * (0.02 * np.cos(wd * t) + (0.5 + 1.0 * 0.02) / wd * np.sin(wd * t))
+    np.testing.assert_allclose(respuesta.respuesta_libre(m, k, c, t, 0.02, 0.5)[0], esperado, atol=1e-14)
+
+
+def test_por_bloques_igual_a_una_sola_evaluacion():
+    m, k, c = np.array([1.0, 3.0]), np.array([400.0, 90.0]), np.array([4.0, 60.0])
+    bloques = [
+        (t.copy(), x.copy(), v.copy(), a.copy())
+        for t, x, v, a in respuesta.respuesta_por_bloques(m, k, c, 0.01, 0.0, duracion=1.0, fs=500.0, tam_bloque=64)
+    ]
+    t = np.concatenate([b[0] for b in bloques])
+    x = np.concatenate([b[1] for b in bloques], axis=1)
+    v = np.concatenate([b[2] for b in bloques], axis=1)
+    a = np.concatenate([b[3] for b in bloques], axis=1)
+    np.testing.assert_allclose(t, np.arange(500) / 500.0)
+    x_ref, v_ref = respuesta.respuesta_libre(m, k, c, t, 0.01, 0.0, out_v=np.empty((2, len(t))))
+    np.testing.assert_allclose(x, x_ref, atol=1e-12)
+    np.testing.assert_allclose(v, v_ref, atol=1e-10)
+    np.testing.assert_allclose(a, -(c[:, None] * v_ref + k[:, None] * x_ref) / m[:, None], atol=1e-8)
+
+
+def test_rk4_fuerza_armonica_en_regimen_permanente():
+    # Tras el transitorio la amplitud es F0·|H(jω)| = F0 / sqrt((k - mω²)² + (cω)²)
+    m, k, c, F0, w = 1.0, 400.0, 8.0, 2.0, 15.0
+    t = np.linspace(0.0, 10.0, 20001)
+    x, _ = respuesta.integrar(m, k, c, t, fuerza=lambda ti: F0 * np.sin(w * ti))
+    amplitud = np.abs(x[0, t > 8.0]).max()
+    assert amplitud == pytest.approx(F0 / np.hypot(k - m * w**2, c * w), rel=1e-4)
+
+
+def test_rk4_fuerza_constante_llega_a_la_deflexion_estatica():
+    t = np.linspace(0.0, 5.0, 5001)
+    x, v = respuesta.integrar([1.0, 4.0], [100.0, 900.0], [6.0, 30.0], t, fuerza=lambda ti: np.array([9.81, 39.24]))
+    np.testing.assert_allclose(x[:, -1], [9.81 / 100.0, 39.24 / 900.0], rtol=1e-6)
+    np.testing.assert_allclose(v[:, -1], 0.0, atol=1e-6)
@@ -0,0 +1,172 @@
+"""Selección de resorte y aceite (con y sin restricciones) frente a fuerza bruta."""
+import numpy as np
+import pytest
+
+import catalogo
+import restricciones
+import seleccion
+from restricciones import G, Limites
+
+
+def _puntos(n: int = 400, semilla: int = 2):
+    rng = np.random.default_rng(semilla)
+    return rng.uniform(5.0, 200.0, n), rng.uniform(0.2, 80.0, n)
+
+
+def _aceite_bruto(aceites, m, k, alpha=seleccion.ALPHA, zeta_obj=seleccion.ZETA_OBJ):
+    c_crit = 2 * np.sqrt(m * k)
+    zeta = aceites["Visc_40"][None, :] * alpha / c_crit[:, None]
+    return np.argmin(np.abs(zeta - zeta_obj), axis=1)
+
+
+def _resorte_bruto(resortes, k_req, permitido=None):
+    err = np.abs(resortes["k_Nm"][None, :] - k_req[:, None])
+    if permitido is not None:
+        err = np.where(permitido, err, np.nan)
+    err = np.where(np.isnan(err), np.inf, err)
+    filas = np.argmin(err, axis=1)
+    return np.where(np.isinf(err[np.arange(len(filas)), filas]), -1, filas)
+
+
+def test_seleccionar_lote(resortes, aceites):
+    w_n, m = _puntos()
+    res = seleccion.seleccionar_lote(w_n, m, None, resortes, aceites)
+    i_r = _resorte_bruto(resortes, m * w_n**2)
+    np.testing.assert_array_equal(res.i_resorte, i_r)
+    k = resortes["k_Nm"][i_r]
+    np.testing.assert_array_equal(res.i_aceite, _aceite_bruto(aceites, m, k))
+    np.testing.assert_allclose(res.k, k)
+    np.testing.assert_allclose(res.c, seleccion.ALPHA * aceites["Visc_40"][res.i_aceite])
+    np.testing.assert_allclose(res.zeta, res.c / (2 * np.sqrt(m * k)))
+    with np.errstate(invalid="ignore"):
+        np.testing.assert_allclose(res.w_d, w_n * np.sqrt(1 - res.zeta**2))
+
+
+def test_seleccionar_lote_alpha_y_zeta_por_punto(resortes, aceites):
+    w_n, m = _puntos(50)
+    alpha = np.linspace(1.0, 10.0, 50)
+    zeta_obj = np.linspace(0.05, 0.8, 50)
+    res = seleccion.seleccionar_lote(w_n, m, None, resortes, aceites, alpha, zeta_obj)
+    for j in range(50):
+        esperado = _aceite_bruto(aceites, m[j : j + 1], res.k[j : j + 1], alpha[j], zeta_obj[j])[0]
+        assert res.i_aceite[j] == esperado
+
+
+def test_seleccionar_lote_rechaza_entradas_invalidas(resortes, aceites):
+    with pytest.raises(ValueError):
+        seleccion.seleccionar_lote(10.0, 0.0, None, resortes, aceites)
+    with pytest.raises(ValueError):
+        seleccion.seleccionar_lote(10.0, 1.0, None, resortes, aceites, alpha=0.0)
+
+
+@pytest.mark.parametrize(
+    "limites",
+    [
+        Limites(),
+        Limites(d_alojamiento=0.03, d_vastago=0.01, long_max=0.3),
+        Limites(deflexion=False, d_alojamiento=0.025),
+        Limites(d_vastago=0.039),  # casi ningún resorte: muchos puntos sin selección
+    ],
+)
+@pytest.mark.parametrize("n_a0", [1, 4, 300])  # 300: un A0 distinto por punto
+def test_seleccion_con_restricciones(resortes, aceites, limites, n_a0):
+    w_n, m = _puntos(300)
+    rng = np.random.default_rng(n_a0)
+    A0 = np.full(300, np.nan) if n_a0 == 1 else rng.choice(np.r_[np.nan, rng.uniform(0, 0.04, n_a0 - 1)], 300)
+    res = seleccion.seleccionar_lote(w_n, m, A0, resortes, aceites, limites=limites)
+
+    permitido = np.ones((300, len(resortes)), dtype=bool)
+    if limites.deflexion:
+        with np.errstate(invalid="ignore"):
+            permitido &= resortes["k_Nm"] * (resortes["def_max"] - np.nan_to_num(A0)[:, None]) >= (m * G)[:, None]
+    if limites.d_alojamiento is not None:
+        permitido &= resortes["dm_ex"] <= limites.d_alojamiento
+    if limites.d_vastago is not None:
+        permitido &= resortes["dm_in"] >= limites.d_vastago
+    if limites.long_max is not None:
+        permitido &= resortes["long_libre"] <= limites.long_max
+    i_r = _resorte_bruto(resortes, m * w_n**2, permitido)
+
+    np.testing.assert_array_equal(res.i_resorte, i_r)
+    sin = i_r < 0
+    assert np.all(res.i_aceite[sin] == -1) and np.all(np.isnan(res.k[sin]))
+    np.testing.assert_array_equal(
+        res.i_aceite[~sin], _aceite_bruto(aceites, m[~sin], resortes["k_Nm"][i_r[~sin]])
+    )
+
+
+def test_deflexion_con_todas_las_filas_en_la_envolvente():
+    # k·def_max cóncava en k: todas las filas son vértices de la envolvente
+    # en todos los niveles del árbol (el peor caso de tamaño)
+    rng = np.random.default_rng(5)
+    n = 3000
+    k = np.repeat(np.sort(rng.uniform(500.0, 5e5, n // 3)), 3)
+    columnas = {
+        "nombre": np.array([f"R{i}" for i in range(n)]),
+        "k_Nm": k,
+        "def_max": 3.0 / np.sqrt(k) * rng.uniform(0.9, 1.0, n),
+        "dm_in": rng.uniform(0.005, 0.04, n),
+        "dm_ex": rng.uniform(0.01, 0.05, n),
+        "long_libre": rng.uniform(0.02, 0.3, n),
+    }
+    cat = catalogo.Catalogo(columnas, "concavo", "resortes_prueba")
+    w_n, m = _puntos(2000)
+    A0 = rng.uniform(0.0, 0.004, 2000)
+    limites = Limites(d_vastago=0.01)
+    filas = restricciones.FiltroResortes(cat).mas_cercano(m * w_n**2, limites, m, A0)
+
+    with np.errstate(invalid="ignore"):
+        permitido = k * (columnas["def_max"] - A0[:, None]) >= (m * G)[:, None]
+    permitido &= columnas["dm_in"] >= 0.01
+    np.testing.assert_array_equal(filas, _resorte_bruto(cat, m * w_n**2, permitido))
+
+
+def test_a0_se_combina_por_broadcasting(resortes, aceites):
+    # A0 con más dimensiones que w_n y m: la forma común es la de los tres juntos
+    m = np.array([0.5, 5.0, 40.0])
+    A0 = np.array([[np.nan], [0.0], [0.02], [0.05]])
+    res = seleccion.seleccionar_lote(60.0, m, A0, resortes, aceites, limites=Limites())
+    assert res.i_resorte.shape == res.A0.shape == res.w_n.shape == (4, 3)
+    for i in range(4):
+        for j in range(3):
+            uno = seleccion.seleccionar_lote(60.0, m[j], A0[i, 0], resortes, aceites, limites=Limites())
+            assert res.i_resorte[i, j] == uno.i_resorte
+            assert res.i_aceite[i, j] == uno.i_aceite
+
+
+def _pares_bruto(resortes, aceites, w_n, m, peso_w, peso_z):
+    k = resortes["k_Nm"][np.isfinite(resortes["k_Nm"])]
+    err_w = np.abs(np.sqrt(k / m) - w_n) / w_n
+    zeta = seleccion.ALPHA * aceites["Visc_40"][None, :] / (2 * np.sqrt(m * k))[:, None]
+    err_z = np.abs(zeta - seleccion.ZETA_OBJ) / seleccion.ZETA_OBJ
+    err_w = np.broadcast_to(err_w[:, None], err_z.shape)
+    validos = np.isfinite(err_z)
+    return err_w[validos], err_z[validos], (peso_w * err_w + peso_z * err_z)[validos]
+
+
+@pytest.mark.parametrize("peso_w, peso_z", [(1.0, 1.0), (10.0, 0.1), (0.01, 5.0)])
+def test_optimizar_par_da_el_optimo_global(resortes, aceites, peso_w, peso_z):
+    for w_n, m in zip(*_puntos(20, semilla=8)):
+        res = seleccion.optimizar_par(w_n, m, resortes, aceites, peso_w=peso_w, peso_z=peso_z)
+        _, _, costo = _pares_bruto(resortes, aceites, w_n, m, peso_w, peso_z)
+        assert res.costo[0] == pytest.approx(costo.min(), rel=1e-12)
+        assert np.all(res.err_w <= res.tol_w * (1 + 1e-12))
+
+
+def test_optimizar_par_frente_completo(resortes, aceites):
+    w_n, m = 60.0, 5.0
+    res = seleccion.optimizar_par(w_n, m, resortes, aceites, tol_w=np.inf)
+    err_w, err_z, _ = _pares_bruto(resortes, aceites, w_n, m, 1.0, 1.0)
+    # No dominados: ningún otro par es mejor o igual en los dos errores y mejor en uno
+    dominado = np.array(
+        [np.any((err_w <= a) & (err_z <= b) & ((err_w < a) | (err_z < b))) for a, b in zip(err_w, err_z)]
+    )
+    esperado = sorted(set(zip(err_w[~dominado].round(12), err_z[~dominado].round(12))))
+    assert sorted(zip(res.err_w.round(12), res.err_z.round(12))) == esperado
+    assert np.all(np.diff(res.costo) >= 0)
+
+
+@pytest.mark.parametrize("opciones", [dict(peso_w=0.0), dict(peso_z=-1.0), dict(tol_w=0.0)])
+def test_optimizar_par_rechaza_pesos_no_positivos(resortes, aceites, opciones):
+    with pytest.raises(ValueError):
+        seleccion.optimizar_par(60.0, 5.0, resortes, aceites, **opciones)
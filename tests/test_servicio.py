@@ -0,0 +1,80 @@
+"""Servidor HTTP: rutas de error y una selección correcta, sobre un socket real."""
+import asyncio
+import json
+
+import numpy as np
+import pytest
+
+import seleccion
+import servicio
+
+
+async def _pedir(puerto: int, crudo: bytes):
+    lector, escritor = await asyncio.open_connection("127.0.0.1", puerto)
+    escritor.write(crudo)
+    await escritor.drain()
+    linea = await lector.readline()
+    resto = await lector.read()
+    escritor.close()
+    estado = int(linea.split()[1])
+    cuerpo = resto.split(b"\r\n\r\n", 1)[1]
+    return estado, json.loads(cuerpo)
+
+
+@pytest.fixture
+def atender(resortes, aceites):
+    def _atender(crudo: bytes):
+        return asyncio.run(_principal(servicio.Servicio(resortes, aceites), crudo))
+
+    return _atender
+
+
+async def _principal(srv: servicio.Servicio, crudo: bytes):
+    servidor = await servicio.servir(srv, puerto=0)
+    try:
+        return await _pedir(servidor.sockets[0].getsockname()[1], crudo)
+    finally:
+        servidor.close()
+        await srv.detener()
+
+
+def _post(cuerpo: bytes, largo=None) -> bytes:
+    largo = len(cuerpo) if largo is None else largo
+    return (
+        f"POST /seleccionar HTTP/1.1\r\nContent-Length: {largo}\r\nConnection: close\r\n\r\n".encode()
+        + cuerpo
+    )
+
+
+def test_seleccion_correcta(atender, resortes, aceites):
+    estado, datos = atender(_post(b'[{"wn": 100, "m": 2}, {"w_n": 30, "m": 15, "A0": 0.01}]'))
+    assert estado == 200
+    res = seleccion.seleccionar_lote([100.0, 30.0], [2.0, 15.0], [np.nan, 0.01], resortes, aceites)
+    assert [d["resorte"] for d in datos] == resortes["nombre"][res.i_resorte].tolist()
+    assert [d["aceite"] for d in datos] == aceites["nombre"][res.i_aceite].tolist()
+    np.testing.assert_allclose([d["zeta"] for d in datos], res.zeta)
+    assert datos[0]["A0"] is None
+
+
+@pytest.mark.parametrize("largo", ["abc", "-5", "+3", "1_0", "4.0"])
+def test_content_length_invalido(atender, largo):
+    estado, datos = atender(_post(b"{}", largo))
+    assert estado == 400
+    assert "Content-Length" in datos["error"]
+
+
+@pytest.mark.parametrize(
+    "crudo, esperado",
+    [
+        (b"GET /otra HTTP/1.1\r\nConnection: close\r\n\r\n", 404),
+        (b"GET /seleccionar HTTP/1.1\r\nConnection: close\r\n\r\n", 405),
+        (_post(b"{no es json"), 400),
+        (_post(b'{"wn": 100}'), 400),
+        (_post(b'{"wn": -1, "m": 2}'), 400),
+        (b"POST /seleccionar HTTP/1.1\r\nContent-Length: 999999999\r\n\r\n", 413),
+        (b"basura\r\n", 400),
+    ],
+)
+def test_errores(atender, crudo, esperado):
+    estado, _ = atender(crudo)
+    assert estado == esperado
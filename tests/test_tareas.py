@@ -0,0 +1,52 @@
+"""Tareas en segundo plano: mensajes de avance, resultado, error y cancelación."""
+import threading
+
+import pytest
+
+import tareas
+
+
+def _esperar(tarea):
+    tarea._hilo.join(timeout=10)
+    assert not tarea.activa
+    return tarea.eventos()
+
+
+def test_avance_y_resultado():
+    def fn(a, b, informar):
+        informar(0.5, "mitad")
+        return a + b
+
+    eventos = _esperar(tareas.Tarea(fn, 2, 3).iniciar())
+    assert eventos == [("progreso", 0.5, "mitad"), ("resultado", 5)]
+
+
+def test_error_llega_como_mensaje():
+    def fn(informar):
+        raise ValueError("entrada inválida")
+
+    (evento,) = _esperar(tareas.Tarea(fn).iniciar())
+    assert evento[0] == "error" and isinstance(evento[1], ValueError)
+
+
+@pytest.mark.parametrize("informa_al_final", [True, False])
+def test_cancelar_entre_etapas(informa_al_final):
+    empezo, seguir = threading.Event(), threading.Event()
+    etapas = []
+
+    def fn(informar):
+        informar(0.0, "inicio")
+        empezo.set()
+        seguir.wait(timeout=10)
+        if informa_al_final:
+            informar(0.5, "segunda etapa")  # lanza Cancelado
+            etapas.append("segunda")
+        return "no debería llegar"
+
+    tarea = tareas.Tarea(fn).iniciar()
+    empezo.wait(timeout=10)
+    tarea.cancelar()
+    seguir.set()
+    eventos = _esperar(tarea)
+    assert eventos == [("progreso", 0.0, "inicio"), ("cancelado",)]
+    assert etapas == []
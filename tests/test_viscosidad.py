@@ -0,0 +1,63 @@
+"""Modelo ASTM D341 (Walther) y su tabla precalculada."""
+import numpy as np
+import pytest
+
+import viscosidad
+
+_RNG = np.random.default_rng(0)
+_VISC_40 = _RNG.uniform(10.0, 300.0, 25)
+_VISC_100 = _VISC_40 / _RNG.uniform(4.0, 7.0, 25)  # ν40/ν100 como los aceites del catálogo
+_DENSIDAD = _RNG.uniform(0.8, 0.95, 25)
+
+
+@pytest.fixture
+def modelo():
+    return viscosidad.ModeloASTM(_DENSIDAD, _VISC_40, _VISC_100)
+
+
+def test_pasa_por_los_puntos_del_catalogo(modelo):
+    nu = modelo.nu([40.0, 100.0])
+    np.testing.assert_allclose(nu[:, 0], _VISC_40, rtol=1e-12)
+    np.testing.assert_allclose(nu[:, 1], _VISC_100, rtol=1e-12)
+    np.testing.assert_allclose(modelo.eta(40.0)[:, 0], _VISC_40 * 1e-6 * _DENSIDAD * 1000.0, rtol=1e-12)
+
+
+def test_recta_de_walther_y_extrapolacion(modelo):
+    temps = np.array([-10.0, 20.0, 70.0, 130.0])
+    nu = modelo.nu(temps)
+    # log10(log10(ν + 0.7)) es lineal en log10(T [K]) con la pendiente de los dos puntos del catálogo
+    y = np.log10(np.log10(nu + 0.7))
+    x = np.log10(temps + 273.15)
+    y40, y100 = np.log10(np.log10(_VISC_40 + 0.7)), np.log10(np.log10(_VISC_100 + 0.7))
+    pendiente = (y100 - y40) / (np.log10(373.15) - np.log10(313.15))
+    np.testing.assert_allclose(y, y40[:, None] + pendiente[:, None] * (x - np.log10(313.15)), atol=1e-12)
+    # Sin saturación fuera de [40, 100] °C, a diferencia de la interpolación lineal
+    assert np.all(nu[:, 0] > _VISC_40) and np.all(nu[:, -1] < _VISC_100)
+    assert np.all(np.diff(nu, axis=1) < 0)
+
+
+def test_nu_walther_elemento_a_elemento(modelo):
+    temps = np.random.default_rng(1).uniform(0.0, 120.0, 25)
+    np.testing.assert_allclose(
+        viscosidad.nu_walther(_VISC_40, _VISC_100, temps), modelo.nu(temps)[np.arange(25), np.arange(25)], rtol=1e-12
+    )
+
+
+def test_tabla_interpola_con_error_pequeno(modelo):
+    tabla = modelo.tabla()
+    temps = np.linspace(-20.0, 150.0, 997)
+    np.testing.assert_allclose(tabla.eta(temps), modelo.eta(temps), rtol=1e-3)
+    # Un aceite por elemento, cada uno con su temperatura
+    rng = np.random.default_rng(2)
+    aceite = rng.integers(0, 25, 40)
+    t = rng.uniform(-20.0, 150.0, 40)
+    np.testing.assert_allclose(tabla.eta(t, aceite), modelo.eta(t)[aceite, np.arange(40)], rtol=1e-3)
+    # Fuera de la malla se satura en el extremo
+    np.testing.assert_allclose(tabla.eta([-50.0, 200.0]), tabla.eta_tabla[:, [0, -1]], rtol=1e-15)
+
+
+def test_rechaza_entradas_invalidas(modelo):
+    with pytest.raises(ValueError):
+        viscosidad.ModeloASTM([0.9], [-1.0], [5.0])
+    with pytest.raises(ValueError):
+        modelo.tabla(t_min=50.0, t_max=40.0)
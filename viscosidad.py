@@ -0,0 +1,154 @@
+"""
+Viscosidad en función de la temperatura según ASTM D341 (Walther).
+
+    log10(log10(ν + 0.7)) = A - B·log10(T)        ν en mm²/s (cSt), T en K
+
+A y B se ajustan por aceite con los dos puntos del catálogo (40 °C y 100 °C).
+A diferencia de la interpolación lineal de Amortiguador.viscosidad_dinamica,
+el modelo no satura fuera de [40, 100] °C. La constante 0.7 es la de la norma
+para ν >= 2 cSt, que cubre los aceites de horquilla del catálogo.
+"""
+from typing import Optional, Union
+
+import numpy as np
+
+import bancos
+import catalogo
+import main
+
+ArrayLike = Union[float, np.ndarray]
+
+_C_WALTHER = 0.7
+_T_40 = 40.0 + 273.15
+_T_100 = 100.0 + 273.15
+
+
+def _loglog(nu: np.ndarray) -> np.ndarray:
+    return np.log10(np.log10(nu + _C_WALTHER))
+
+
+def _coeficientes(visc_40: np.ndarray, visc_100: np.ndarray):
+    """(A, B) de Walther que pasan por ν(40 °C) = visc_40 y ν(100 °C) = visc_100."""
+    y40, y100 = _loglog(visc_40), _loglog(visc_100)
+    B = (y40 - y100) / (np.log10(_T_100) - np.log10(_T_40))
+    return y40 + B * np.log10(_T_40), B
+
+
+def nu_walther(visc_40: ArrayLike, visc_100: ArrayLike, temp: ArrayLike) -> np.ndarray:
+    """
+    ν (mm²/s) según ASTM D341 elemento a elemento: visc_40, visc_100 y temp (°C)
+    se combinan por broadcasting (p. ej. una muestra de aceite y una
+    temperatura por elemento en un análisis de Monte Carlo). No valida.
+    """
+    A, B = _coeficientes(np.asarray(visc_40, dtype=np.float64), np.asarray(visc_100, dtype=np.float64))
+    return 10.0 ** (10.0 ** (A - B * np.log10(np.asarray(temp, dtype=np.float64) + 273.15))) - _C_WALTHER
+
+
+# ==========================================================
+#  CLASE: MODELO ASTM D341
+# ==========================================================
+class ModeloASTM:
+    """
+    Coeficientes ASTM D341 (A, B) y densidad de un conjunto de aceites.
+
+    Métodos:
+      - nu(temp): viscosidad cinemática (mm²/s) a temp (°C)
+      - eta(temp): viscosidad dinámica η = ρ·ν (Pa·s) a temp (°C)
+
+    Con temp escalar o 1-D (n_temps,) el resultado tiene forma
+    (n_aceites, n_temps); para otras combinaciones se aplica broadcasting
+    directo entre los arrays de aceites (n_aceites,) y temp.
+    """
+
+    def __init__(self, densidad: np.ndarray, visc_40: np.ndarray, visc_100: np.ndarray) -> None:
+        densidad = np.atleast_1d(np.asarray(densidad, dtype=np.float64))
+        visc_40 = np.atleast_1d(np.asarray(visc_40, dtype=np.float64))
+        visc_100 = np.atleast_1d(np.asarray(visc_100, dtype=np.float64))
+        main.validar_amortiguador(densidad, visc_40, visc_100)
+
+        self.A, self.B = _coeficientes(visc_40, visc_100)
+        self.rho = densidad * 1000.0  # g/cm³ → kg/m³
+
+    @classmethod
+    def desde_banco(cls, banco: bancos.BancoAmortiguadores) -> "ModeloASTM":
+        return cls(banco.densidad, banco.visc_40, banco.visc_100)
+
+    @classmethod
+    def desde_catalogo(cls, cat: catalogo.Catalogo) -> "ModeloASTM":
+        return cls(cat["densidad"], cat["Visc_40"], cat["Visc_100"])
+
+    def __len__(self) -> int:
+        return len(self.A)
+
+    def _forma(self, temp: ArrayLike):
+        t = np.asarray(temp, dtype=np.float64)
+        if t.ndim <= 1:
+            return np.atleast_1d(t)[None, :], self.A[:, None], self.B[:, None], self.rho[:, None]
+        return t, self.A, self.B, self.rho
+
+    # ----------------------------------------------------------
+    def nu(self, temp: ArrayLike) -> np.ndarray:
+        """Viscosidad cinemática (mm²/s) a temp (°C)."""
+        t, A, B, _ = self._forma(temp)
+        return 10.0 ** (10.0 ** (A - B * np.log10(t + 273.15))) - _C_WALTHER
+
+    def eta(self, temp: ArrayLike) -> np.ndarray:
+        """Viscosidad dinámica η = ρ·ν (Pa·s) a temp (°C)."""
+        _, _, _, rho = self._forma(temp)
+        return self.nu(temp) * 1e-6 * rho
+
+    # ----------------------------------------------------------
+    def tabla(self, t_min: float = -20.0, t_max: float = 150.0, paso: float = 0.5) -> "TablaViscosidad":
+        """Precalcula η en una malla uniforme de temperaturas (ver TablaViscosidad)."""
+        return TablaViscosidad(self, t_min, t_max, paso)
+
+
+# ==========================================================
+#  CLASE: TABLA DE VISCOSIDAD PRECALCULADA
+# ==========================================================
+class TablaViscosidad:
+    """
+    Tabla η[aceite, i] (Pa·s) del modelo ASTM en T_i = t_min + i·paso (°C).
+
+    Una consulta es una interpolación lineal sobre la malla uniforme: un
+    cálculo de índice, dos lecturas (gather) y una combinación lineal, sin
+    exponenciales ni llamadas por aceite. Fuera de [t_min, t_max] se satura
+    en el extremo de la tabla. Con paso = 0.5 °C el error frente al modelo
+    exacto es menor que 1e-3 relativo para los aceites del catálogo.
+    """
+
+    def __init__(self, modelo: ModeloASTM, t_min: float, t_max: float, paso: float) -> None:
+        if paso <= 0 or t_max <= t_min:
+            raise ValueError("Se necesita paso > 0 y t_max > t_min.")
+
+        n = int(np.ceil((t_max - t_min) / paso)) + 1
+        self.t_min = float(t_min)
+        self.paso = float(paso)
+        self.temps = self.t_min + np.arange(n) * self.paso
+        self.eta_tabla = np.ascontiguousarray(modelo.eta(self.temps))  # (n_aceites, n)
+
+    def __len__(self) -> int:
+        return self.eta_tabla.shape[0]
+
+    def eta(self, temp: ArrayLike, aceite: Optional[ArrayLike] = None) -> np.ndarray:
+        """
+        η (Pa·s) interpolada.
+
+        - aceite None: temp escalar o (n_temps,) → forma (n_aceites, n_temps).
+        - aceite dado (índices de aceite): se combina elemento a elemento con
+          temp por broadcasting, p. ej. un amortiguador por elemento con su
+          propia temperatura en cada paso de una simulación térmica.
+        """
+        if aceite is None:
+            filas = np.arange(len(self))[:, None]
+            temp = np.atleast_1d(np.asarray(temp, dtype=np.float64))[None, :]
+        else:
+            filas = np.asarray(aceite, dtype=np.intp)
+            temp = np.asarray(temp, dtype=np.float64)
+
+        u = np.clip((temp - self.t_min) / self.paso, 0.0, self.eta_tabla.shape[1] - 1)
+        i = np.minimum(u.astype(np.intp), self.eta_tabla.shape[1] - 2)
+        f = u - i
+        e0 = self.eta_tabla[filas, i]
+        e1 = self.eta_tabla[filas, i + 1]
+        return e0 + f * (e1 - e0)